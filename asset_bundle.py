@@ -0,0 +1,290 @@
+# Offline asset compiler and memory-mapped runtime bundle
+# (pre-rendered Tamil text, phrase audio and lookup tables in one file)
+import json
+import mmap
+import os
+import struct
+import tempfile
+import numpy as np
+
+DEFAULT_BUNDLE_PATH = os.path.join("assets", "cache", "assets.bundle")
+
+MAGIC = b"TGAB"
+BUNDLE_VERSION = 1
+# magic, format version, index length
+HEADER = struct.Struct("<4sII")
+ALIGN = 64
+
+# Display sizes the bundle pre-renders text for (other sizes rasterize on first use)
+DISPLAY_SIZES = [(800, 600), (1024, 768), (1280, 720), (1366, 768), (1920, 1080)]
+CAPTURE_SIZE = (800, 600)
+# Upper bound on word-bank entries baked into the bundle
+MAX_BUNDLE_WORDS = 500
+
+
+def _align(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def text_key(text, font_size):
+    return f"text:{int(font_size)}:{text}"
+
+
+def audio_key(phrase_key):
+    return f"audio:{phrase_key}"
+
+
+def table_key(name):
+    return f"table:{name}"
+
+
+class AssetBundle:
+    """Read-only view over a bundle file.
+
+    The file is one mmap; the JSON index maps keys to (offset, length, meta)
+    and every lookup returns a numpy view or bytes slice without copying the
+    rest of the file.
+    """
+
+    def __init__(self, buffer, path=None):
+        self.path = path
+        self._buffer = buffer
+        magic, version, index_len = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("not an asset bundle")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"asset bundle version {version}, expected {BUNDLE_VERSION}")
+        index = json.loads(bytes(buffer[HEADER.size:HEADER.size + index_len]).decode('utf-8'))
+        self.info = index.get("info", {})
+        self.entries = index["entries"]
+        self._data_offset = _align(HEADER.size + index_len)
+        self._font_ok = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _view(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, None
+        offset, length, meta = entry
+        start = self._data_offset + offset
+        return memoryview(self._buffer)[start:start + length], meta
+
+    def text_mask(self, text, font_size):
+        """(mask, (dx, dy)) for text at font_size, or None if not pre-rendered"""
+        if self._font_ok is None:
+            # Masks rendered with another font would not match live rendering
+            self._font_ok = self.info.get("font") == _font_id()
+        if not self._font_ok:
+            return None
+        data, meta = self._view(text_key(text, font_size))
+        if data is None:
+            return None
+        mask = np.frombuffer(data, dtype=np.uint8).reshape(meta["shape"])
+        return mask, tuple(meta["origin"])
+
+    def audio(self, phrase_key):
+        """WAV bytes for a phrase-cache key, or None"""
+        data, _ = self._view(audio_key(phrase_key))
+        return bytes(data) if data is not None else None
+
+    def table(self, name, fingerprint=None):
+        """A lookup table as a read-only array; None if missing or built from other inputs"""
+        data, meta = self._view(table_key(name))
+        if data is None or (fingerprint is not None and meta.get("fingerprint") != fingerprint):
+            return None
+        return np.frombuffer(data, dtype=meta["dtype"]).reshape(meta["shape"])
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+
+
+def _font_id():
+    """Font file the text masks were (or would be) rendered with"""
+    from utils import find_tamil_font_path
+    path = find_tamil_font_path()
+    if path is None:
+        return "default"
+    return f"{os.path.basename(path)}:{os.path.getsize(path)}"
+
+
+def open_bundle(path=DEFAULT_BUNDLE_PATH):
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return AssetBundle(buffer, path=path)
+    except Exception:
+        buffer.close()
+        raise
+
+
+_bundle = None
+_bundle_loaded = False
+
+
+def get_bundle():
+    """The process-wide bundle, mapped on first use (None if there is no usable bundle)"""
+    global _bundle, _bundle_loaded
+    if not _bundle_loaded:
+        _bundle_loaded = True
+        if os.path.exists(DEFAULT_BUNDLE_PATH):
+            try:
+                _bundle = open_bundle(DEFAULT_BUNDLE_PATH)
+                print(f"Asset bundle mapped: {len(_bundle)} entries")
+            except Exception as e:
+                print(f"Asset bundle ignored ({e}); rebuild with: python asset_bundle.py build")
+                _bundle = None
+    return _bundle
+
+
+class BundleWriter:
+    """Collects blobs in memory and writes index + aligned data in one go"""
+
+    def __init__(self):
+        self.entries = {}
+        self.chunks = []
+        self.size = 0
+
+    def add(self, key, data, meta=None):
+        if key in self.entries:
+            return
+        data = bytes(data)
+        pad = _align(self.size) - self.size
+        if pad:
+            self.chunks.append(b"\0" * pad)
+            self.size += pad
+        self.entries[key] = [self.size, len(data), meta or {}]
+        self.chunks.append(data)
+        self.size += len(data)
+
+    def add_array(self, key, array, **meta):
+        array = np.ascontiguousarray(array)
+        meta.update(shape=list(array.shape), dtype=array.dtype.str)
+        self.add(key, array.tobytes(), meta)
+
+    def write(self, path, info):
+        index = json.dumps({"info": info, "entries": self.entries},
+                           ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        header = HEADER.pack(MAGIC, BUNDLE_VERSION, len(index))
+        head = header + index
+        head += b"\0" * (_align(len(head)) - len(head))
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(head)
+            for chunk in self.chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+
+
+def _render_scales():
+    from utils import layout_scale, letterbox_geometry
+    scales = []
+    for dw, dh in DISPLAY_SIZES:
+        w, h, _, _ = letterbox_geometry(CAPTURE_SIZE[0], CAPTURE_SIZE[1], dw, dh)
+        scale = layout_scale(w, h)
+        if scale not in scales:
+            scales.append(scale)
+    return scales
+
+
+def static_text_specs(max_words=MAX_BUNDLE_WORDS):
+    """(text, font_size) for every static Tamil label the games draw, at each standard display scale"""
+    from phrases import TAMIL_NUMBERS, CORRECT_PREFIX, CONGRATULATIONS, load_tamil_words
+    from utils import px
+
+    def text_size(scale, s):
+        return max(12, int(scale * s * 30))  # same rule as utils.draw_text
+
+    words = load_tamil_words(limit=max_words)
+    specs = []
+    for s in _render_scales():
+        # Drag-drop target words (classic and board boxes)
+        for word in words:
+            for scale in (0.9, 0.8):
+                specs.append((word, text_size(scale, s)))
+        # Finger counting: target number and feedback
+        for number in TAMIL_NUMBERS:
+            specs.append((number, text_size(1.5, s)))
+        specs.append((CORRECT_PREFIX, text_size(1.2, s)))
+        specs.append((CONGRATULATIONS, text_size(1.2, s)))
+        # Mosquito game: number reference and kill messages
+        specs.append(("Tamil Numbers:", px(20, s)))
+        specs.append((" ".join(TAMIL_NUMBERS[:5]), px(16, s)))
+        specs.append((" ".join(TAMIL_NUMBERS[5:]), px(16, s)))
+        for n, number in enumerate(TAMIL_NUMBERS, start=1):
+            specs.append((f"{number} - Mosquito {n} Killed!", text_size(1.0, s)))
+    return list(dict.fromkeys(specs))
+
+
+def _render_audio(writer, phrases):
+    """Synthesize phrases with the TTS engine; returns (voice_id, count) or (None, 0)"""
+    from speech import create_backend
+    from phrase_cache import PhraseCache
+    backend = create_backend()
+    if backend.name == "null":
+        print("Skipping phrase audio: no speech engine")
+        return None, 0
+    count = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        # A cache that "plays" nothing, used only to render clips into tmp
+        cache = PhraseCache(tmp, voice_id=backend.voice_id, player=lambda path: None)
+        for text in phrases:
+            if cache.render(backend, text) or cache.has(text):
+                with open(cache.path_for(text), 'rb') as f:
+                    writer.add(audio_key(cache.key(text)), f.read(), {"text": text})
+                count += 1
+    backend.close()
+    return backend.voice_id, count
+
+
+def build_bundle(path=DEFAULT_BUNDLE_PATH, audio=True, max_words=MAX_BUNDLE_WORDS):
+    """Compile every static asset into one bundle file"""
+    from utils import render_text_mask
+    from color_lut import build_color_lut, lut_fingerprint
+    from phrases import feedback_phrases
+
+    writer = BundleWriter()
+    specs = static_text_specs(max_words)
+    for text, font_size in specs:
+        mask, origin = render_text_mask(text, font_size)
+        writer.add_array(text_key(text, font_size), mask, origin=list(origin))
+    print(f"Text sprites: {len(specs)}")
+
+    writer.add_array(table_key("color_lut"), build_color_lut(), fingerprint=lut_fingerprint())
+    print("Tables: color_lut")
+
+    voice_id, clips = _render_audio(writer, feedback_phrases()) if audio else (None, 0)
+    print(f"Phrase clips: {clips}")
+
+    info = {"font": _font_id(), "voice_id": voice_id, "display_sizes": DISPLAY_SIZES}
+    writer.write(path, info)
+    print(f"Wrote {path}: {len(writer.entries)} entries, {writer.size / 1e6:.1f} MB")
+    return path
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Build or inspect the runtime asset bundle")
+    parser.add_argument("command", choices=("build", "info"))
+    parser.add_argument("--output", default=DEFAULT_BUNDLE_PATH)
+    parser.add_argument("--no-audio", action="store_true", help="skip TTS phrase synthesis")
+    parser.add_argument("--max-words", type=int, default=MAX_BUNDLE_WORDS)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build_bundle(args.output, audio=not args.no_audio, max_words=args.max_words)
+    bundle = open_bundle(args.output)
+    kinds = {}
+    for key in bundle.entries:
+        kind = key.split(":", 1)[0]
+        kinds[kind] = kinds.get(kind, 0) + 1
+    print(f"{args.output}: {kinds}, info={bundle.info}")
+    bundle.close()
+
+
+if __name__ == "__main__":
+    main()
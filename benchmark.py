@@ -0,0 +1,315 @@
+# Headless end-to-end benchmark of every game (FPS, per-stage latency, peak RSS) with baseline comparison
+import json
+import math
+import os
+import platform
+import sys
+import time
+import cv2
+import numpy as np
+
+DEFAULT_GAMES = ("drag_drop", "finger_count", "color", "mosquito")
+DEFAULT_SIZES = ((800, 600), (1280, 720), (1920, 1080))
+CAPTURE_SIZE = (1280, 720)
+DEFAULT_FRAMES = 300
+WARMUP_FRAMES = 20
+# Game time advances by one camera frame per benchmark frame, so the workload doesn't depend on speed
+SIM_FPS = 30.0
+# Relative change in FPS or p95 frame time that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+
+STAGES = ("capture", "find_hands", "game_logic", "draw_ui", "compose", "present", "frame")
+
+# Open right hand, wrist at the origin, in units of the frame height (x, y)
+HAND_TEMPLATE = np.array([
+    (0.0, 0.0),
+    (-0.05, -0.03), (-0.09, -0.07), (-0.12, -0.11), (-0.14, -0.15),   # thumb
+    (-0.04, -0.18), (-0.045, -0.26), (-0.05, -0.31), (-0.05, -0.36),  # index
+    (0.0, -0.19), (0.0, -0.28), (0.0, -0.34), (0.0, -0.39),           # middle
+    (0.04, -0.18), (0.045, -0.26), (0.05, -0.31), (0.05, -0.35),      # ring
+    (0.08, -0.15), (0.09, -0.21), (0.095, -0.25), (0.1, -0.29),       # pinky
+], dtype=np.float64) * 0.6
+
+
+def scripted_hand(i, aspect):
+    """Normalized landmarks of a hand sweeping a Lissajous path, pinching one second in every two"""
+    t = i / SIM_FPS
+    cx = 0.5 + 0.32 * math.sin(t * 0.9)
+    cy = 0.62 + 0.22 * math.sin(t * 1.3 + 0.5)
+    pts = HAND_TEMPLATE.copy()
+    pts[:, 0] /= aspect
+    if int(t) % 2 == 1:
+        pts[4] = pts[8] + (0.004, 0.004)  # thumb tip onto index tip
+    pts += (cx, cy)
+    return [[float(x), float(y), 0.0] for x, y in pts]
+
+
+class SyntheticCapture:
+    """Deterministic textured frames with moving colour patches; no camera needed"""
+
+    def __init__(self, size=CAPTURE_SIZE, count=DEFAULT_FRAMES, seed=0, cycle=32):
+        w, h = size
+        rng = np.random.default_rng(seed)
+        base = cv2.resize(rng.integers(40, 200, (h // 40, w // 40, 3), dtype=np.uint8), (w, h),
+                          interpolation=cv2.INTER_LINEAR)
+        colours = [(0, 0, 230), (0, 200, 0), (230, 60, 0), (0, 230, 230), (0, 150, 255), (220, 0, 220)]
+        self.frames = []
+        for k in range(cycle):
+            frame = base.copy()
+            for j, colour in enumerate(colours):
+                x = int((j * w / 6 + k * 12) % (w - w // 8))
+                y = int(h * 0.3 + (j % 2) * h * 0.3)
+                cv2.rectangle(frame, (x, y), (x + w // 8, y + h // 6), colour, -1)
+            self.frames.append(frame)
+        self.count = count
+        self.index = 0
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        if self.index >= self.count:
+            return False, None
+        frame = self.frames[self.index % len(self.frames)].copy()
+        self.index += 1
+        return True, frame
+
+    def release(self):
+        pass
+
+
+class _ScriptedHands:
+    """Replaces MediaPipe Hands.process with the scripted hand (inference is not measured)"""
+
+    def __init__(self, aspect):
+        from input_trace import _Results
+        self._results = _Results
+        self.aspect = aspect
+        self.i = 0
+
+    def process(self, img_rgb):
+        hand = scripted_hand(self.i, self.aspect)
+        self.i += 1
+        return self._results([hand])
+
+    def close(self):
+        pass
+
+
+def _timed(fn, samples):
+    def wrapper(*args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - t0)
+    return wrapper
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far in MB (None if it can't be read)"""
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return round(peak / 1e6 if sys.platform == "darwin" else peak / 1e3, 1)
+    try:
+        # Windows: psutil only reports a peak there (peak_wset); its rss elsewhere is the current size
+        import psutil
+        peak = getattr(psutil.Process().memory_info(), "peak_wset", None)
+        return round(peak / 1e6, 1) if peak is not None else None
+    except ImportError:
+        return None
+
+
+def summarize(seconds):
+    ms = np.asarray(seconds, dtype=np.float64) * 1000.0
+    if not len(ms):
+        return {"mean": 0.0, "p95": 0.0, "p99": 0.0}
+    return {
+        "mean": round(float(ms.mean()), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "p99": round(float(np.percentile(ms, 99)), 3),
+    }
+
+
+def open_source(kind, path=None, frames=DEFAULT_FRAMES):
+    """(capture, scripted) for 'synthetic', 'video' or 'trace' input"""
+    if kind == "video":
+        return cv2.VideoCapture(path), False
+    if kind == "trace":
+        from input_trace import TraceReplayer
+        return TraceReplayer(path), False
+    return SyntheticCapture(count=frames + WARMUP_FRAMES), True
+
+
+def bench_game(name, size, source="synthetic", path=None, frames=DEFAULT_FRAMES, seed=1):
+    """Run one game headless at render size `size`; returns its result dict"""
+    from game_logic import GAMES
+    from game_clock import GameClock
+    from game_host import GameHost
+    from governor import QualityGovernor
+    from presenter import NullPresenter
+
+    # The peak is process-wide, so each game reports how far it raised it
+    rss_before = peak_rss_mb()
+    cap, scripted = open_source(source, path, frames)
+    frame_no = [0]
+    clock = GameClock(time_source=lambda: frame_no[0] / SIM_FPS)
+    if source == "trace":
+        game = cap.create_game()
+    else:
+        game = GAMES[name](seed=seed, clock=clock)
+    if scripted:
+        game.hand_tracker.hands = _ScriptedHands(CAPTURE_SIZE[0] / CAPTURE_SIZE[1])
+
+    presenter = NullPresenter(target_size=size)
+    # Unlimited budget: effects are never shed, so every run does the same work
+    host = GameHost(game, display_size_fn=lambda: size, governor=QualityGovernor(budget_ms=float('inf')))
+    samples = {stage: [] for stage in STAGES}
+    tracker = game.hand_tracker
+    tracker.find_hands = _timed(tracker.find_hands, samples["find_hands"])
+    game.handle_game_logic = _timed(game.handle_game_logic, samples["game_logic"])
+    game.draw_game_ui = _timed(game.draw_game_ui, samples["draw_ui"])
+
+    count = 0
+    start = None
+    while count < frames + WARMUP_FRAMES:
+        if count == WARMUP_FRAMES:
+            for values in samples.values():
+                values.clear()
+            start = time.perf_counter()
+        t0 = time.perf_counter()
+        ret, img = cap.read()
+        t1 = time.perf_counter()
+        if not ret or img is None:
+            break
+        frame = host.process_frame(img)
+        t2 = time.perf_counter()
+        presenter.present(frame)
+        t3 = time.perf_counter()
+        samples["capture"].append(t1 - t0)
+        samples["present"].append(t3 - t2)
+        samples["frame"].append(t3 - t0)
+        frame_no[0] += 1
+        count += 1
+    elapsed = time.perf_counter() - start if start is not None else 0.0
+    cap.release()
+    presenter.close()
+
+    measured = len(samples["frame"])
+    inner = ("find_hands", "game_logic", "draw_ui")
+    if measured and all(len(samples[s]) == measured for s in inner):
+        # Everything process_frame does besides the timed calls: smoothing, flip, resize, landmarks
+        process = np.asarray(samples["frame"]) - np.asarray(samples["capture"]) - np.asarray(samples["present"])
+        samples["compose"] = list(np.maximum(0.0, process - np.sum([samples[s] for s in inner], axis=0)))
+
+    peak_rss = peak_rss_mb()
+    return {
+        "game": name,
+        "size": f"{size[0]}x{size[1]}",
+        "frames": measured,
+        "fps": round(measured / elapsed, 1) if elapsed > 0 else 0.0,
+        "stages": {stage: summarize(samples[stage]) for stage in STAGES},
+        "peak_rss_mb": peak_rss,
+        "peak_rss_growth_mb": round(peak_rss - rss_before, 1) if peak_rss is not None else None,
+    }
+
+
+def run_suite(games=DEFAULT_GAMES, sizes=DEFAULT_SIZES, source="synthetic", path=None, frames=DEFAULT_FRAMES):
+    results = {}
+    for name in games:
+        for size in sizes:
+            result = bench_game(name, size, source, path, frames)
+            key = f"{name}@{result['size']}"
+            results[key] = result
+            stages = result["stages"]
+            print(f"{key:28s} {result['fps']:7.1f} FPS  frame p95 {stages['frame']['p95']:6.2f} ms  "
+                  f"hands {stages['find_hands']['mean']:5.2f}  logic {stages['game_logic']['mean']:5.2f}  "
+                  f"ui {stages['draw_ui']['mean']:5.2f} ms")
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "opencv": cv2.__version__,
+            "numpy": np.__version__,
+            "cpu_count": os.cpu_count(),
+            "source": source if path is None else f"{source}:{path}",
+            "inference": {"synthetic": "scripted", "trace": "replayed"}.get(source, "mediapipe"),
+            "frames": frames,
+            "warmup": WARMUP_FRAMES,
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Regressions of report against baseline: FPS down or frame p95 up by more than threshold"""
+    regressions = []
+    for key, result in report["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if base is None:
+            continue
+        fps_change = (result["fps"] - base["fps"]) / base["fps"] if base["fps"] else 0.0
+        base_p95 = base["stages"]["frame"]["p95"]
+        p95_change = (result["stages"]["frame"]["p95"] - base_p95) / base_p95 if base_p95 else 0.0
+        flag = fps_change < -threshold or p95_change > threshold
+        print(f"{key:28s} FPS {base['fps']:7.1f} -> {result['fps']:7.1f} ({fps_change:+.1%})  "
+              f"p95 {p95_change:+.1%}{'  REGRESSION' if flag else ''}")
+        if flag:
+            regressions.append({"key": key, "fps_change": round(fps_change, 4), "p95_change": round(p95_change, 4)})
+    return regressions
+
+
+def _parse_sizes(text):
+    return tuple(tuple(int(v) for v in part.lower().split("x")) for part in text.split(","))
+
+
+def main(argv=None):
+    import argparse
+    from game_logic import GAMES
+    parser = argparse.ArgumentParser(description="Headless benchmark of every game")
+    parser.add_argument("--games", default=",".join(DEFAULT_GAMES),
+                        help=f"comma-separated, from: {', '.join(sorted(GAMES))}")
+    parser.add_argument("--sizes", default=",".join(f"{w}x{h}" for w, h in DEFAULT_SIZES))
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--video", default=None, help="benchmark on a recorded video (runs real inference)")
+    parser.add_argument("--trace", default=None, help="benchmark on an input trace (its game only)")
+    parser.add_argument("--output", default=None, help="write the JSON report here")
+    parser.add_argument("--baseline", default=None, help="compare against this saved report")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    sizes = _parse_sizes(args.sizes)
+    if args.trace:
+        from input_trace import TraceReplayer
+        report = run_suite((TraceReplayer(args.trace).game_name,), sizes, "trace", args.trace, args.frames)
+    elif args.video:
+        report = run_suite(args.games.split(","), sizes, "video", args.video, args.frames)
+    else:
+        report = run_suite(args.games.split(","), sizes, frames=args.frames)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+        print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,498 @@
+# Hardware auto-tune: benchmark capture modes, inference settings and effect tiers; one profile per host and camera
+import hashlib
+import json
+import os
+import platform
+import threading
+import time
+import cv2
+import numpy as np
+from system_info import available_cpus
+
+DEBUG = False
+
+PROFILES_PATH = os.path.join("settings", "profiles.json")
+# Bump when the profile contents change meaning, so old profiles are re-tuned
+PROFILE_VERSION = 3
+
+# The settings the games ran with before calibration; used until a profile exists
+DEFAULT_TUNING = {
+    "capture": [800, 600, 60],
+    "processing_scale": 0.75,
+    "model_complexity": 0,
+    "frame_alpha": 0.8,
+    # Effect tier per game class: each game registers its own effects, so each is tuned on its own
+    "tiers": {},
+}
+
+# Candidates, best quality first in each list
+CAPTURE_MODES = ((1280, 720, 30), (960, 540, 30), (800, 600, 60), (640, 480, 30))
+PROCESSING_SCALES = (1.0, 0.75, 0.5)
+MODEL_COMPLEXITIES = (1, 0)
+TARGET_FPS = 30
+# A setting is sustained when its p95 frame time fits in this fraction of the frame budget
+HEADROOM = 0.85
+# A capture mode is usable when the camera delivers this fraction of the target frame rate
+CAMERA_FPS_RATIO = 0.9
+CALIBRATION_FRAMES = 45
+WARMUP_FRAMES = 8
+CALIBRATION_GAME = "drag_drop"
+# Larger than any governor's effect count: every effect shed
+SHED_ALL = 99
+# Fast cameras need less anti-shutter smoothing: consecutive frames are closer together.
+# frame_alpha is the current frame's weight in the blend, so less smoothing is a higher alpha.
+FAST_CAMERA_FPS = 50
+FAST_CAMERA_FRAME_ALPHA = 0.9
+
+
+def _mediapipe_version():
+    try:
+        from importlib.metadata import version
+        return version("mediapipe")
+    except Exception:
+        return None
+
+
+def machine_fingerprint():
+    """What the tuning depends on besides the camera; a change means re-tuning"""
+    return {
+        "host": platform.node(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": len(available_cpus()),
+        "opencv": cv2.__version__,
+        "mediapipe": _mediapipe_version(),
+    }
+
+
+def machine_id(fingerprint=None):
+    source = json.dumps(fingerprint or machine_fingerprint(), sort_keys=True)
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+
+
+def device_key(camera):
+    return f"{platform.node()}/camera{camera}"
+
+
+def delivered_size(cap):
+    return [int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))]
+
+
+def camera_identity(cap):
+    """What an opened camera reports about itself: {"delivered", "backend", "fps"} (None when it doesn't say)"""
+    identity = {"delivered": delivered_size(cap), "backend": None, "fps": None}
+    try:
+        identity["backend"] = cap.getBackendName()
+    except Exception:
+        pass
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    if fps and fps > 0:
+        identity["fps"] = round(float(fps), 1)
+    return identity
+
+
+def camera_matches(profile, cap):
+    """False if an opened camera no longer reports what the profile was tuned on (a different camera).
+    Fields either side leaves unknown are not compared; a profile tuned on a recording matches any camera."""
+    expected = profile.get("camera_identity")
+    if expected is None:
+        return True
+    actual = camera_identity(cap)
+    return all(expected.get(field) is None or actual[field] is None or expected[field] == actual[field]
+               for field in actual)
+
+
+class ProfileStore:
+    """Calibration profiles and the selected camera, in one JSON file.
+
+    Profiles are keyed by host and camera index. A profile made on other
+    hardware (different CPU count, OpenCV or MediaPipe version...) or by an
+    older version of this module reads as missing, so the caller re-tunes.
+    """
+
+    def __init__(self, path=PROFILES_PATH):
+        self.path = path
+        self.data = {"version": PROFILE_VERSION, "profiles": {}, "cameras": {}}
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == PROFILE_VERSION:
+                self.data.update(data)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable profiles file {path}: {e}")
+
+    def profile(self, camera):
+        """This host's profile for camera, or None if it is missing or stale"""
+        profile = self.data["profiles"].get(device_key(camera))
+        if profile is None or profile.get("machine_id") != machine_id():
+            return None
+        return profile
+
+    def save_profile(self, profile):
+        with self._lock:
+            self.data["profiles"][profile["key"]] = profile
+        self.save()
+
+    def forget(self, camera):
+        with self._lock:
+            self.data["profiles"].pop(device_key(camera), None)
+        self.save()
+
+    def selected_camera(self, default=0):
+        return self.data["cameras"].get(platform.node(), default)
+
+    def select_camera(self, camera):
+        with self._lock:
+            self.data["cameras"][platform.node()] = camera
+        self.save()
+
+    def save(self):
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            try:
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.data, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Could not save profiles to {self.path}: {e}")
+
+
+_store = None
+
+
+def get_profile_store():
+    """The process-wide profile store, read on first use"""
+    global _store
+    if _store is None:
+        _store = ProfileStore()
+    return _store
+
+
+_tuning = dict(DEFAULT_TUNING)
+
+
+def get_tuning():
+    """The settings HandTracker, GameHost and the menu use when not given explicit ones"""
+    return _tuning
+
+
+def tier_for(game, tuning=None):
+    """The calibrated effect tier for game (0, full effects, if its class was not tuned)"""
+    tuning = tuning if tuning is not None else _tuning
+    return tuning["tiers"].get(type(game).__name__, 0)
+
+
+def apply_profile(profile):
+    """Make profile's settings current (None goes back to the defaults)"""
+    global _tuning
+    tuning = dict(DEFAULT_TUNING)
+    if profile is not None:
+        tuning.update((k, profile[k]) for k in DEFAULT_TUNING if k in profile)
+    _tuning = tuning
+
+
+def load_profile(camera):
+    """Apply the stored profile for camera; returns it, or None if camera needs calibrating"""
+    profile = get_profile_store().profile(camera)
+    apply_profile(profile)
+    return profile
+
+
+class _RecordedFrames:
+    """Capture look-alike replaying a list of frames forever"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.index = 0
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        frame = self.frames[self.index % len(self.frames)].copy()
+        self.index += 1
+        return True, frame
+
+    def release(self):
+        pass
+
+
+def record_frames(cap, count=CALIBRATION_FRAMES, warmup=WARMUP_FRAMES):
+    """Read count frames after warmup; returns (frames, frames per second delivered)"""
+    for _ in range(warmup):
+        cap.read()
+    frames = []
+    reads = 0
+    start = time.perf_counter()
+    while len(frames) < count and reads < count * 2:
+        reads += 1
+        ret, img = cap.read()
+        if ret and img is not None:
+            frames.append(img)
+    seconds = time.perf_counter() - start
+    return frames, (len(frames) / seconds if seconds > 0 else 0.0)
+
+
+def measure_pipeline(frames, scale, complexity, tier, display_size=None, game_name=CALIBRATION_GAME):
+    """Frame times of one game on recorded frames with these settings.
+    Returns {"mean_ms", "p95_ms", "max_tier", "game_class"} (the class name of the game that ran)."""
+    from game_logic import GAMES
+    from game_host import GameHost
+    from governor import QualityGovernor
+    from presenter import NullPresenter
+
+    # The candidate goes to this game's tracker only; the current tuning stays as it is
+    game = GAMES[game_name](seed=1)
+    game.hand_tracker.configure(processing_scale=scale, model_complexity=complexity)
+    h, w = frames[0].shape[:2]
+    size = display_size or (w, h)
+    # The tier is fixed for the whole run; the governor must not change it
+    governor = QualityGovernor(budget_ms=float('inf'))
+    host = GameHost(game, display_size_fn=lambda: size, governor=governor)
+    governor.set_tier(tier)
+    presenter = NullPresenter(target_size=size)
+    cap = _RecordedFrames(frames)
+    times = []
+    try:
+        for i in range(WARMUP_FRAMES + len(frames)):
+            _, img = cap.read()
+            t0 = time.perf_counter()
+            presenter.present(host.process_frame(img))
+            if i >= WARMUP_FRAMES:
+                times.append((time.perf_counter() - t0) * 1000.0)
+    finally:
+        presenter.close()
+        close = getattr(game.hand_tracker.hands, "close", None)
+        if close is not None:
+            close()
+    return {"mean_ms": round(float(np.mean(times)), 2), "p95_ms": round(float(np.percentile(times, 95)), 2),
+            "max_tier": len(governor.effects), "game_class": type(game).__name__}
+
+
+def tiered_games():
+    """{game class name: GAMES name} for the games whose effect tiers are tuned.
+
+    Variants (lambdas over a class, e.g. drag_drop_board) share their class's tier.
+    """
+    from game_logic import GAMES
+    names = {}
+    for name, factory in GAMES.items():
+        if isinstance(factory, type):
+            names.setdefault(factory.__name__, name)
+    return names
+
+
+def frame_alpha_for(camera_fps):
+    """Anti-shutter blend weight of the current frame for a camera delivering camera_fps"""
+    if camera_fps >= FAST_CAMERA_FPS:
+        return FAST_CAMERA_FRAME_ALPHA
+    return DEFAULT_TUNING["frame_alpha"]
+
+
+def _open_live(opener, camera, width, height, fps):
+    if opener is not None:
+        return opener(camera, width, height, fps)
+    from game_host import open_capture
+    cap = open_capture(camera, width, height, fps)
+    return cap if cap.isOpened() else None
+
+
+def capture_candidates(camera=0, source=None, opener=None, log=print):
+    """Frames for every capture mode: [(mode, delivered size, camera fps, frames, camera identity)].
+
+    Live cameras are opened in each mode and timed; a recorded source (video
+    file or any capture look-alike) is read once and resized to each mode,
+    and its frame rate is taken as the mode's (its identity is None).
+    """
+    modes = []
+    if source is not None:
+        cap = source if hasattr(source, 'read') else cv2.VideoCapture(source)
+        recorded, _ = record_frames(cap, warmup=0)
+        cap.release()
+        if not recorded:
+            raise RuntimeError(f"no frames in calibration source {source!r}")
+        for width, height, fps in CAPTURE_MODES:
+            frames = [cv2.resize(f, (width, height), interpolation=cv2.INTER_AREA) for f in recorded]
+            modes.append(((width, height, fps), [width, height], float(fps), frames, None))
+        return modes
+
+    seen = set()
+    for width, height, fps in CAPTURE_MODES:
+        cap = _open_live(opener, camera, width, height, fps)
+        if cap is None:
+            log(f"  {width}x{height}@{fps}: camera did not open")
+            continue
+        try:
+            identity = camera_identity(cap)
+            frames, camera_fps = record_frames(cap)
+        finally:
+            cap.release()
+        if not frames:
+            continue
+        delivered = [frames[0].shape[1], frames[0].shape[0]]
+        log(f"  {width}x{height}@{fps}: camera delivers {delivered[0]}x{delivered[1]} at {camera_fps:.1f} FPS")
+        # A camera that ignores the requested mode gives the same frames again
+        if tuple(delivered) in seen:
+            continue
+        seen.add(tuple(delivered))
+        modes.append(((width, height, fps), delivered, camera_fps, frames, identity))
+    return modes
+
+
+def calibrate(camera=0, source=None, opener=None, display_size=None, game_name=CALIBRATION_GAME,
+              target_fps=TARGET_FPS, log=print):
+    """Benchmark this machine and camera and return the best sustained profile.
+
+    Candidates (capture mode x inference scale x model complexity) are tried
+    on game_name from the highest quality down: most inference pixels first,
+    then the heavier model, then the larger capture. Each is measured at full
+    effects and, if that runs over budget, with effects shed tier by tier. The
+    first candidate that sustains the budget wins. The cheapest candidate is
+    measured first with every effect shed: if even that misses the budget,
+    it is the best this machine can do and nothing else is tried.
+
+    The winning candidate is then run on every other game to find that
+    game's own tier, since each game registers a different set of effects.
+    """
+    log(f"Calibrating camera {camera} for {target_fps} FPS...")
+    start = time.perf_counter()
+    modes = capture_candidates(camera, source, opener, log)
+    if not modes:
+        raise RuntimeError(f"camera {camera} delivered no frames")
+
+    candidates = []
+    for mode, delivered, camera_fps, frames, _ in modes:
+        if camera_fps < target_fps * CAMERA_FPS_RATIO and source is None:
+            log(f"  skipping {mode[0]}x{mode[1]}: camera too slow ({camera_fps:.1f} FPS)")
+            continue
+        for scale in PROCESSING_SCALES:
+            for complexity in MODEL_COMPLEXITIES:
+                pixels = int(delivered[0] * scale) * int(delivered[1] * scale)
+                candidates.append(((pixels, complexity, delivered[0] * delivered[1]),
+                                   mode, delivered, camera_fps, frames, scale, complexity))
+    if not candidates:
+        # Every mode is slower than the target; take the fastest camera mode anyway
+        best = max(modes, key=lambda m: m[2])
+        candidates = [((0, c, 0), best[0], best[1], best[2], best[3], s, c)
+                      for s in PROCESSING_SCALES for c in MODEL_COMPLEXITIES]
+    candidates.sort(key=lambda c: c[0], reverse=True)
+
+    budget_ms = 1000.0 / target_fps
+    limit_ms = budget_ms * HEADROOM
+
+    def run(candidate, tier, name=game_name):
+        _, mode, _, _, frames, scale, complexity = candidate
+        result = measure_pipeline(frames, scale, complexity, tier, display_size, name)
+        log(f"  {name} {mode[0]}x{mode[1]} scale {scale} model {complexity} tier {min(tier, result['max_tier'])}: "
+            f"p95 {result['p95_ms']:.1f} ms (mean {result['mean_ms']:.1f})")
+        return result
+
+    def lowest_tier(candidate, name, full=None, shed_all=None):
+        """(tier, result) with the fewest effects shed that sustains the budget, or None"""
+        full = full or run(candidate, 0, name)
+        if full["p95_ms"] <= limit_ms:
+            return 0, full
+        shed_all = shed_all or run(candidate, SHED_ALL, name)
+        if shed_all["p95_ms"] > limit_ms:
+            return None
+        for tier in range(1, shed_all["max_tier"]):
+            partial = run(candidate, tier, name)
+            if partial["p95_ms"] <= limit_ms:
+                return tier, partial
+        return shed_all["max_tier"], shed_all
+
+    # If the cheapest candidate misses the budget with every effect shed, so will the rest
+    cheapest = candidates[-1]
+    floor = run(cheapest, SHED_ALL)
+    chosen, (tier, result) = cheapest, (floor["max_tier"], floor)
+    sustained = floor["p95_ms"] <= limit_ms
+    if sustained:
+        for candidate in candidates:
+            found = lowest_tier(candidate, game_name, shed_all=floor if candidate is cheapest else None)
+            if found is not None:
+                chosen, (tier, result) = candidate, found
+                break
+
+    tiers = {}
+    for class_name, name in tiered_games().items():
+        if name == game_name:
+            continue
+        found = lowest_tier(chosen, name) if sustained else None
+        if found is None:
+            # Best effort: this game cannot hold the budget on this machine, so shed everything
+            found = (run(chosen, SHED_ALL, name)["max_tier"], None)
+        tiers[class_name] = found[0]
+    # A variant (e.g. drag_drop_board) tunes its class's tier
+    tiers[result["game_class"]] = tier
+
+    _, mode, delivered, camera_fps, _, scale, complexity = chosen
+    fingerprint = machine_fingerprint()
+    profile = {
+        "key": device_key(camera),
+        "camera": camera,
+        "machine": fingerprint,
+        "machine_id": machine_id(fingerprint),
+        "capture": list(mode),
+        "camera_identity": next(m[4] for m in modes if m[0] == mode),
+        "camera_fps": round(camera_fps, 1),
+        "processing_scale": scale,
+        "model_complexity": complexity,
+        "frame_alpha": DEFAULT_TUNING["frame_alpha"] if source is not None else frame_alpha_for(camera_fps),
+        "tiers": tiers,
+        "sustained": sustained,
+        "measured": dict(result, game=game_name, budget_ms=round(budget_ms, 2), target_fps=target_fps),
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "seconds": round(time.perf_counter() - start, 1),
+    }
+    tier_list = ", ".join(f"{name} {t}" for name, t in tiers.items())
+    log(f"Calibrated in {profile['seconds']}s: {mode[0]}x{mode[1]}@{mode[2]}, scale {scale}, model {complexity}, "
+        f"tiers {tier_list}" + ("" if sustained else f" (best effort: {target_fps} FPS not sustained)"))
+    return profile
+
+
+def calibrate_and_save(camera=0, **kwargs):
+    """Calibrate, store the profile and make it current"""
+    profile = calibrate(camera, **kwargs)
+    get_profile_store().save_profile(profile)
+    apply_profile(profile)
+    return profile
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Tune capture mode, inference and effects for this machine and camera")
+    parser.add_argument("--camera", type=int, default=None, help="camera index (default: the selected camera)")
+    parser.add_argument("--video", default=None, help="calibrate on a recorded video instead of live frames")
+    parser.add_argument("--synthetic", action="store_true", help="calibrate on synthetic frames (no camera)")
+    parser.add_argument("--display", default=None, help="render size WxH (default: the capture size)")
+    parser.add_argument("--game", default=CALIBRATION_GAME)
+    parser.add_argument("--fps", type=int, default=TARGET_FPS, help="frame rate to sustain")
+    parser.add_argument("--show", action="store_true", help="print the stored profile and exit")
+    args = parser.parse_args(argv)
+
+    store = get_profile_store()
+    camera = args.camera if args.camera is not None else store.selected_camera()
+    if args.show:
+        profile = store.profile(camera)
+        print(json.dumps(profile, indent=2) if profile else f"No current profile for camera {camera}")
+        return 0
+    source = args.video
+    if args.synthetic:
+        from benchmark import SyntheticCapture
+        source = SyntheticCapture(count=CALIBRATION_FRAMES)
+    display = tuple(int(v) for v in args.display.lower().split("x")) if args.display else None
+    profile = calibrate_and_save(camera, source=source, display_size=display, game_name=args.game, target_fps=args.fps)
+    print(f"Saved profile {profile['key']} to {store.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# Colour classes for the colour game and a quantized BGR -> class lookup table
+import hashlib
+import json
+import cv2
+import numpy as np
+
+# HSV ranges for common colors (H:0-179, S/V:0-255)
+# Each entry has one or more ranges to cover hue wrap (e.g., red)
+COLOR_RANGES = [
+    {"name": "RED", "ranges": [((0, 120, 80), (10, 255, 255)), ((160, 120, 80), (179, 255, 255))], "bgr": (0, 0, 255)},
+    {"name": "GREEN", "ranges": [((35, 80, 80), (85, 255, 255))], "bgr": (0, 200, 0)},
+    {"name": "BLUE", "ranges": [((90, 80, 80), (130, 255, 255))], "bgr": (255, 0, 0)},
+    {"name": "YELLOW", "ranges": [((20, 120, 120), (35, 255, 255))], "bgr": (0, 255, 255)},
+    {"name": "ORANGE", "ranges": [((10, 120, 120), (20, 255, 255))], "bgr": (0, 165, 255)},
+    {"name": "PURPLE", "ranges": [((130, 60, 60), (160, 255, 255))], "bgr": (255, 0, 255)},
+]
+
+# Bits kept per BGR channel (5 -> 32x32x32 table)
+LUT_BITS = 5
+NO_CLASS = 255
+
+
+def build_color_lut(color_ranges=COLOR_RANGES, bits=LUT_BITS):
+    """uint8 table [b >> shift, g >> shift, r >> shift] -> index into color_ranges (NO_CLASS if none).
+    Each bin is classified by the HSV of its centre; earlier entries win overlaps."""
+    n = 1 << bits
+    shift = 8 - bits
+    centres = (np.arange(n, dtype=np.uint16) << shift) + (1 << shift >> 1)
+    b, g, r = np.meshgrid(centres, centres, centres, indexing='ij')
+    bgr = np.stack([b, g, r], axis=-1).astype(np.uint8).reshape(-1, 1, 3)
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+
+    lut = np.full(n * n * n, NO_CLASS, dtype=np.uint8)
+    for idx in reversed(range(len(color_ranges))):
+        hit = np.zeros(n * n * n, dtype=bool)
+        for low, high in color_ranges[idx]["ranges"]:
+            hit |= cv2.inRange(hsv, low, high).reshape(-1) > 0
+        lut[hit] = idx
+    return lut.reshape(n, n, n)
+
+
+def lut_fingerprint(color_ranges=COLOR_RANGES, bits=LUT_BITS):
+    """Identifies the inputs a LUT was built from, so a stale bundled table is ignored"""
+    source = json.dumps([color_ranges, bits], sort_keys=True)
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+
+
+_lut = None
+
+
+def get_color_lut():
+    """The colour LUT from the asset bundle, or built once per process"""
+    global _lut
+    if _lut is None:
+        from asset_bundle import get_bundle
+        bundle = get_bundle()
+        table = bundle.table("color_lut", lut_fingerprint()) if bundle is not None else None
+        _lut = table if table is not None else build_color_lut()
+    return _lut
+
+
+def classify_bgr(lut, bgr, bits=LUT_BITS):
+    """Colour class index of one BGR value"""
+    shift = 8 - bits
+    return int(lut[int(bgr[0]) >> shift, int(bgr[1]) >> shift, int(bgr[2]) >> shift])
+
+
+def classify_image(lut, img, bits=LUT_BITS):
+    """Colour class index of every pixel of a BGR image (one gather into the flattened table)"""
+    shift = 8 - bits
+    q = (img >> shift).astype(np.intp)
+    flat_idx = (q[..., 0] << (2 * bits)) | (q[..., 1] << bits) | q[..., 2]
+    return lut.reshape(-1)[flat_idx]
@@ -0,0 +1,89 @@
+# Single-slot frame hand-off between a producer thread and a consumer
+import threading
+import numpy as np
+
+# Owned buffers for publish_copy: one in the slot, one held by the consumer, one being filled
+OWNED_BUFFERS = 3
+
+
+class FrameMailbox:
+    """Latest-wins mailbox holding at most one frame.
+
+    Producers (game threads) publish without ever blocking on the consumer;
+    a frame that is replaced before the consumer takes it counts as dropped.
+
+    publish() hands over the array itself, so the producer must not write to
+    it again. publish_copy() copies into one of the mailbox's own buffers
+    instead, never one that is in the slot or that the consumer has taken
+    and not yet release()d; it is for producers that reuse their frame
+    buffers (FramePool), and expects a single producer thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self._in_use = None
+        self._buffers = []
+        self.published = 0
+        self.taken = 0
+        self.dropped = 0
+
+    def publish(self, frame):
+        with self._lock:
+            if self._frame is not None:
+                self.dropped += 1
+            self._frame = frame
+            self.published += 1
+
+    def publish_copy(self, frame):
+        """Publish a copy of frame in a mailbox-owned buffer; frame may be reused right away"""
+        with self._lock:
+            if self._buffers and (self._buffers[0].shape != frame.shape or self._buffers[0].dtype != frame.dtype):
+                self._buffers = []
+            if len(self._buffers) < OWNED_BUFFERS:
+                buf = np.empty_like(frame)
+                self._buffers.append(buf)
+            else:
+                buf = next(b for b in self._buffers if b is not self._frame and b is not self._in_use)
+        np.copyto(buf, frame)
+        self.publish(buf)
+
+    def take(self):
+        """Return the newest frame and empty the slot (None if nothing new).
+        The frame stays the consumer's until release() or put_back()."""
+        with self._lock:
+            frame = self._frame
+            self._frame = None
+            if frame is not None:
+                self.taken += 1
+                self._in_use = frame
+            return frame
+
+    def release(self, frame):
+        """The consumer is done with a taken frame; its buffer may be reused"""
+        with self._lock:
+            if self._in_use is frame:
+                self._in_use = None
+
+    def put_back(self, frame):
+        """Return an untaken frame to the slot unless a newer one arrived meanwhile"""
+        with self._lock:
+            if self._in_use is frame:
+                self._in_use = None
+            if self._frame is None:
+                self._frame = frame
+                self.taken -= 1
+            else:
+                self.dropped += 1
+
+    def clear(self):
+        with self._lock:
+            self._frame = None
+            self._in_use = None
+            self.published = 0
+            self.taken = 0
+            self.dropped = 0
+
+    def stats(self):
+        with self._lock:
+            return {"published": self.published, "presented": self.taken, "dropped": self.dropped}
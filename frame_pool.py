@@ -0,0 +1,95 @@
+# Reusable frame buffers so the steady-state pipeline allocates no full-size arrays per frame
+import numpy as np
+
+# Buffers per key: one being drawn by the game thread, one waiting in a presenter
+# mailbox and one being converted by the Tk thread
+DEFAULT_DEPTH = 3
+
+
+class FramePool:
+    """Preallocated arrays keyed by (tag, shape, dtype), handed out in rotation.
+
+    get(tag, shape) cycles through `depth` buffers for that key, creating
+    them on first use only. A buffer stays untouched until its key has been
+    requested `depth` more times, so a finished frame (depth 3) survives a
+    synchronous presenter while the next frames are rendered; scratch buffers
+    that are consumed on the spot use depth=1. Rotation cannot tell whether
+    another thread still reads a buffer, so a presenter that hands frames to
+    another thread copies them first (TkPresenter, FrameMailbox.publish_copy).
+    Contents are not cleared: callers overwrite the whole buffer (dst= of an
+    OpenCV call, np.copyto).
+
+    One pool belongs to one frame pipeline (a GameHost with its game and
+    tracker) and is used from that pipeline's thread only.
+
+    begin_frame() starts a new frame's allocation count; in steady state
+    last_frame_allocations is 0.
+    """
+
+    def __init__(self, depth=DEFAULT_DEPTH):
+        self.depth = depth
+        self._slots = {}
+        self._filled = {}
+        self.allocations = 0
+        self.frame_allocations = 0
+        self.last_frame_allocations = 0
+        self.frames = 0
+        self.bytes = 0
+
+    def _allocate(self, shape, dtype):
+        buf = np.empty(shape, dtype)
+        self.allocations += 1
+        self.frame_allocations += 1
+        self.bytes += buf.nbytes
+        return buf
+
+    def get(self, tag, shape, dtype=np.uint8, depth=None):
+        """A buffer of this shape/dtype for `tag`, valid until the key comes round again"""
+        key = (tag, tuple(shape), np.dtype(dtype))
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = [[], 0, depth or self.depth]
+        buffers, index, slot_depth = slot
+        if index < len(buffers):
+            buf = buffers[index]
+        else:
+            buf = self._allocate(key[1], key[2])
+            buffers.append(buf)
+        slot[1] = (index + 1) % slot_depth
+        return buf
+
+    def copy(self, tag, src, depth=None):
+        """Pooled equivalent of src.copy()"""
+        buf = self.get(tag, src.shape, src.dtype, depth)
+        np.copyto(buf, src)
+        return buf
+
+    def filled(self, tag, shape, value, dtype=np.uint8):
+        """Read-only array of shape filled with value (e.g. a solid panel colour to blend with)"""
+        key = (tag, tuple(shape), np.dtype(dtype))
+        entry = self._filled.get(key)
+        if entry is None:
+            entry = self._filled[key] = [self._allocate(key[1], key[2]), None]
+        if entry[1] != value:
+            entry[0][:] = value
+            entry[1] = value
+        return entry[0]
+
+    def begin_frame(self):
+        self.last_frame_allocations = self.frame_allocations
+        self.frame_allocations = 0
+        self.frames += 1
+
+    def clear(self):
+        """Drop every buffer (e.g. after the render size changed)"""
+        self._slots.clear()
+        self._filled.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            "buffers": sum(len(slot[0]) for slot in self._slots.values()) + len(self._filled),
+            "megabytes": round(self.bytes / (1024 * 1024), 1),
+            "allocations": self.allocations,
+            "last_frame_allocations": self.last_frame_allocations,
+        }
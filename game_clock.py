@@ -0,0 +1,79 @@
+# Frame-rate independent game time: a shared clock, fixed simulation steps and hold timers
+import time
+
+# Simulation rate the per-step game tuning (e.g. mosquito speed) was made for
+SIM_HZ = 30
+FIXED_STEP = 1.0 / SIM_HZ
+# Longest gap between frames counted as game time (a stall doesn't fast-forward the game)
+MAX_FRAME_DT = 0.25
+
+
+class GameClock:
+    """Game time advanced once per rendered frame.
+
+    tick() measures the time since the previous frame and converts it into
+    whole fixed simulation steps (self.steps), carrying the remainder to the
+    next frame. Logic that used to advance "once per frame" runs once per
+    step instead, so it moves at the same speed at 15, 30 or 60 FPS, and
+    timers read now() instead of counting frames.
+
+    time_source is any callable returning seconds (time.perf_counter by default).
+    """
+
+    def __init__(self, time_source=time.perf_counter, step=FIXED_STEP, max_frame_dt=MAX_FRAME_DT):
+        self.time_source = time_source
+        self.step = step
+        self.max_frame_dt = max_frame_dt
+        self.last = None
+        self.time = 0.0
+        self.dt = 0.0
+        self.steps = 0
+        self.accumulator = 0.0
+        self.frames = 0
+
+    def tick(self):
+        """Advance to the current frame; returns the frame's dt in seconds"""
+        t = self.time_source()
+        dt = 0.0 if self.last is None else min(max(0.0, t - self.last), self.max_frame_dt)
+        self.last = t
+        self.dt = dt
+        self.time += dt
+        self.accumulator += dt
+        self.steps = int(self.accumulator / self.step)
+        self.accumulator -= self.steps * self.step
+        self.frames += 1
+        return dt
+
+    def now(self):
+        """Game time in seconds since the first tick"""
+        return self.time
+
+
+class HoldTimer:
+    """Progress toward holding a condition for a number of seconds.
+
+    hold(dt) fills it while the condition is true; release(dt, rate) drains
+    it rate times faster than real time while it isn't, so a brief glitch
+    costs a little progress rather than all of it.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.held = 0.0
+
+    def hold(self, dt):
+        self.held = min(self.seconds, self.held + dt)
+
+    def release(self, dt, rate=1.0):
+        self.held = max(0.0, self.held - dt * rate)
+
+    def reset(self):
+        self.held = 0.0
+
+    @property
+    def progress(self):
+        return self.held / self.seconds if self.seconds > 0 else 1.0
+
+    @property
+    def done(self):
+        return self.held >= self.seconds
@@ -0,0 +1,308 @@
+# Per-frame pipeline shared by every game: capture -> inference -> compositing -> presenter
+import time
+import cv2
+from utils import letterbox_geometry
+from governor import QualityGovernor, PRIORITY_FRAME_BLEND, PRIORITY_INPUT_BLUR, PRIORITY_LANDMARKS
+from stage_timers import TIMERS, export_trace
+from frame_pool import FramePool
+from telemetry import get_telemetry, SessionStats, capture_config, game_result
+from calibration import get_tuning, load_profile, tier_for
+
+# Consecutive failed reads before a capture is treated as finished (end of a video file)
+MAX_FAILED_READS = 100
+
+QUIT_KEYS = (ord('q'), ord('Q'), 27)
+# Performance HUD toggle and Chrome trace export (OpenCV window / key-polling presenters)
+HUD_KEYS = (ord('p'), ord('P'))
+TRACE_KEYS = (ord('t'), ord('T'))
+
+
+class GameHost:
+    """Runs one game's frame pipeline with three separate resolutions.
+
+    - capture: whatever the camera delivers (smoothing and mirroring happen here)
+    - inference: HandTracker.processing_scale of the capture frame
+    - render: the display size; the camera image is scaled once (cheap
+      INTER_LINEAR) and the game UI is drawn directly at this size, so text
+      stays sharp and the presenter has nothing left to resize.
+
+    Hand landmarks are normalized, so games reading them from the render
+    frame get render-space coordinates automatically.
+
+    display_size_fn returns the current (width, height) of the display or
+    None if unknown. The render size is fixed when the game is set up; later
+    window resizes are handled by the presenter scaling the finished frame.
+
+    The host and the game register their purely cosmetic effects with a
+    QualityGovernor, which turns them off one by one when frames run slow.
+
+    Full-size intermediate frames come from a FramePool shared with the
+    game and its tracker, so once the first frames have sized the pool no
+    per-frame arrays are allocated (see pool.last_frame_allocations).
+    """
+
+    def __init__(self, game, display_size_fn=None, frame_alpha=None, mirror=True, draw_landmarks=True, governor=None,
+                 pool=None):
+        # Unset settings come from this machine's calibration profile (calibration.py)
+        tuning = get_tuning()
+        self.game = game
+        self._init_pipeline(display_size_fn, frame_alpha, mirror, draw_landmarks, governor, pool, tuning)
+        game.frame_pool = self.pool
+        game.hand_tracker.pool = self.pool
+
+        self.governor.register("input_blur", PRIORITY_INPUT_BLUR, "denoise blur before hand tracking")
+        if draw_landmarks:
+            self.governor.register("landmarks", PRIORITY_LANDMARKS, "hand skeleton overlay")
+        if hasattr(game, "register_effects"):
+            game.register_effects(self.governor)
+        if governor is None and tier_for(game, tuning):
+            self.governor.set_tier(tier_for(game, tuning))
+
+    def _init_pipeline(self, display_size_fn, frame_alpha, mirror, draw_landmarks, governor, pool, tuning):
+        """Settings and frame state every host has (SplitScreenHost shares it too)"""
+        self.display_size_fn = display_size_fn
+        self.frame_alpha = frame_alpha if frame_alpha is not None else tuning["frame_alpha"]
+        self.mirror = mirror
+        self.draw_landmarks = draw_landmarks
+        self.render_size = None
+        self.prev_frame = None
+        self.frame_count = 0
+        self.last_inference_ms = None
+        self.show_hud = True
+        self.pool = pool if pool is not None else FramePool()
+        self.governor = governor if governor is not None else QualityGovernor()
+        self.governor.register("frame_blend", PRIORITY_FRAME_BLEND, "anti-shutter frame smoothing")
+
+    def _choose_render_size(self, cap_w, cap_h):
+        display = self.display_size_fn() if self.display_size_fn else None
+        if not display or display[0] <= 1 or display[1] <= 1:
+            return cap_w, cap_h
+        new_w, new_h, _, _ = letterbox_geometry(cap_w, cap_h, display[0], display[1])
+        return new_w, new_h
+
+    def process_frame(self, img):
+        """Turn one captured frame into a finished frame at render size"""
+        quality = self.governor
+        pool = self.pool
+        pool.begin_frame()
+        # Anti-shutter frame smoothing
+        if self.frame_alpha < 1.0 and self.prev_frame is not None and self.prev_frame.shape == img.shape \
+                and quality.enabled("frame_blend"):
+            # Two buffers: this frame's blend is written while the previous one is read
+            img = cv2.addWeighted(img, self.frame_alpha, self.prev_frame, 1 - self.frame_alpha, 0,
+                                  dst=pool.get("blend", img.shape, depth=2))
+        self.prev_frame = img
+
+        # Simple mirror flip
+        if self.mirror:
+            img = cv2.flip(img, 1, dst=pool.get("mirror", img.shape))
+        cap_h, cap_w = img.shape[:2]
+
+        # Inference at the tracker's own resolution
+        tracker = self.game.hand_tracker
+        tracker.denoise = quality.enabled("input_blur")
+        inference_start = time.perf_counter()
+        with TIMERS.stage("find_hands"):
+            tracker.find_hands(img, draw=False)
+        self.last_inference_ms = (time.perf_counter() - inference_start) * 1000.0
+
+        # Scale the camera image to the render size once, then composite at that size
+        if self.render_size is None:
+            self.render_size = self._choose_render_size(cap_w, cap_h)
+            self.game.setup_game(*self.render_size)
+        if self.render_size != (cap_w, cap_h):
+            w, h = self.render_size
+            frame = cv2.resize(img, self.render_size, dst=pool.get("render", (h, w, 3)),
+                               interpolation=cv2.INTER_LINEAR)
+        elif img is self.prev_frame:
+            frame = pool.copy("render", img)  # keep the smoothing reference free of UI drawing
+        else:
+            frame = img
+
+        if self.draw_landmarks and quality.enabled("landmarks"):
+            tracker.draw_hands(frame)
+        with TIMERS.stage("game_logic"):
+            self.game.handle_game_logic(frame)
+        with TIMERS.stage("draw_ui"):
+            self.game.draw_game_ui(frame)
+        if TIMERS.hud and self.show_hud:
+            TIMERS.draw_hud(frame)
+        self.frame_count += 1
+        return frame
+
+    def run(self, capture, presenter, keep_running=None, frame_delay=0.0, linger=0.0, max_frames=None):
+        """Pump frames from capture through the pipeline into presenter.
+
+        Stops when the game completes (after showing the last frame for
+        linger seconds), the presenter is closed, a quit key is pressed,
+        keep_running() returns False, max_frames is reached or the capture
+        stops delivering. Returns a small stats dict.
+
+        Each frame's processing + present time is fed to the governor, and
+        the stages are timed for the performance HUD when timing is on. A
+        session summary (FPS distribution, dropped frames, inference latency,
+        capture settings, game result) goes to telemetry at the end.
+        """
+        if self.display_size_fn is None:
+            self.display_size_fn = lambda: presenter.target_size
+        telemetry = get_telemetry()
+        session = SessionStats()
+        failed_reads = 0
+        # OpenCV captures can decode into a pooled buffer once the frame size is known
+        reuse_buffers = isinstance(capture, cv2.VideoCapture)
+        capture_shape = None
+        start = time.perf_counter()
+        start_frames = self.frame_count
+        last_frame_done = None
+        while keep_running is None or keep_running():
+            if presenter.closed:
+                break
+            if max_frames is not None and self.frame_count - start_frames >= max_frames:
+                break
+            with TIMERS.stage("capture"):
+                if reuse_buffers and capture_shape is not None:
+                    ret, img = capture.read(self.pool.get("capture", capture_shape))
+                else:
+                    ret, img = capture.read()
+            if not ret or img is None:
+                failed_reads += 1
+                session.failed_reads += 1
+                if failed_reads >= MAX_FAILED_READS:
+                    print("Capture stopped delivering frames")
+                    break
+                continue
+            failed_reads = 0
+            capture_shape = img.shape
+
+            # Smoothing, hand tracking and game drawing at display resolution
+            frame_start = time.perf_counter()
+            try:
+                frame = self.process_frame(img)
+            except Exception as e:
+                telemetry.error("process_frame", e)
+                continue
+            with TIMERS.stage("present"):
+                presenter.present(frame)
+            frame_done = time.perf_counter()
+            frame_ms = (frame_done - frame_start) * 1000.0
+            self.governor.observe(frame_ms)
+            # Frame to frame, capture wait included: what the player sees as frame rate
+            interval_ms = (frame_done - last_frame_done) * 1000.0 if last_frame_done is not None else None
+            last_frame_done = frame_done
+            session.add_frame(frame_ms, self.last_inference_ms, interval_ms)
+            TIMERS.frame_done()
+
+            key = presenter.poll_key()
+            if key in QUIT_KEYS:
+                break
+            if key in HUD_KEYS:
+                TIMERS.toggle_hud()
+            elif key in TRACE_KEYS:
+                export_trace()
+            if self.game.game_complete:
+                print("Game completed!")
+                if linger:
+                    presenter.wait(linger)
+                break
+            if frame_delay:
+                time.sleep(frame_delay)
+
+        seconds = time.perf_counter() - start
+        frames = self.frame_count - start_frames
+        quality = self.governor.status()
+        if quality["changes"]:
+            print(f"Quality tier at exit: {quality['tier']}/{quality['max_tier']} (shed: {', '.join(quality['shed']) or 'none'})")
+        summary = session.summary(seconds)
+        mailbox = getattr(presenter, "mailbox", None)
+        summary["dropped_frames"] = mailbox.stats()["dropped"] if mailbox is not None else 0
+        telemetry.emit("session", presenter=presenter.name, render_size=self.render_size,
+                       capture=capture_config(capture), result=game_result(self.game),
+                       quality=quality, pool=self.pool.stats(), **summary)
+        return {
+            "frames": frames,
+            "seconds": round(seconds, 3),
+            "fps": round(frames / seconds, 1) if seconds > 0 else 0.0,
+            "completed": bool(self.game.game_complete),
+            "quality": quality,
+            "pool": self.pool.stats(),
+        }
+
+
+def open_capture(source=0, width=1280, height=720, fps=30):
+    """Open a camera index or a video file path for GameHost.run"""
+    if isinstance(source, str) and source.isdigit():
+        source = int(source)
+    cap = cv2.VideoCapture(source)
+    if isinstance(source, int):
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        cap.set(cv2.CAP_PROP_FPS, fps)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+
+def run_game(game, presenter, source=0, width=1280, height=720, fps=30, frame_alpha=None,
+             warmup=0, frame_delay=0.0, linger=3.0, max_frames=None, stream=None):
+    """Run one game under any presenter.
+
+    source is a camera index, a video file path or an already opened capture.
+    stream is an optional running StreamServer that also gets every frame.
+    The capture and presenter are released when the game ends.
+    """
+    cap = source if hasattr(source, 'read') else open_capture(source, width, height, fps)
+    if not cap.isOpened():
+        print(f"❌ Could not open capture source {source!r}")
+        presenter.close()
+        return None
+    for _ in range(warmup):
+        cap.read()
+    host = GameHost(game, frame_alpha=frame_alpha)
+    output = stream.tap(presenter, host) if stream is not None else presenter
+    try:
+        return host.run(cap, output, frame_delay=frame_delay, linger=linger, max_frames=max_frames)
+    finally:
+        cap.release()
+        presenter.close()
+
+
+def main(argv=None):
+    import argparse
+    from game_logic import GAMES
+    from presenter import PRESENTERS, create_presenter
+
+    parser = argparse.ArgumentParser(description="Run a Tamil game without the Tk menu")
+    parser.add_argument("--game", choices=sorted(GAMES), default="drag_drop")
+    parser.add_argument("--presenter", choices=PRESENTERS, default="highgui")
+    parser.add_argument("--source", default="0", help="camera index or video file")
+    parser.add_argument("--output", default="session.avi", help="video file for --presenter record")
+    parser.add_argument("--frames", type=int, default=None, help="stop after this many frames")
+    parser.add_argument("--size", default=None, help="render size WxH (null/record presenters)")
+    parser.add_argument("--fullscreen", action="store_true")
+    parser.add_argument("--stream", type=int, nargs="?", const=8765, default=None, metavar="PORT",
+                        help="also serve the frames and landmarks on localhost (see stream_server.py)")
+    args = parser.parse_args(argv)
+
+    size = tuple(int(v) for v in args.size.lower().split("x")) if args.size else None
+    capture = {}
+    if args.source.isdigit():
+        # A tuned camera runs in its calibrated capture mode (python calibration.py makes the profile)
+        if load_profile(int(args.source)) is not None:
+            capture = dict(zip(("width", "height", "fps"), get_tuning()["capture"]))
+    presenter = create_presenter(args.presenter, output=args.output, fullscreen=args.fullscreen, size=size)
+    stream = None
+    if args.stream is not None:
+        from stream_server import StreamServer
+        stream = StreamServer(port=args.stream).start()
+    try:
+        stats = run_game(GAMES[args.game](), presenter, source=args.source, max_frames=args.frames, stream=stream,
+                         **capture)
+    finally:
+        if stream is not None:
+            stream.stop()
+    if stats:
+        print(f"{args.game} via {args.presenter}: {stats['frames']} frames in {stats['seconds']}s "
+              f"({stats['fps']} FPS, quality tier {stats['quality']['tier']})")
+
+
+if __name__ == "__main__":
+    main()
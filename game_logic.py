@@ -1,16 +1,79 @@
 # Multiple game functions
 import cv2
-import json
 import random
 import numpy as np
 import math
 from hand_tracker import HandTracker
-from utils import draw_text, calculate_distance, play_sound
+from utils import draw_text, calculate_distance, layout_scale, px
+from speech import speak
+from phrases import TAMIL_NUMBERS, CORRECT_PREFIX, DRAG_DROP_COMPLETE, correct_word_phrase, correct_number_phrase, \
+    correct_letter_phrase, try_again_letter_phrase
+from color_lut import COLOR_RANGES, get_color_lut, classify_image
+from mosquito_swarm import MosquitoSwarm, DIFFICULTY_LEVELS
+from sprites import get_atlas, blit, blit_many
+from spatial_index import UniformGrid
+from word_bank import WordBank, get_word_bank
+from game_clock import GameClock, HoldTimer
+from governor import QualityGovernor, PRIORITY_COLOR_TINT, PRIORITY_HEADER_BLEND, PRIORITY_CURSOR_PULSE, PRIORITY_LANDMARKS
+from telemetry import get_telemetry
+from frame_pool import FramePool
+from letter_fields import TRACE_LETTERS, StrokeScore, get_letter_fields
+
+# Toggle per-event console logging here
+DEBUG = False
+
+# Word-pair counts for the drag-drop board mode (older kids)
+BOARD_MIN_PAIRS = 12
+BOARD_MAX_PAIRS = 40
+BOARD_DEFAULT_PAIRS = 20
+
+
+def draw_header_panel(img, height, color, alpha, blend=True, pool=None):
+    """Header bar across the top of img: blended over the camera image, or opaque when blend is off"""
+    roi = img[:height]
+    if blend:
+        solid = pool.filled("header", roi.shape, color) if pool is not None else np.full_like(roi, color)
+        cv2.addWeighted(solid, alpha, roi, 1 - alpha, 0, roi)
+    else:
+        roi[:] = color
+
+
+def darken(img, alpha):
+    """Blend img toward black in place, like a full-frame black overlay at alpha"""
+    cv2.addWeighted(img, 1 - alpha, img, 0, 0, img)
+
+
+def panel_overlay(img, pool, y0, y1):
+    """Pooled copy of the full-width band img[y0:y1] (clipped to the frame) to draw a fading panel on.
+    Returns (band, overlay, top); draw at y - top, then blend overlay into band."""
+    top, bottom = max(0, y0), min(img.shape[0], y1)
+    band = img[top:bottom]
+    return band, pool.copy("panel_overlay", band, depth=1), top
+
+
+# Used when the word bank can't be opened, or nothing in it can be played
+FALLBACK_WORDS = [
+    {"tamil": "பூ", "english": "flower"},
+    {"tamil": "பால்", "english": "milk"},
+    {"tamil": "நீர்", "english": "water"},
+]
+
 
 class DragDropGame:
-    def __init__(self):
+    def __init__(self, board_pairs=None, category=None, difficulty=None, seed=None, clock=None):
         self.hand_tracker = HandTracker()
+        # Seeded RNG and injectable clock make a run repeatable (see input_trace.py)
+        self.rng = random.Random(seed)
         self.words = self.load_words()
+        # Optional word-bank filters for this game's rounds
+        self.category = category
+        self.difficulty = difficulty
+        # None = classic 3-pair game, otherwise a grid board of this many pairs
+        self.board_pairs = None if board_pairs is None else \
+            max(BOARD_MIN_PAIRS, min(BOARD_MAX_PAIRS, int(board_pairs)))
+        self.quality = QualityGovernor()
+        self.frame_pool = FramePool()  # GameHost replaces it with the pipeline's pool
+        self.clock = clock if clock is not None else GameClock()
         self.current_word = None
         self.word_boxes = []
         self.image_boxes = []
@@ -21,63 +84,118 @@ class DragDropGame:
         self.game_complete = False
         # Interaction state (new)
         self.hover_word = None
-        self.hover_counter = 0
-        self.dwell_frames_to_grab = 10  # frames required to grab
         self.snap_radius = 45  # px radius to snap to nearest target
         self.highlight_target_idx = None
-        self.drop_hover_counter = 0
-        self.drop_dwell_frames = 6  # frames to confirm drop over a target
         # New latched dragging state
         self.drag_latched = False
         self.last_finger_pos = None
+        # Layout scale relative to the 800x600 design size (set in setup_game)
+        self.ui_scale = 1.0
+        # Spatial hashes over unmatched boxes (ids are indexes into the box lists)
+        self.word_grid = UniformGrid(1)
+        self.target_grid = UniformGrid(1)
     
     def _fit_text_scale(self, text, box_width, base_scale=1.0):
-        """Approximate a font scale so text fits within a given box width."""
+        """Approximate a font scale so text fits within a given box width.
+        box_width is in render pixels; the returned scale already includes ui_scale."""
+        s = self.ui_scale
         try:
-            avg_char_px = 22.0  # conservative Tamil glyph width at scale 1.0
-            padding = 28.0
-            max_w = max(30.0, box_width - padding)
+            avg_char_px = 22.0 * s  # conservative Tamil glyph width at scale 1.0
+            padding = 28.0 * s
+            max_w = max(30.0 * s, box_width - padding)
             need = avg_char_px * max(1, len(text)) * base_scale
             if need <= max_w:
-                return base_scale
+                return base_scale * s
             scale = max(0.5, max_w / (avg_char_px * max(1, len(text))))
-            return min(base_scale, scale)
+            return min(base_scale, scale) * s
         except Exception:
-            return max(0.5, min(1.0, base_scale))
+            return max(0.5, min(1.0, base_scale)) * s
         
     def load_words(self):
+        """The shared word bank (memory-mapped; only sampled words are decoded)"""
         try:
-            with open('assets/words.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data['words']
-        except:
-            # Minimal fallback if file not found
-            return [
-                {"tamil": "பூ", "english": "flower"},
-                {"tamil": "பால்", "english": "milk"},
-                {"tamil": "நீர்", "english": "water"}
-            ]
+            return get_word_bank()
+        except Exception as e:
+            print(f"Word bank unavailable ({e}); using built-in words")
+            # Minimal fallback if the bank can't be built or opened
+            return WordBank.from_entries(FALLBACK_WORDS)
     
+    def register_effects(self, governor):
+        self.quality = governor
+        governor.register("header_blend", PRIORITY_HEADER_BLEND, "translucent header panel")
+        governor.register("cursor_pulse", PRIORITY_CURSOR_PULSE, "pulsing pinch cursor")
+
     def setup_game(self, img_width, img_height):
-        # Select 3 random words for this round
-        selected_words = random.sample(self.words, min(3, len(self.words)))
+        self.ui_scale = s = layout_scale(img_width, img_height)
+        self.snap_radius = px(45, s)
+
+        # Select random words for this round: 3, or a full board
+        n_pairs = self.board_pairs or 3
+        selected_words = self.words.sample(n_pairs, category=self.category, difficulty=self.difficulty, rng=self.rng)
+        if not selected_words:
+            # Nothing matches the filters; fall back to the whole bank
+            selected_words = self.words.sample(n_pairs, rng=self.rng)
+        if not selected_words:
+            # An empty bank: play the built-in words rather than an empty board
+            print("Word bank has no words; using built-in words")
+            self.words = WordBank.from_entries(FALLBACK_WORDS)
+            selected_words = self.words.sample(n_pairs, rng=self.rng)
+        shuffled_words = selected_words.copy()
+        self.rng.shuffle(shuffled_words)
+
+        if self.board_pairs:
+            word_rects, target_rects = self._board_layout(len(selected_words), img_width, img_height)
+        else:
+            word_rects, target_rects = self._column_layout(len(selected_words), img_width, img_height)
+
+        # Word boxes (left side) and image boxes (right side, shuffled)
+        self.word_boxes = [self._make_box(word, rect, idx=i, mistakes=0)
+                           for i, (word, rect) in enumerate(zip(selected_words, word_rects))]
+        self.image_boxes = [self._make_box(word, rect, idx=i, highlight=False)
+                            for i, (word, rect) in enumerate(zip(shuffled_words, target_rects))]
+        self.highlight_target_idx = None
+        self._build_index()
+
+    def _make_box(self, word, rect, **extra):
+        x, y, w_box, h_box = rect
+        box = {
+            'word': word,
+            'rect': rect,
+            'center': (x + w_box // 2, y + h_box // 2),
+            'matched': False,
+        }
+        box.update(extra)
+        return box
 
+    def _build_index(self):
+        """Hash every box into a grid with cells about one box in size"""
+        cell = max(max(b['rect'][2], b['rect'][3]) for b in self.word_boxes + self.image_boxes) \
+            if self.word_boxes else 1
+        self.word_grid = UniformGrid(cell)
+        self.target_grid = UniformGrid(cell)
+        for idx, box in enumerate(self.word_boxes):
+            self.word_grid.insert(idx, box['rect'], box['center'])
+        for idx, box in enumerate(self.image_boxes):
+            self.target_grid.insert(idx, box['rect'], box['center'])
+
+    def _column_layout(self, n, img_width, img_height):
+        """Classic layout: one column of words on the left, one of targets on the right"""
+        s = self.ui_scale
         # Responsive vertical layout so all pairs fit, even on shorter windows
-        n = len(selected_words)
-        header_h = 120
-        footer_h = 100
-        top_margin = header_h + 10
-        bottom_margin = footer_h + 10
-        usable_h = max(100, img_height - (top_margin + bottom_margin))
-
-        base_w, base_h = 160, 60
-        min_gap = 16
+        header_h = px(120, s)
+        footer_h = px(100, s)
+        top_margin = header_h + px(10, s)
+        bottom_margin = footer_h + px(10, s)
+        usable_h = max(px(100, s), img_height - (top_margin + bottom_margin))
+
+        base_w, base_h = px(160, s), px(60, s)
+        min_gap = px(16, s)
         # Compute scale if space is tight
         needed_h = n * base_h + (n + 1) * min_gap
         if usable_h < needed_h:
             scale_y = max(0.65, usable_h / float(needed_h))
-            h_box = max(40, int(base_h * scale_y))
-            gap = max(8, int(min_gap * scale_y))
+            h_box = max(px(40, s), int(base_h * scale_y))
+            gap = max(px(8, s), int(min_gap * scale_y))
         else:
             h_box = base_h
             # Distribute remaining space as gaps
@@ -91,58 +209,73 @@ class DragDropGame:
             row_y.append(cur_y)
             cur_y += h_box + gap
 
-        # Setup word boxes (left side)
-        self.word_boxes = []
-        for i, word in enumerate(selected_words):
-            y = row_y[i]
-            x = 50
-            box = {
-                'word': word,
-                'rect': (x, y, w_box, h_box),
-                'center': (x + w_box // 2, y + h_box // 2),
-                'matched': False,
-                'mistakes': 0
-            }
-            self.word_boxes.append(box)
-
-        # Setup image boxes (right side) - shuffled
-        self.image_boxes = []
-        shuffled_words = selected_words.copy()
-        random.shuffle(shuffled_words)
-
-        for i, word in enumerate(shuffled_words):
-            y = row_y[i]
-            x = img_width - (w_box + 50)
-            box = {
-                'word': word,
-                'rect': (x, y, w_box, h_box),
-                'center': (x + w_box // 2, y + h_box // 2),
-                'matched': False,
-                'highlight': False
-            }
-            self.image_boxes.append(box)
+        margin_x = px(50, s)
+        word_rects = [(margin_x, y, w_box, h_box) for y in row_y]
+        target_rects = [(img_width - (w_box + margin_x), y, w_box, h_box) for y in row_y]
+        return word_rects, target_rects
+
+    def _board_layout(self, n, img_width, img_height):
+        """Board layout: a grid of words on the left half and a grid of targets on the right half"""
+        s = self.ui_scale
+        top = px(140, s)
+        bottom = img_height - px(110, s)
+        margin_x, middle_gap, gap = px(20, s), px(30, s), px(8, s)
+        side_w = (img_width - 2 * margin_x - middle_gap) // 2
+        side_h = max(px(100, s), bottom - top)
+        base_w, base_h = 160.0, 60.0
+        if n <= 0:
+            return [], []
+
+        # Pick the column count that keeps boxes largest at the classic aspect ratio
+        best = None
+        for cols in range(1, n + 1):
+            rows = (n + cols - 1) // cols
+            w_box = (side_w - (cols - 1) * gap) // cols
+            h_box = (side_h - (rows - 1) * gap) // rows
+            fit = min(w_box / base_w, h_box / base_h)
+            if best is None or fit > best[0]:
+                best = (fit, cols, rows)
+        _, cols, rows = best
+        fit = min(best[0], s)  # never larger than the classic boxes
+        w_box = max(px(40, s), int(base_w * fit))
+        h_box = max(px(24, s), int(base_h * fit))
+
+        # Centre each grid in its half
+        grid_w = cols * w_box + (cols - 1) * gap
+        grid_h = rows * h_box + (rows - 1) * gap
+        y0 = top + (side_h - grid_h) // 2
+        left_x0 = margin_x + (side_w - grid_w) // 2
+        right_x0 = img_width - margin_x - side_w + (side_w - grid_w) // 2
+
+        def cells(x0):
+            return [(x0 + (i % cols) * (w_box + gap), y0 + (i // cols) * (h_box + gap), w_box, h_box)
+                    for i in range(n)]
+        return cells(left_x0), cells(right_x0)
     
     def draw_game_ui(self, img):
         h, w = img.shape[:2]
+        s = self.ui_scale
 
         # Header overlay
-        overlay = img.copy()
-        cv2.rectangle(overlay, (0, 0), (w, 120), (30, 30, 30), -1)
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        header_h = px(120, s)
+        draw_header_panel(img, header_h, (30, 30, 30), 0.7, self.quality.enabled("header_blend"),
+                          pool=self.frame_pool)
 
         # Title
-        draw_text(img, "Tamil Drag-Drop Game", (w//2 - 148, 52), (0, 0, 0), 1.4, 4)
-        draw_text(img, "Tamil Drag-Drop Game", (w//2 - 150, 50), (255, 215, 0), 1.4, 3)
+        draw_text(img, "Tamil Drag-Drop Game", (w//2 - px(148, s), px(52, s)), (0, 0, 0), 1.4, 4, ui_scale=s)
+        draw_text(img, "Tamil Drag-Drop Game", (w//2 - px(150, s), px(50, s)), (255, 215, 0), 1.4, 3, ui_scale=s)
 
         # Score and progress
         progress = f"{self.matches_made}/{len(self.word_boxes)}"
-        draw_text(img, f"Score: {self.score}", (50, 90), (255, 255, 255), 1.0, 2)
-        draw_text(img, f"Progress: {progress}", (w - 200, 90), (255, 255, 255), 1.0, 2)
+        draw_text(img, f"Score: {self.score}", (px(50, s), px(90, s)), (255, 255, 255), 1.0, 2, ui_scale=s)
+        draw_text(img, f"Progress: {progress}", (w - px(200 + 18 * (len(progress) - 3), s), px(90, s)), (255, 255, 255), 1.0, 2, ui_scale=s)
 
         # Section headers
-        draw_text(img, "English Words", (50, 130), (255, 200, 100), 0.8, 2)
-        draw_text(img, "Match Tamil", (w - 250, 130), (255, 200, 100), 0.8, 2)
+        draw_text(img, "English Words", (px(50, s), px(130, s)), (255, 200, 100), 0.8, 2, ui_scale=s)
+        draw_text(img, "Match Tamil", (w - px(250, s), px(130, s)), (255, 200, 100), 0.8, 2, ui_scale=s)
 
+        border = max(1, px(2, s))
+        line_w = max(1, px(3, s))
         # Left: English words
         for i, box in enumerate(self.word_boxes):
             x, y, w_box, h_box = box['rect']
@@ -152,16 +285,17 @@ class DragDropGame:
             else:
                 color = (255, 255, 255)
                 bg = (40, 40, 100)
-            cv2.rectangle(img, (x-2, y-2), (x + w_box + 2, y + h_box + 2), (0, 0, 0), -1)
+            cv2.rectangle(img, (x - border, y - border), (x + w_box + border, y + h_box + border), (0, 0, 0), -1)
             cv2.rectangle(img, (x, y), (x + w_box, y + h_box), bg, -1)
-            cv2.rectangle(img, (x, y), (x + w_box, y + h_box), color, 3)
+            cv2.rectangle(img, (x, y), (x + w_box, y + h_box), color, line_w)
             if not box['matched']:
-                txt_y = y + max(22, int(h_box * 0.62))
+                txt_y = y + max(px(22, s), int(h_box * 0.62))
                 scale = self._fit_text_scale(box['word']['english'], w_box, 1.0)
-                draw_text(img, box['word']['english'], (x + 12, txt_y), (255, 255, 255), scale, 2)
-                bubble_r = 12 if h_box < 50 else 15
-                cv2.circle(img, (x + w_box - 20, y + 18), bubble_r, color, -1)
-                draw_text(img, str(i+1), (x + w_box - 27, y + 26), (0, 0, 0), 0.6, 2)
+                draw_text(img, box['word']['english'], (x + px(12, s), txt_y), (255, 255, 255), scale, max(1, px(2, s)))
+                if w_box >= px(120, s):
+                    bubble_r = px(12, s) if h_box < px(50, s) else px(15, s)
+                    cv2.circle(img, (x + w_box - px(20, s), y + px(18, s)), bubble_r, color, -1)
+                    draw_text(img, str(i+1), (x + w_box - px(27, s), y + px(26, s)), (0, 0, 0), 0.6, 2, ui_scale=s)
 
         # Right: Tamil target boxes
         for i, box in enumerate(self.image_boxes):
@@ -172,59 +306,59 @@ class DragDropGame:
             else:
                 color = (0, 255, 255) if box.get('highlight', False) else (100, 150, 255)
                 bg = (50, 50, 80)
-            cv2.rectangle(img, (x-2, y-2), (x + w_box + 2, y + h_box + 2), (0, 0, 0), -1)
+            cv2.rectangle(img, (x - border, y - border), (x + w_box + border, y + h_box + border), (0, 0, 0), -1)
             cv2.rectangle(img, (x, y), (x + w_box, y + h_box), bg, -1)
             if box['matched']:
-                cv2.rectangle(img, (x, y), (x + w_box, y + h_box), color, 3)
+                cv2.rectangle(img, (x, y), (x + w_box, y + h_box), color, line_w)
             else:
-                dash = 10
-                for pos in range(0, w_box, dash * 2):
-                    cv2.line(img, (x + pos, y), (x + min(pos + dash, w_box), y), color, 3)
-                    cv2.line(img, (x + pos, y + h_box), (x + min(pos + dash, w_box), y + h_box), color, 3)
-                for pos in range(0, h_box, dash * 2):
-                    cv2.line(img, (x, y + pos), (x, y + min(pos + dash, h_box)), color, 3)
-                    cv2.line(img, (x + w_box, y + pos), (x + w_box, y + min(pos + dash, h_box)), color, 3)
-            if not box['matched']:
-                drop_y = y + max(16, int(h_box * 0.32))
-                tamil_y = y + max(28, int(h_box * 0.75))
+                # Pre-rendered dashed outline (one sprite per box size and colour)
+                border_sprite = get_atlas().get("dashed_rect", w_box, h_box, color, line_w, max(2, px(10, s)))
+                blit(img, border_sprite, x, y)
+            text_w = max(1, px(2, s))
+            if self.board_pairs:
+                # Board boxes are small: just the Tamil word (Tamil text is anchored at its top-left)
+                word_scale = self._fit_text_scale(box['word']['tamil'], w_box, 0.8)
+                word_color = (200, 255, 200) if box['matched'] else (255, 255, 255)
+                draw_text(img, box['word']['tamil'], (x + px(8, s), y + int(h_box * 0.2)), word_color, word_scale, text_w)
+            elif not box['matched']:
+                drop_y = y + max(px(16, s), int(h_box * 0.32))
+                tamil_y = y + max(px(28, s), int(h_box * 0.75))
                 drop_scale = self._fit_text_scale("DROP HERE", w_box, 0.7)
                 word_scale = self._fit_text_scale(box['word']['tamil'], w_box, 0.9)
-                draw_text(img, "DROP HERE", (x + 12, drop_y), color, drop_scale, 2)
-                draw_text(img, box['word']['tamil'], (x + 12, tamil_y), (255, 255, 255), word_scale, 2)
+                draw_text(img, "DROP HERE", (x + px(12, s), drop_y), color, drop_scale, text_w)
+                draw_text(img, box['word']['tamil'], (x + px(12, s), tamil_y), (255, 255, 255), word_scale, text_w)
             else:
-                draw_text(img, "MATCHED!", (x + 50, y + 30), color, 0.8, 2)
+                draw_text(img, "MATCHED!", (x + px(50, s), y + px(30, s)), color, 0.8, 2, ui_scale=s)
                 word_scale = self._fit_text_scale(box['word']['tamil'], w_box, 0.8)
-                draw_text(img, box['word']['tamil'], (x + 12, y + max(28, int(h_box * 0.72))), (200, 255, 200), word_scale, 2)
+                draw_text(img, box['word']['tamil'], (x + px(12, s), y + max(px(28, s), int(h_box * 0.72))), (200, 255, 200), word_scale, text_w)
 
         # Instructions panel (no emoji)
-        instruction_y = h - 100
+        instruction_y = h - px(100, s)
         cv2.rectangle(img, (0, instruction_y), (w, h), (20, 20, 20), -1)
-        cv2.rectangle(img, (0, instruction_y), (w, instruction_y + 5), (255, 215, 0), -1)
-        draw_text(img, "CONTROLS:", (50, instruction_y + 25), (255, 215, 0), 0.7, 2)
-        draw_text(img, "Point to navigate", (50, instruction_y + 45), (255, 255, 255), 0.6, 1)
-        draw_text(img, "Pinch to pick", (250, instruction_y + 45), (255, 255, 255), 0.6, 1)
-        draw_text(img, "Move onto answer to drop", (450, instruction_y + 45), (255, 255, 255), 0.6, 1)
-        draw_text(img, "Press 'Q' to quit", (700, instruction_y + 45), (255, 100, 100), 0.6, 1)
+        cv2.rectangle(img, (0, instruction_y), (w, instruction_y + px(5, s)), (255, 215, 0), -1)
+        draw_text(img, "CONTROLS:", (px(50, s), instruction_y + px(25, s)), (255, 215, 0), 0.7, 2, ui_scale=s)
+        draw_text(img, "Point to navigate", (px(50, s), instruction_y + px(45, s)), (255, 255, 255), 0.6, 1, ui_scale=s)
+        draw_text(img, "Pinch to pick", (px(250, s), instruction_y + px(45, s)), (255, 255, 255), 0.6, 1, ui_scale=s)
+        draw_text(img, "Move onto answer to drop", (px(450, s), instruction_y + px(45, s)), (255, 255, 255), 0.6, 1, ui_scale=s)
+        draw_text(img, "Press 'Q' to quit", (px(700, s), instruction_y + px(45, s)), (255, 100, 100), 0.6, 1, ui_scale=s)
 
         # Progress bar
-        bar_width, bar_height = 300, 20
+        bar_width, bar_height = px(300, s), px(20, s)
         bar_x = w//2 - bar_width//2
-        bar_y = instruction_y + 70
+        bar_y = instruction_y + px(70, s)
         cv2.rectangle(img, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), (50, 50, 50), -1)
         progress_width = int((self.matches_made / max(1, len(self.word_boxes))) * bar_width)
         if progress_width > 0:
             cv2.rectangle(img, (bar_x, bar_y), (bar_x + progress_width, bar_y + bar_height), (0, 255, 0), -1)
-        draw_text(img, f"{self.matches_made}/{len(self.word_boxes)} Matched", (bar_x + bar_width//2 - 60, bar_y + 15), (255, 255, 255), 0.5, 1)
+        draw_text(img, f"{self.matches_made}/{len(self.word_boxes)} Matched", (bar_x + bar_width//2 - px(60, s), bar_y + px(15, s)), (255, 255, 255), 0.5, 1, ui_scale=s)
 
         # Completion overlay
         if self.game_complete:
-            overlay2 = img.copy()
-            cv2.rectangle(overlay2, (0, 0), (w, h), (0, 0, 0), -1)
-            cv2.addWeighted(overlay2, 0.6, img, 0.4, 0, img)
-            draw_text(img, "CONGRATULATIONS!", (w//2 - 200, h//2 - 50), (0, 255, 255), 1.5, 4)
-            draw_text(img, "All Words Matched Successfully!", (w//2 - 200, h//2), (255, 255, 255), 1.0, 2)
-            draw_text(img, f"Final Score: {self.score} points", (w//2 - 120, h//2 + 40), (255, 215, 0), 1.0, 2)
-            draw_text(img, "Press 'Q' to return to menu", (w//2 - 150, h//2 + 80), (200, 200, 200), 0.8, 2)
+            darken(img, 0.6)
+            draw_text(img, "CONGRATULATIONS!", (w//2 - px(200, s), h//2 - px(50, s)), (0, 255, 255), 1.5, 4, ui_scale=s)
+            draw_text(img, "All Words Matched Successfully!", (w//2 - px(200, s), h//2), (255, 255, 255), 1.0, 2, ui_scale=s)
+            draw_text(img, f"Final Score: {self.score} points", (w//2 - px(120, s), h//2 + px(40, s)), (255, 215, 0), 1.0, 2, ui_scale=s)
+            draw_text(img, "Press 'Q' to return to menu", (w//2 - px(150, s), h//2 + px(80, s)), (200, 200, 200), 0.8, 2, ui_scale=s)
 
     def detect_finger_position(self, img):
         """Return (index_tip_pos, is_pinching, confidence)."""
@@ -253,42 +387,41 @@ class DragDropGame:
         return None, False, confidence
     
     def check_word_collision(self, finger_pos):
-        for box in self.word_boxes:
-            if box['matched']:
-                continue
-            x, y, w, h = box['rect']
-            if x <= finger_pos[0] <= x + w and y <= finger_pos[1] <= y + h:
-                return box
-        return None
+        idx = self.word_grid.query_point(*finger_pos)
+        return None if idx is None else self.word_boxes[idx]
     
     def check_image_collision(self, finger_pos):
-        for box in self.image_boxes:
-            if box['matched']:
-                continue
-            x, y, w, h = box['rect']
-            if x <= finger_pos[0] <= x + w and y <= finger_pos[1] <= y + h:
-                return box
-        return None
+        idx = self.target_grid.query_point(*finger_pos)
+        return None if idx is None else self.image_boxes[idx]
     
     def check_match(self, word_box, image_box):
         return word_box['word']['english'] == image_box['word']['english']
     
-    def get_nearest_target(self, pos):
-        """Return (index, box, distance) for nearest unmatched target center to pos"""
+    def get_nearest_target(self, pos, max_dist=None):
+        """Return (index, box, distance) for the nearest unmatched target centre
+        within max_dist of pos (defaults to the snap radius)"""
         if not pos:
             return None, None, float('inf')
-        px, py = pos
-        best_idx, best_box, best_dist = None, None, float('inf')
-        for idx, box in enumerate(self.image_boxes):
-            if box['matched']:
-                continue
-            cx, cy = box['center']
-            d = math.hypot(px - cx, py - cy)
-            if d < best_dist:
-                best_idx, best_box, best_dist = idx, box, d
-        return best_idx, best_box, best_dist
+        if max_dist is None:
+            max_dist = self.snap_radius
+        idx, dist = self.target_grid.nearest(pos[0], pos[1], max_dist)
+        if idx is None:
+            return None, None, float('inf')
+        return idx, self.image_boxes[idx], dist
+
+    def _set_highlight(self, idx):
+        """Highlight at most one target, touching only the previous and new box"""
+        if idx == self.highlight_target_idx:
+            return
+        if self.highlight_target_idx is not None:
+            self.image_boxes[self.highlight_target_idx]['highlight'] = False
+        if idx is not None:
+            self.image_boxes[idx]['highlight'] = True
+        self.highlight_target_idx = idx
     
     def handle_game_logic(self, img):
+        s = self.ui_scale
+        self.clock.tick()
         finger_pos, is_pinching, confidence = self.detect_finger_position(img)
 
         # Track last known position for stability when tracking drops briefly
@@ -301,24 +434,27 @@ class DragDropGame:
             
             if is_pinching and not self.dragging:
                 # Grabbing state - red pulsing circle
-                import time
-                pulse = int(abs(np.sin(time.time() * 5)) * 15) + 10
+                if self.quality.enabled("cursor_pulse"):
+                    pulse = px(int(abs(np.sin(self.clock.now() * 5)) * 15) + 10, s)
+                else:
+                    pulse = px(18, s)
                 p = finger_pos if finger_pos else self.last_finger_pos
-                cv2.circle(img, p, pulse, (0, 0, confidence_color), 3)
-                cv2.circle(img, p, 5, (255, 255, 255), -1)
-                draw_text(img, "PINCH", (p[0] - 20, p[1] - 30), (0, 0, 255), 0.5, 2)
+                cv2.circle(img, p, pulse, (0, 0, confidence_color), max(1, px(3, s)))
+                cv2.circle(img, p, px(5, s), (255, 255, 255), -1)
+                draw_text(img, "PINCH", (p[0] - px(20, s), p[1] - px(30, s)), (0, 0, 255), 0.5, 2, ui_scale=s)
             else:
                 # Normal state - yellow circle with crosshair, opacity based on confidence
                 circle_color = (0, confidence_color, confidence_color)
                 p = finger_pos if finger_pos else self.last_finger_pos
-                cv2.circle(img, p, 15, circle_color, 2)
-                cv2.circle(img, p, 3, (255, 255, 255), -1)
+                arm = px(10, s)
+                cv2.circle(img, p, px(15, s), circle_color, max(1, px(2, s)))
+                cv2.circle(img, p, px(3, s), (255, 255, 255), -1)
                 # Crosshair
-                cv2.line(img, (p[0] - 10, p[1]), (p[0] + 10, p[1]), circle_color, 2)
-                cv2.line(img, (p[0], p[1] - 10), (p[0], p[1] + 10), circle_color, 2)
+                cv2.line(img, (p[0] - arm, p[1]), (p[0] + arm, p[1]), circle_color, max(1, px(2, s)))
+                cv2.line(img, (p[0], p[1] - arm), (p[0], p[1] + arm), circle_color, max(1, px(2, s)))
             
             # Display confidence
-            draw_text(img, f"Confidence: {confidence:.1f}", (10, 30), (255, 255, 255), 0.5, 1)
+            draw_text(img, f"Confidence: {confidence:.1f}", (px(10, s), px(30, s)), (255, 255, 255), 0.5, 1, ui_scale=s)
             
             # Pinch-to-pick with latched dragging
             if not self.dragging:
@@ -332,7 +468,7 @@ class DragDropGame:
                         self.drag_latched = True
                         self.drag_offset = (p[0] - word_box['center'][0], p[1] - word_box['center'][1])
                         # Visual feedback
-                        cv2.circle(img, p, 25, (0, 255, 0), 2)
+                        blit(img, get_atlas().get("ring", px(25, s), max(1, px(2, s)), (0, 255, 0)), *p)
             
             # Draw dragged word with enhanced visuals
             if self.dragging and self.current_word:
@@ -341,147 +477,102 @@ class DragDropGame:
                     # No tracking; keep original center as a fallback
                     p = self.current_word['center']
                 drag_pos = (p[0] - self.drag_offset[0], p[1] - self.drag_offset[1])
+                # Dragged box keeps the size of its source box
+                _, _, box_w, box_h = self.current_word['rect']
+                half_w, half_h = box_w // 2, box_h // 2
+                shadow = max(1, px(2, s))
                 
-                # Shadow effect (adjusted for smaller box 160x60)
+                # Shadow effect
                 cv2.rectangle(img,
-                              (drag_pos[0] - 82, drag_pos[1] - 32),
-                              (drag_pos[0] + 82, drag_pos[1] + 32),
+                              (drag_pos[0] - half_w - shadow, drag_pos[1] - half_h - shadow),
+                              (drag_pos[0] + half_w + shadow, drag_pos[1] + half_h + shadow),
                               (0, 0, 0), -1)
 
-                # Main dragged box with glow effect (160x60)
+                # Main dragged box with glow effect
                 cv2.rectangle(img,
-                              (drag_pos[0] - 80, drag_pos[1] - 30),
-                              (drag_pos[0] + 80, drag_pos[1] + 30),
+                              (drag_pos[0] - half_w, drag_pos[1] - half_h),
+                              (drag_pos[0] + half_w, drag_pos[1] + half_h),
                               (255, 255, 0), -1)
                 cv2.rectangle(img,
-                              (drag_pos[0] - 80, drag_pos[1] - 30),
-                              (drag_pos[0] + 80, drag_pos[1] + 30),
-                              (255, 255, 255), 3)
+                              (drag_pos[0] - half_w, drag_pos[1] - half_h),
+                              (drag_pos[0] + half_w, drag_pos[1] + half_h),
+                              (255, 255, 255), max(1, px(3, s)))
 
-                # Dragged text (English on left side), fit to 160x60 box
+                # Dragged text (English on left side), fit to the box
                 drag_text = self.current_word['word']['english']
-                drag_scale = self._fit_text_scale(drag_text, 160 - 24, 1.0)
+                drag_scale = self._fit_text_scale(drag_text, box_w - px(24, s), 1.0)
                 draw_text(img, drag_text,
-                          (drag_pos[0] - 80 + 12, drag_pos[1] + 6), (0, 0, 0), drag_scale, 3)
+                          (drag_pos[0] - half_w + px(12, s), drag_pos[1] + px(6, s)), (0, 0, 0), drag_scale, max(1, px(3, s)))
                 
                 # Draw connection line from original position
                 orig_center = self.current_word['center']
-                cv2.line(img, orig_center, drag_pos, (255, 255, 0), 2)
+                cv2.line(img, orig_center, drag_pos, (255, 255, 0), max(1, px(2, s)))
                 # Highlight nearest target and show guide line
-                nearest_idx, nearest_box, nearest_dist = self.get_nearest_target(drag_pos)
-                for ib in self.image_boxes:
-                    ib['highlight'] = False
-                if nearest_box and nearest_dist <= self.snap_radius:
-                    nearest_box['highlight'] = True
+                nearest_idx, nearest_box, nearest_dist = self.get_nearest_target(drag_pos, self.snap_radius)
+                self._set_highlight(nearest_idx)
+                if nearest_box:
                     cv2.line(img, drag_pos, nearest_box['center'], (0, 255, 255), 1)
                     # Auto-drop only if it's the correct target
                     if self.check_match(self.current_word, nearest_box):
                         # Perform drop and scoring
                         self.current_word['matched'] = True
                         nearest_box['matched'] = True
+                        self.word_grid.remove(self.current_word['idx'])
+                        self.target_grid.remove(nearest_idx)
                         self.score += 10
                         self.matches_made += 1
                         # Success visuals
                         for i in range(3):
-                            cv2.circle(img, nearest_box['center'], 30 + i*10, (0, 255, 0), 3)
-                        try:
-                            play_sound(f"Correct! {self.current_word['word']['tamil']}")
-                        except:
-                            print(f"Correct! {self.current_word['word']['tamil']}")
+                            ring = get_atlas().get("ring", px(30 + i*10, s), max(1, px(3, s)), (0, 255, 0))
+                            blit(img, ring, *nearest_box['center'])
+                        speak(correct_word_phrase(self.current_word['word']['tamil']))
                         if self.matches_made >= len(self.word_boxes):
                             self.game_complete = True
-                            try:
-                                play_sound("Congratulations! You matched all words!")
-                            except:
-                                print("Game Complete!")
+                            speak(DRAG_DROP_COMPLETE)
                         # Reset drag state after successful drop
                         self.dragging = False
                         self.drag_latched = False
                         self.current_word = None
                     else:
                         # Indicate wrong target subtly
-                        draw_text(img, "Wrong target", (drag_pos[0] - 50, drag_pos[1] - 55), (0, 0, 255), 0.5, 1)
+                        draw_text(img, "Wrong target", (drag_pos[0] - px(50, s), drag_pos[1] - px(55, s)), (0, 0, 255), 0.5, 1, ui_scale=s)
         
         else:
             # No hand detected - show instruction
             h, w = img.shape[:2]
-            draw_text(img, "Show your hand to the camera", (w//2 - 150, h//2), (255, 100, 100), 1.0, 2)
+            draw_text(img, "Show your hand to the camera", (w//2 - px(150, s), h//2), (255, 100, 100), 1.0, 2, ui_scale=s)
         
         # Clear highlights when not dragging
         if not self.dragging:
-            for ib in self.image_boxes:
-                ib['highlight'] = False
+            self._set_highlight(None)
 
-def game_drag_drop():
+def game_drag_drop(presenter=None):
     print("[Game] Starting Drag-Drop Matching...")
-    
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+    from game_host import run_game
+    from presenter import HighGUIPresenter
     
     game = DragDropGame()
-    game_initialized = False
-    
-    while True:
-        ret, img = cap.read()
-        if not ret:
-            break
-        
-        img = cv2.flip(img, 1)  # Mirror the image
-        h, w = img.shape[:2]
-        
-        # Initialize game on first frame
-        if not game_initialized:
-            game.setup_game(w, h)
-            game_initialized = True
-        
-        # Process hand tracking
-        img = game.hand_tracker.find_hands(img, draw=True)
-        
-        # Handle game logic
-        game.handle_game_logic(img)
-        
-        # Draw game UI
-        game.draw_game_ui(img)
-        
-        cv2.imshow("Tamil Drag-Drop Game", img)
-        
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord('q') or game.game_complete:
-            if game.game_complete:
-                cv2.waitKey(3000)  # Show completion message for 3 seconds
-            break
-    
-    cap.release()
-    cv2.destroyAllWindows()
+    presenter = presenter or HighGUIPresenter("Tamil Drag-Drop Game")
+    run_game(game, presenter, width=1280, height=720, frame_alpha=1.0,
+             linger=3.0)  # Show completion message for 3 seconds
     print(f"Game ended. Final score: {game.score}")
 
 class FingerCountGame:
-    def __init__(self):
+    def __init__(self, seed=None, clock=None):
         self.hand_tracker = HandTracker(max_hands=2, detection_confidence=0.8, tracking_confidence=0.8)
+        self.rng = random.Random(seed)
         
         # Tamil numbers dictionary
-        self.tamil_numbers = {
-            1: "ஒன்று",
-            2: "இரண்டு", 
-            3: "மூன்று",
-            4: "நான்கு",
-            5: "ஐந்து",
-            6: "ஆறு",
-            7: "ஏழு",
-            8: "எட்டு",
-            9: "ஒன்பது",
-            10: "பத்து"
-        }
+        self.tamil_numbers = {n: word for n, word in enumerate(TAMIL_NUMBERS, start=1)}
         
         # Game state
-        import random
-        self.current_target = random.randint(1, 5)  # Start with 1-5 for easier play
+        self.current_target = self.rng.randint(1, 5)  # Start with 1-5 for easier play
         self.score = 0
         self.level = 1
-        self.last_correct_time = 0
-        self.stable_count_frames = 0
-        self.required_stable_frames = 20  # Need stable detection for 20 frames
+        self.clock = clock if clock is not None else GameClock()
+        self.last_correct_time = -2.0
+        # The count must be held for this long (20 frames at 30 FPS)
+        self.hold = HoldTimer(0.67)
         self.show_feedback = False
         self.feedback_timer = 0
         self.feedback_message = ""
@@ -489,78 +580,87 @@ class FingerCountGame:
         self.feedback_started_at = 0.0
         self.feedback_duration = 1.5  # seconds to fade out
         self.game_complete = False
+        self.ui_scale = 1.0
+        self.quality = QualityGovernor()
+        self.frame_pool = FramePool()  # GameHost replaces it with the pipeline's pool
         
         print(f"Tamil Finger Counting Game Started! Target: {self.current_target} ({self.tamil_numbers[self.current_target]})")
         print("Show both hands for counting up to 10 fingers!")
     
     def setup_game(self, img_width, img_height):
-        # No special setup needed for finger counting
-        pass
+        # Only the UI scale depends on the render size
+        self.ui_scale = layout_scale(img_width, img_height)
+
+    def register_effects(self, governor):
+        self.quality = governor
+        governor.register("header_blend", PRIORITY_HEADER_BLEND, "translucent header panel")
     
     def draw_game_ui(self, img):
         h, w = img.shape[:2]
+        s = self.ui_scale
         
         # Draw game UI background
-        overlay = img.copy()
-        cv2.rectangle(overlay, (0, 0), (w, 150), (20, 30, 50), -1)
-        cv2.addWeighted(overlay, 0.8, img, 0.2, 0, img)
+        draw_header_panel(img, px(150, s), (20, 30, 50), 0.8, self.quality.enabled("header_blend"),
+                          pool=self.frame_pool)
         
         # Draw title
-        draw_text(img, "Tamil Finger Counting Game", (w//2 - 200, 30), (255, 215, 0), 1.2, 3)
+        draw_text(img, "Tamil Finger Counting Game", (w//2 - px(200, s), px(30, s)), (255, 215, 0), 1.2, 3, ui_scale=s)
         
         # Draw current challenge
         challenge_text = f"Show: {self.current_target}"
         tamil_text = self.tamil_numbers[self.current_target]
-        draw_text(img, challenge_text, (50, 80), (255, 255, 255), 1.0, 2)
-        draw_text(img, tamil_text, (200, 80), (100, 255, 255), 1.5, 3)  # Larger Tamil text
+        draw_text(img, challenge_text, (px(50, s), px(80, s)), (255, 255, 255), 1.0, 2, ui_scale=s)
+        draw_text(img, tamil_text, (px(200, s), px(80, s)), (100, 255, 255), 1.5, 3, ui_scale=s)  # Larger Tamil text
         
         # Draw score and level
-        draw_text(img, f"Score: {self.score}", (w-200, 50), (255, 255, 255), 0.8, 2)
-        draw_text(img, f"Level: {self.level}", (w-200, 80), (255, 255, 255), 0.8, 2)
+        draw_text(img, f"Score: {self.score}", (w - px(200, s), px(50, s)), (255, 255, 255), 0.8, 2, ui_scale=s)
+        draw_text(img, f"Level: {self.level}", (w - px(200, s), px(80, s)), (255, 255, 255), 0.8, 2, ui_scale=s)
         
         # Draw instructions
-        instruction_y = h - 80
+        instruction_y = h - px(80, s)
         cv2.rectangle(img, (0, instruction_y), (w, h), (30, 30, 30), -1)
-        draw_text(img, "Show fingers on BOTH hands for counting up to 10", (50, instruction_y + 25), (200, 200, 200), 0.7, 2)
-        draw_text(img, "Press 'Q' to quit", (50, instruction_y + 50), (255, 100, 100), 0.6, 1)
+        draw_text(img, "Show fingers on BOTH hands for counting up to 10", (px(50, s), instruction_y + px(25, s)), (200, 200, 200), 0.7, 2, ui_scale=s)
+        draw_text(img, "Press 'Q' to quit", (px(50, s), instruction_y + px(50, s)), (255, 100, 100), 0.6, 1, ui_scale=s)
         
         # Show feedback message with 1.5s fade-out
         if self.show_feedback:
-            import time
-            elapsed = time.time() - self.feedback_started_at
+            elapsed = self.clock.now() - self.feedback_started_at
             if elapsed <= self.feedback_duration:
                 alpha = max(0.0, 1.0 - (elapsed / self.feedback_duration))
-                overlay_fb = img.copy()
-                fb_w, fb_h = 420, 90
+                fb_w, fb_h = px(420, s), px(90, s)
                 fb_x = w//2 - fb_w//2
-                fb_y = h//2 - 110
+                fb_y = h//2 - px(110, s)
+                border = max(1, px(2, s))
+                # Only the rows the panel covers are blended
+                band, overlay_fb, top = panel_overlay(img, self.frame_pool, fb_y - border, fb_y + fb_h + border + 1)
+                y = fb_y - top
                 bg = (self.feedback_color[0]//6, self.feedback_color[1]//6, self.feedback_color[2]//6)
-                cv2.rectangle(overlay_fb, (fb_x, fb_y), (fb_x + fb_w, fb_y + fb_h), bg, -1)
-                cv2.rectangle(overlay_fb, (fb_x, fb_y), (fb_x + fb_w, fb_y + fb_h), self.feedback_color, 2)
-                draw_text(overlay_fb, self.feedback_message, (fb_x + 40, fb_y + 45), self.feedback_color, 1.2, 3)
-                cv2.addWeighted(overlay_fb, alpha, img, 1 - alpha, 0, img)
+                cv2.rectangle(overlay_fb, (fb_x, y), (fb_x + fb_w, y + fb_h), bg, -1)
+                cv2.rectangle(overlay_fb, (fb_x, y), (fb_x + fb_w, y + fb_h), self.feedback_color, border)
+                draw_text(overlay_fb, self.feedback_message, (fb_x + px(40, s), y + px(45, s)), self.feedback_color, 1.2, 3, ui_scale=s)
+                cv2.addWeighted(overlay_fb, alpha, band, 1 - alpha, 0, band)
             else:
                 self.show_feedback = False
         
         # Level indicator
         level_text = "⭐" * self.level
-        draw_text(img, f"Level {self.level}: {level_text}", (w//2 - 80, h - 25), (255, 215, 0), 0.8, 2)
+        draw_text(img, f"Level {self.level}: {level_text}", (w//2 - px(80, s), h - px(25, s)), (255, 215, 0), 0.8, 2, ui_scale=s)
         
         # Game completion check
         if self.score >= 100:  # Complete game at 100 points
             self.game_complete = True
             # Draw completion message
-            completion_overlay = img.copy()
-            cv2.rectangle(completion_overlay, (0, 0), (w, h), (0, 0, 0), -1)
-            cv2.addWeighted(completion_overlay, 0.6, img, 0.4, 0, img)
+            darken(img, 0.6)
             
-            draw_text(img, "🎉 வாழ்த்துகள்! 🎉", (w//2 - 250, h//2 - 50), (255, 215, 0), 1.5, 4)
-            draw_text(img, "Finger Counting Master!", (w//2 - 150, h//2), (255, 255, 255), 1.0, 2)
-            draw_text(img, f"Final Score: {self.score} points", (w//2 - 120, h//2 + 40), (255, 215, 0), 1.0, 2)
-            draw_text(img, "Press 'Q' to return to menu", (w//2 - 150, h//2 + 80), (200, 200, 200), 0.8, 2)
+            draw_text(img, "🎉 வாழ்த்துகள்! 🎉", (w//2 - px(250, s), h//2 - px(50, s)), (255, 215, 0), 1.5, 4, ui_scale=s)
+            draw_text(img, "Finger Counting Master!", (w//2 - px(150, s), h//2), (255, 255, 255), 1.0, 2, ui_scale=s)
+            draw_text(img, f"Final Score: {self.score} points", (w//2 - px(120, s), h//2 + px(40, s)), (255, 215, 0), 1.0, 2, ui_scale=s)
+            draw_text(img, "Press 'Q' to return to menu", (w//2 - px(150, s), h//2 + px(80, s)), (200, 200, 200), 0.8, 2, ui_scale=s)
     
     def handle_game_logic(self, img):
         h, w = img.shape[:2]
+        s = self.ui_scale
+        dt = self.clock.tick()
         
         # Get finger count from both hands
         total_fingers, hand_finger_counts = self.hand_tracker.count_all_fingers(img)
@@ -573,140 +673,84 @@ class FingerCountGame:
             detection_color = (0, 255, 0) if total_fingers == self.current_target else (100, 100, 255)
             
             if num_hands == 1:
-                draw_text(img, f"Hand 1: {hand_finger_counts[0]} fingers", (50, 120), detection_color, 0.8, 2)
-                draw_text(img, f"Total: {total_fingers}", (50, 145), detection_color, 0.9, 2)
+                draw_text(img, f"Hand 1: {hand_finger_counts[0]} fingers", (px(50, s), px(120, s)), detection_color, 0.8, 2, ui_scale=s)
+                draw_text(img, f"Total: {total_fingers}", (px(50, s), px(145, s)), detection_color, 0.9, 2, ui_scale=s)
             else:
-                draw_text(img, f"Left: {hand_finger_counts[0]}, Right: {hand_finger_counts[1] if len(hand_finger_counts) > 1 else 0}", (50, 120), detection_color, 0.8, 2)
-                draw_text(img, f"Total: {total_fingers}", (50, 145), detection_color, 0.9, 2)
+                draw_text(img, f"Left: {hand_finger_counts[0]}, Right: {hand_finger_counts[1] if len(hand_finger_counts) > 1 else 0}", (px(50, s), px(120, s)), detection_color, 0.8, 2, ui_scale=s)
+                draw_text(img, f"Total: {total_fingers}", (px(50, s), px(145, s)), detection_color, 0.9, 2, ui_scale=s)
             
             # Show confidence meter
             conf_color = (0, int(255 * confidence), int(255 * (1 - confidence)))
-            draw_text(img, f"Confidence: {confidence:.1f}", (w-250, 120), conf_color, 0.7, 2)
+            draw_text(img, f"Confidence: {confidence:.1f}", (w - px(250, s), px(120, s)), conf_color, 0.7, 2, ui_scale=s)
             
             # Check for correct count with stability requirement
             if total_fingers == self.current_target and confidence > 0.6:  # Lower threshold for multi-hand
-                self.stable_count_frames += 1
+                self.hold.hold(dt)
                 
                 # Draw progress bar for stability
-                progress = min(self.stable_count_frames / self.required_stable_frames, 1.0)
-                bar_width = 300
+                progress = self.hold.progress
+                bar_width = px(300, s)
                 bar_x = w//2 - bar_width//2
-                bar_y = h//2 - 50
+                bar_y = h//2 - px(50, s)
                 
                 # Progress bar background
-                cv2.rectangle(img, (bar_x, bar_y), (bar_x + bar_width, bar_y + 25), (50, 50, 50), -1)
-                cv2.rectangle(img, (bar_x, bar_y), (bar_x + int(bar_width * progress), bar_y + 25), (0, 255, 0), -1)
-                draw_text(img, "Hold steady...", (bar_x + 100, bar_y - 15), (255, 255, 255), 0.7, 2)
+                cv2.rectangle(img, (bar_x, bar_y), (bar_x + bar_width, bar_y + px(25, s)), (50, 50, 50), -1)
+                cv2.rectangle(img, (bar_x, bar_y), (bar_x + int(bar_width * progress), bar_y + px(25, s)), (0, 255, 0), -1)
+                draw_text(img, "Hold steady...", (bar_x + px(100, s), bar_y - px(15, s)), (255, 255, 255), 0.7, 2, ui_scale=s)
                 
-                if self.stable_count_frames >= self.required_stable_frames:
+                if self.hold.done:
                     # Success!
-                    import time
-                    current_time = time.time()
+                    current_time = self.clock.now()
                     if current_time - self.last_correct_time > 2:  # Prevent rapid scoring
                         self.score += 10 * self.level  # Higher score for higher levels
                         
                         # Show success feedback (fade out in 1.5s)
-                        self.feedback_message = "சரி!"
+                        self.feedback_message = CORRECT_PREFIX
                         self.feedback_color = (0, 255, 0)
                         self.show_feedback = True
                         self.feedback_started_at = current_time
                         self.feedback_duration = 1.5
                         
-                        # Play success sound (if available)
-                        try:
-                            play_sound(f"சரி! {self.tamil_numbers[self.current_target]}")
-                        except:
-                            print(f"Correct! {self.tamil_numbers[self.current_target]}")
+                        # Queue success speech (non-blocking, never stalls the camera thread)
+                        speak(correct_number_phrase(self.current_target))
                         
                         # Generate next challenge with expanded range
                         if self.score > 0 and self.score % 50 == 0:  # Level up every 50 points
                             self.level = min(self.level + 1, 3)  # Max level 3
                         
                         # Set difficulty based on level - now up to 10!
-                        import random
                         if self.level == 1:
-                            self.current_target = random.randint(1, 5)
+                            self.current_target = self.rng.randint(1, 5)
                         elif self.level == 2:
-                            self.current_target = random.randint(3, 8)
+                            self.current_target = self.rng.randint(3, 8)
                         else:
-                            self.current_target = random.randint(5, 10)  # Full range!
+                            self.current_target = self.rng.randint(5, 10)  # Full range!
                         
-                        self.stable_count_frames = 0
+                        self.hold.reset()
                         self.last_correct_time = current_time
                         
                         print(f"Correct! New target: {self.current_target} ({self.tamil_numbers[self.current_target]})")
             else:
-                self.stable_count_frames = max(0, self.stable_count_frames - 2)  # Faster decay when wrong
+                self.hold.release(dt, rate=2.0)  # Faster decay when wrong
         else:
-            self.stable_count_frames = max(0, self.stable_count_frames - 1)
-            draw_text(img, "Show your hands clearly", (50, 120), (255, 100, 100), 0.9, 2)
-            draw_text(img, "Use BOTH hands to count up to 10!", (50, 145), (255, 200, 100), 0.8, 2)
+            self.hold.release(dt)
+            draw_text(img, "Show your hands clearly", (px(50, s), px(120, s)), (255, 100, 100), 0.9, 2, ui_scale=s)
+            draw_text(img, "Use BOTH hands to count up to 10!", (px(50, s), px(145, s)), (255, 200, 100), 0.8, 2, ui_scale=s)
 
-def game_finger_count():
+def game_finger_count(presenter=None):
     print("[Game] Starting Tamil Finger Counting...")
+    from game_host import open_capture, run_game
+    from presenter import HighGUIPresenter
     
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-    cap.set(cv2.CAP_PROP_FPS, 30)
-    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-    
+    cap = open_capture(0, 1280, 720, 30)
     # Anti-shutter settings
     cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)
     cap.set(cv2.CAP_PROP_EXPOSURE, -6)
     
-    # Camera warmup
-    for _ in range(10):
-        cap.read()
-    
-    # Frame smoothing
-    prev_frame = None
-    frame_alpha = 0.7
-    
     game = FingerCountGame()
-    game_initialized = False
-    
-    while True:
-        ret, img = cap.read()
-        if not ret:
-            continue
-        
-        # Frame smoothing to reduce shutter
-        if prev_frame is not None:
-            img = cv2.addWeighted(img, frame_alpha, prev_frame, 1 - frame_alpha, 0)
-        prev_frame = img.copy()
-        
-        img = cv2.flip(img, 1)
-        h, w = img.shape[:2]
-        
-        # Initialize game on first frame
-        if not game_initialized:
-            game.setup_game(w, h)
-            game_initialized = True
-        
-        # Process hand tracking
-        img = game.hand_tracker.find_hands(img, draw=True)
-        
-        # Handle game logic
-        game.handle_game_logic(img)
-        
-        # Draw game UI
-        game.draw_game_ui(img)
-        
-        cv2.imshow("Tamil Finger Counting Game", img)
-        
-        # Small delay to prevent excessive CPU usage
-        import time
-        time.sleep(0.03)
-        
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord('q') or game.game_complete:
-            if game.game_complete:
-                cv2.waitKey(3000)  # Show completion message for 3 seconds
-            break
-    
-    cap.release()
-    cv2.destroyAllWindows()
+    presenter = presenter or HighGUIPresenter("Tamil Finger Counting Game")
+    # Small delay between frames to prevent excessive CPU usage
+    run_game(game, presenter, source=cap, frame_alpha=0.7, warmup=10, frame_delay=0.03, linger=3.0)
     print(f"Game ended. Final score: {game.score}, Level reached: {game.level}")
 
 # math imported at top
@@ -714,227 +758,201 @@ def game_finger_count():
 
 class ColorRecognitionGame:
     """Color Recognition Game - Show a target color; user points at that color in camera view"""
+    # Classifies camera pixels, so input traces must carry frames (see input_trace.py)
+    reads_pixels = True
 
-    def __init__(self):
+    def __init__(self, seed=None, clock=None):
         self.hand_tracker = HandTracker(max_hands=1, detection_confidence=0.7, tracking_confidence=0.7)
-        # HSV ranges for common colors (H:0-179, S/V:0-255)
-        # Each entry has one or more ranges to cover hue wrap (e.g., red)
-        self.color_ranges = [
-            {"name": "RED", "ranges": [((0, 120, 80), (10, 255, 255)), ((160, 120, 80), (179, 255, 255))], "bgr": (0, 0, 255)},
-            {"name": "GREEN", "ranges": [((35, 80, 80), (85, 255, 255))], "bgr": (0, 200, 0)},
-            {"name": "BLUE", "ranges": [((90, 80, 80), (130, 255, 255))], "bgr": (255, 0, 0)},
-            {"name": "YELLOW", "ranges": [((20, 120, 120), (35, 255, 255))], "bgr": (0, 255, 255)},
-            {"name": "ORANGE", "ranges": [((10, 120, 120), (20, 255, 255))], "bgr": (0, 165, 255)},
-            {"name": "PURPLE", "ranges": [((130, 60, 60), (160, 255, 255))], "bgr": (255, 0, 255)},
-        ]
-
-        import random
-        self.target = random.choice(self.color_ranges)
+        self.rng = random.Random(seed)
+        # HSV ranges for common colors, and a BGR -> colour index table built from them
+        self.color_ranges = COLOR_RANGES
+        self.color_lut = get_color_lut()
+        # The tint mask is classified on every tint_step-th pixel in each direction
+        self.tint_step = 4
+
+        self.target = self.rng.choice(self.color_ranges)
         self.score = 0
         self.rounds_done = 0
         self.total_rounds = 6
-        self.stable_frames = 0
-        self.required_stable_frames = 15
+        self.clock = clock if clock is not None else GameClock()
+        # The pointer must stay on the colour for this long (15 frames at 30 FPS)
+        self.hold = HoldTimer(0.5)
         self.show_feedback = False
         self.feedback_message = ""
         self.feedback_color = (0, 255, 0)
         self.feedback_started_at = 0.0
         self.feedback_duration = 1.5
         self.game_complete = False
+        self.ui_scale = 1.0
+        self.quality = QualityGovernor()
+        self.frame_pool = FramePool()  # GameHost replaces it with the pipeline's pool
 
     def setup_game(self, img_w, img_h):
         self.img_w = img_w
         self.img_h = img_h
+        self.ui_scale = layout_scale(img_w, img_h)
+
+    def register_effects(self, governor):
+        self.quality = governor
+        governor.register("color_tint", PRIORITY_COLOR_TINT, "target colour tint")
+        governor.register("header_blend", PRIORITY_HEADER_BLEND, "translucent header panel")
 
-    def _matches_target(self, hsv_pixel):
-        h, s, v = int(hsv_pixel[0]), int(hsv_pixel[1]), int(hsv_pixel[2])
-        for low, high in self.target["ranges"]:
-            (lh, ls, lv), (hh, hs, hv) = low, high
-            if lh <= h <= hh and ls <= s <= hs and lv <= v <= hv:
-                return True
-        return False
+    def _target_index(self):
+        return self.color_ranges.index(self.target)
+
+    def _matches_target(self, patch):
+        """True if most pixels of the fingertip patch classify as the target colour"""
+        classes = classify_image(self.color_lut, patch)
+        return np.count_nonzero(classes == self._target_index()) * 2 >= classes.size
+
+    def _draw_target_tint(self, img):
+        """Tint pixels of the target colour; classified on a subsampled frame, mask upsampled"""
+        h, w = img.shape[:2]
+        step = self.tint_step
+        small = img[::step, ::step]
+        mask = (classify_image(self.color_lut, small) == self._target_index()).astype(np.uint8) * 255
+        if not mask.any():
+            return
+        # Light blur at low resolution softens speckle before upsampling
+        mask = cv2.blur(mask, (3, 3))
+        mask = cv2.resize(mask, (w, h), dst=self.frame_pool.get("tint_mask", (h, w), depth=1),
+                          interpolation=cv2.INTER_LINEAR)
+        cv2.threshold(mask, 127, 255, cv2.THRESH_BINARY, dst=mask)
+        tint = tuple(0.15 * c for c in self.target["bgr"]) + (0,)
+        cv2.add(img, tint, dst=img, mask=mask)
 
     def _choose_next_target(self):
-        import random
         # Avoid repeating same target back-to-back
         options = [c for c in self.color_ranges if c["name"] != self.target["name"]]
-        self.target = random.choice(options) if options else random.choice(self.color_ranges)
+        self.target = self.rng.choice(options) if options else self.rng.choice(self.color_ranges)
 
     def draw_game_ui(self, img):
         h, w = img.shape[:2]
+        s = self.ui_scale
         # Header
-        header = img.copy()
-        cv2.rectangle(header, (0, 0), (w, 110), (25, 35, 55), -1)
-        cv2.addWeighted(header, 0.8, img, 0.2, 0, img)
-        draw_text(img, "Color Recognition Game", (w//2 - 180, 35), (255, 215, 0), 1.2, 3)
+        draw_header_panel(img, px(110, s), (25, 35, 55), 0.8, self.quality.enabled("header_blend"),
+                          pool=self.frame_pool)
+        draw_text(img, "Color Recognition Game", (w//2 - px(180, s), px(35, s)), (255, 215, 0), 1.2, 3, ui_scale=s)
 
         # Target panel
-        draw_text(img, f"Find: {self.target['name']}", (50, 80), (255, 255, 255), 0.9, 2)
-        cv2.rectangle(img, (200, 52), (260, 92), self.target["bgr"], -1)
-        draw_text(img, f"Score: {self.score}", (w - 220, 60), (255, 255, 255), 0.8, 2)
-        draw_text(img, f"Round: {self.rounds_done}/{self.total_rounds}", (w - 260, 85), (255, 255, 255), 0.7, 1)
+        draw_text(img, f"Find: {self.target['name']}", (px(50, s), px(80, s)), (255, 255, 255), 0.9, 2, ui_scale=s)
+        cv2.rectangle(img, (px(200, s), px(52, s)), (px(260, s), px(92, s)), self.target["bgr"], -1)
+        draw_text(img, f"Score: {self.score}", (w - px(220, s), px(60, s)), (255, 255, 255), 0.8, 2, ui_scale=s)
+        draw_text(img, f"Round: {self.rounds_done}/{self.total_rounds}", (w - px(260, s), px(85, s)), (255, 255, 255), 0.7, 1, ui_scale=s)
 
         # Instructions footer
-        footer_y = h - 80
+        footer_y = h - px(80, s)
         cv2.rectangle(img, (0, footer_y), (w, h), (30, 30, 30), -1)
-        draw_text(img, "Point your index finger at something that matches the color", (50, footer_y + 25), (200, 200, 200), 0.7, 2)
-        draw_text(img, "Press 'Q' to quit", (50, footer_y + 50), (255, 100, 100), 0.6, 1)
+        draw_text(img, "Point your index finger at something that matches the color", (px(50, s), footer_y + px(25, s)), (200, 200, 200), 0.7, 2, ui_scale=s)
+        draw_text(img, "Press 'Q' to quit", (px(50, s), footer_y + px(50, s)), (255, 100, 100), 0.6, 1, ui_scale=s)
 
         # Feedback fade overlay
         if self.show_feedback:
-            import time
-            elapsed = time.time() - self.feedback_started_at
+            elapsed = self.clock.now() - self.feedback_started_at
             if elapsed <= self.feedback_duration:
                 alpha = max(0.0, 1.0 - (elapsed / self.feedback_duration))
-                ov = img.copy()
-                panel_w, panel_h = 480, 90
-                px = w//2 - panel_w//2
-                py = h//2 - 120
+                panel_w, panel_h = px(480, s), px(90, s)
+                panel_x = w//2 - panel_w//2
+                panel_y = h//2 - px(120, s)
+                border = max(1, px(2, s))
+                band, ov, top = panel_overlay(img, self.frame_pool, panel_y - border, panel_y + panel_h + border + 1)
+                y = panel_y - top
                 bg = (self.feedback_color[0]//6, self.feedback_color[1]//6, self.feedback_color[2]//6)
-                cv2.rectangle(ov, (px, py), (px + panel_w, py + panel_h), bg, -1)
-                cv2.rectangle(ov, (px, py), (px + panel_w, py + panel_h), self.feedback_color, 2)
-                draw_text(ov, self.feedback_message, (px + 30, py + 45), self.feedback_color, 1.0, 3)
-                cv2.addWeighted(ov, alpha, img, 1 - alpha, 0, img)
+                cv2.rectangle(ov, (panel_x, y), (panel_x + panel_w, y + panel_h), bg, -1)
+                cv2.rectangle(ov, (panel_x, y), (panel_x + panel_w, y + panel_h), self.feedback_color, border)
+                draw_text(ov, self.feedback_message, (panel_x + px(30, s), y + px(45, s)), self.feedback_color, 1.0, 3, ui_scale=s)
+                cv2.addWeighted(ov, alpha, band, 1 - alpha, 0, band)
             else:
                 self.show_feedback = False
 
         # Completion overlay
         if self.game_complete:
-            ov2 = img.copy()
-            cv2.rectangle(ov2, (0, 0), (w, h), (0, 0, 0), -1)
-            cv2.addWeighted(ov2, 0.6, img, 0.4, 0, img)
-            draw_text(img, "Great job!", (w//2 - 100, h//2 - 40), (0, 255, 255), 1.2, 3)
-            draw_text(img, f"Final Score: {self.score}", (w//2 - 120, h//2), (255, 255, 255), 1.0, 2)
-            draw_text(img, "Press 'Q' to return to menu", (w//2 - 150, h//2 + 40), (200, 200, 200), 0.8, 2)
+            darken(img, 0.6)
+            draw_text(img, "Great job!", (w//2 - px(100, s), h//2 - px(40, s)), (0, 255, 255), 1.2, 3, ui_scale=s)
+            draw_text(img, f"Final Score: {self.score}", (w//2 - px(120, s), h//2), (255, 255, 255), 1.0, 2, ui_scale=s)
+            draw_text(img, "Press 'Q' to return to menu", (w//2 - px(150, s), h//2 + px(40, s)), (200, 200, 200), 0.8, 2, ui_scale=s)
 
     def handle_game_logic(self, img):
         if self.game_complete:
             return
         h, w = img.shape[:2]
+        dt = self.clock.tick()
 
         # Draw target color mask softly (optional visual aid)
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
-        mask_total = None
-        for low, high in self.target["ranges"]:
-            m = cv2.inRange(hsv, low, high)
-            mask_total = m if mask_total is None else cv2.bitwise_or(mask_total, m)
-        if mask_total is not None:
-            mask_blur = cv2.GaussianBlur(mask_total, (21, 21), 0)
-            colored = (np.dstack([mask_blur]*3) // 255) * np.array(self.target["bgr"], dtype=np.uint8)
-            img[:] = cv2.addWeighted(img, 1.0, colored, 0.15, 0)
+        if self.quality.enabled("color_tint"):
+            self._draw_target_tint(img)
         # Use index finger tip as pointer (hand landmarks already computed in caller via find_hands)
         # Here we only extract landmarks from existing results without re-running detection
         landmarks = self.hand_tracker.get_landmarks(img)
         p = self.hand_tracker.get_index_finger_tip(landmarks)
         if p is not None:
+            s = self.ui_scale
             x, y = int(p[0]), int(p[1])
-            cv2.circle(img, (x, y), 8, (0, 255, 255), -1)
-            # Sample local average color around pointer to reduce noise
-            x0, y0 = max(0, x - 4), max(0, y - 4)
-            x1, y1 = min(w - 1, x + 4), min(h - 1, y + 4)
-            patch = img[y0:y1 + 1, x0:x1 + 1]
+            # Sample local average color around pointer to reduce noise (before the cursor covers it)
+            r = max(2, px(4, s))
+            x0, y0 = max(0, x - r), max(0, y - r)
+            x1, y1 = min(w - 1, x + r), min(h - 1, y + r)
+            patch = img[y0:y1 + 1, x0:x1 + 1].copy()
+            cv2.circle(img, (x, y), px(8, s), (0, 255, 255), -1)
             if patch.size > 0:
-                hsv_px = cv2.cvtColor(patch, cv2.COLOR_BGR2HSV)
-                mean_hsv = hsv_px.reshape(-1, 3).mean(axis=0)
-                if self._matches_target(mean_hsv):
-                    self.stable_frames += 1
-                    cv2.putText(img, "MATCH", (x + 12, y - 12), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+                if self._matches_target(patch):
+                    self.hold.hold(dt)
+                    cv2.putText(img, "MATCH", (x + px(12, s), y - px(12, s)), cv2.FONT_HERSHEY_SIMPLEX, 0.6 * s, (0, 255, 0), max(1, px(2, s)))
                 else:
-                    self.stable_frames = max(0, self.stable_frames - 2)
+                    self.hold.release(dt, rate=2.0)
         else:
             # No hand
-            self.stable_frames = max(0, self.stable_frames - 1)
+            self.hold.release(dt)
 
         # Success condition
-        if self.stable_frames >= self.required_stable_frames:
-            import time
+        if self.hold.done:
             self.score += 10
             self.rounds_done += 1
             self.feedback_message = f"Correct! That's {self.target['name']}"
             self.feedback_color = (0, 255, 0)
             self.show_feedback = True
-            self.feedback_started_at = time.time()
+            self.feedback_started_at = self.clock.now()
             self.feedback_duration = 1.5
-            self.stable_frames = 0
+            self.hold.reset()
             if self.rounds_done >= self.total_rounds:
                 self.game_complete = True
             else:
                 self._choose_next_target()
 
-def game_color_recognition():
+def game_color_recognition(presenter=None):
     print("[Game] Starting Color Recognition...")
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-    cap.set(cv2.CAP_PROP_FPS, 30)
-    for _ in range(8):
-        cap.read()
+    from game_host import run_game
+    from presenter import HighGUIPresenter
+    
     game = ColorRecognitionGame()
-    prev = None
-    alpha = 0.75
-    init = False
-    while True:
-        ret, img = cap.read()
-        if not ret or img is None:
-            continue
-        if prev is not None and prev.shape == img.shape:
-            img = cv2.addWeighted(img, alpha, prev, 1-alpha, 0)
-        prev = img.copy()
-        img = cv2.flip(img, 1)
-        h, w = img.shape[:2]
-        if not init:
-            game.setup_game(w, h)
-            init = True
-        img = game.hand_tracker.find_hands(img, draw=True)
-        game.handle_game_logic(img)
-        game.draw_game_ui(img)
-        cv2.imshow("Color Recognition Game", img)
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord('q') or game.game_complete:
-            if game.game_complete:
-                cv2.waitKey(2000)
-            break
-    cap.release()
-    cv2.destroyAllWindows()
-
-
-class Mosquito:
-    """Mosquito class for the mosquito killing game"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.alive = True
-        self.speed = 2
-
-    def move(self, width, height):
-        """Move mosquito randomly within bounds"""
-        if self.alive:
-            import random
-            self.x += random.randint(-self.speed * 5, self.speed * 5)
-            self.y += random.randint(-self.speed * 5, self.speed * 5)
-            self.x = max(25, min(width - 25, self.x))
-            self.y = max(25, min(height - 25, self.y))
+    presenter = presenter or HighGUIPresenter("Color Recognition Game")
+    run_game(game, presenter, width=1280, height=720, fps=30, frame_alpha=0.75, warmup=8, linger=2.0)
 
 
 class MosquitoKillGame:
     """Tamil Mosquito Killing Game - Learn numbers by killing mosquitoes with pinch gestures"""
     
-    def __init__(self):
+    def __init__(self, difficulty="easy", seed=None, clock=None):
         self.hand_tracker = HandTracker(max_hands=2)
-        self.mosquitoes = []
+        # Difficulty picks the wave sizes and mosquito speed; seed makes the swarm repeatable
+        self.difficulty = difficulty if difficulty in DIFFICULTY_LEVELS else "easy"
+        self.level = DIFFICULTY_LEVELS[self.difficulty]
+        self.swarm = MosquitoSwarm(np.random.default_rng(seed))
+        self.wave = 0
         self.kill_count = 0
         self.start_time = 0
         self.game_complete = False
         self.game_started = False
-        self.total_mosquitoes = 10
+        self.total_mosquitoes = sum(self.level["waves"])
         self.game_width = 800
         self.game_height = 600
+        self.ui_scale = 1.0
+        self.quality = QualityGovernor()
+        self.frame_pool = FramePool()  # GameHost replaces it with the pipeline's pool
+        self.clock = clock if clock is not None else GameClock()
         
         # Tamil numbers for feedback
-        self.tamil_numbers = [
-            "ஒன்று", "இரண்டு", "மூன்று", "நான்கு", "ஐந்து", 
-            "ஆறு", "ஏழு", "எட்டு", "ஒன்பது", "பத்து"
-        ]
+        self.tamil_numbers = list(TAMIL_NUMBERS)
         
         # Game state
         self.last_kill_time = 0
@@ -945,26 +963,35 @@ class MosquitoKillGame:
         """Initialize game with screen dimensions"""
         self.game_width = width
         self.game_height = height
+        self.ui_scale = layout_scale(width, height)
         self.start_new_game()
+
+    def register_effects(self, governor):
+        self.quality = governor
+        governor.register("landmarks", PRIORITY_LANDMARKS, "hand skeleton overlay")
         
     def start_new_game(self):
         """Start a new mosquito killing game"""
-        import random
-        import time
-        
-        self.mosquitoes = []
-        for _ in range(self.total_mosquitoes):
-            x = random.randint(50, self.game_width - 50)
-            y = random.randint(100, self.game_height - 100)
-            self.mosquitoes.append(Mosquito(x, y))
-        
+        self.wave = 0
+        self.spawn_wave()
         self.kill_count = 0
-        self.start_time = time.time()
+        self.start_time = self.clock.now()
         self.game_complete = False
         self.game_started = True
         self.kill_message = ""
         self.kill_message_timer = 0
         print("Mosquito killing game started!")
+
+    def spawn_wave(self):
+        """Fill the play area with the current wave"""
+        s = self.ui_scale
+        bounds = (px(50, s), px(100, s), self.game_width - px(50, s), self.game_height - px(100, s))
+        self.swarm.spawn(self.level["waves"][self.wave], bounds,
+                         self.level["speed"] * s, self.level["jitter"] * s)
+        get_telemetry().emit("wave", wave=self.wave + 1, waves=len(self.level["waves"]), mosquitoes=len(self.swarm),
+                             game_time=round(self.clock.now(), 2))
+        if DEBUG:
+            print(f"Wave {self.wave + 1}/{len(self.level['waves'])}: {len(self.swarm)} mosquitoes")
         
     def is_pinch_gesture(self, hand_landmarks):
         """Detect pinch gesture between index finger and thumb"""
@@ -988,201 +1015,408 @@ class MosquitoKillGame:
         if not self.game_started or self.game_complete:
             return
             
-        import time
+        # Move the whole swarm once per fixed simulation step (same speed at any FPS)
+        self.clock.tick()
+        for _ in range(self.clock.steps):
+            self.swarm.step()
         
-        # Move all mosquitoes
-        for mosquito in self.mosquitoes:
-            mosquito.move(self.game_width, self.game_height)
-        
-        # Process hand landmarks for pinch detection
+        # Fingertips of every pinching hand, resolved against the swarm at once
+        pinch_points = []
         if self.hand_tracker.results and self.hand_tracker.results.multi_hand_landmarks:
             for hand_landmarks in self.hand_tracker.results.multi_hand_landmarks:
                 is_pinching, index_tip = self.is_pinch_gesture(hand_landmarks)
-                
                 if is_pinching and index_tip:
                     # Convert normalized coordinates to pixel coordinates
-                    ix = int(index_tip.x * self.game_width)
-                    iy = int(index_tip.y * self.game_height)
-                    
-                    # Check collision with mosquitoes
-                    for mosquito in self.mosquitoes:
-                        if (mosquito.alive and 
-                            abs(ix - mosquito.x) < 40 and 
-                            abs(iy - mosquito.y) < 40):
-                            
-                            mosquito.alive = False
-                            self.kill_count += 1
-                            
-                            # Set kill message with Tamil number
-                            if self.kill_count <= len(self.tamil_numbers):
-                                tamil_num = self.tamil_numbers[self.kill_count - 1]
-                                self.kill_message = f"{tamil_num} - Mosquito {self.kill_count} Killed!"
-                            else:
-                                self.kill_message = f"Mosquito {self.kill_count} Killed!"
-                            
-                            self.kill_message_timer = time.time()
-                            print(f"Mosquito killed! Count: {self.kill_count}")
-                            break
+                    pinch_points.append((index_tip.x * self.game_width, index_tip.y * self.game_height))
+        
+        if pinch_points:
+            killed = self.swarm.hit(pinch_points, px(40, self.ui_scale))
+            for _ in killed:
+                self.kill_count += 1
+                # Set kill message with Tamil number
+                if self.kill_count <= len(self.tamil_numbers):
+                    tamil_num = self.tamil_numbers[self.kill_count - 1]
+                    self.kill_message = f"{tamil_num} - Mosquito {self.kill_count} Killed!"
+                else:
+                    self.kill_message = f"Mosquito {self.kill_count} Killed!"
+                self.kill_message_timer = self.clock.now()
+            if len(killed):
+                get_telemetry().emit("mosquito_killed", count=self.kill_count, game_time=round(self.clock.now(), 2))
+                if DEBUG:
+                    print(f"Mosquito killed! Count: {self.kill_count}")
+        
+        # Next wave once this one is cleared
+        if self.swarm.alive_count == 0 and self.wave + 1 < len(self.level["waves"]):
+            self.wave += 1
+            self.spawn_wave()
         
         # Check for game completion
         if self.kill_count >= self.total_mosquitoes:
             self.game_complete = True
-            elapsed_time = time.time() - self.start_time
+            elapsed_time = self.clock.now() - self.start_time
             print(f"All mosquitoes killed in {elapsed_time:.1f} seconds!")
             
     def draw_game_ui(self, img):
         """Draw game interface and mosquitoes"""
         import cv2
-        import time
+        s = self.ui_scale
+        font = cv2.FONT_HERSHEY_SIMPLEX
         
         if not self.game_started:
             # Draw start screen
             cv2.putText(img, "Tamil Mosquito Killing Game", 
-                       (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 255), 2)
+                       (px(50, s), px(100, s)), font, 1.2 * s, (0, 255, 255), max(1, px(2, s)))
             cv2.putText(img, "Pinch fingers to kill mosquitoes!", 
-                       (50, 150), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                       (px(50, s), px(150, s)), font, 0.8 * s, (255, 255, 255), max(1, px(2, s)))
             cv2.putText(img, "Learn Tamil numbers 1-10", 
-                       (50, 200), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                       (px(50, s), px(200, s)), font, 0.8 * s, (255, 255, 255), max(1, px(2, s)))
             return
             
-        # Draw mosquitoes
-        alive_count = 0
-        for mosquito in self.mosquitoes:
-            if mosquito.alive:
-                alive_count += 1
-                # Draw mosquito as a red circle with wings
-                cv2.circle(img, (mosquito.x, mosquito.y), 15, (0, 0, 255), -1)
-                # Add small wings
-                cv2.ellipse(img, (mosquito.x - 10, mosquito.y - 5), (8, 4), 0, 0, 360, (100, 100, 100), -1)
-                cv2.ellipse(img, (mosquito.x + 10, mosquito.y - 5), (8, 4), 0, 0, 360, (100, 100, 100), -1)
+        # Draw the whole swarm in one batched blit (red body with two wings)
+        alive_count = self.swarm.alive_count
+        blit_many(img, get_atlas().get("mosquito", round(s, 2)), self.swarm.live_positions())
                 
         # Draw hand landmarks and pinch indicator
         if self.hand_tracker.results and self.hand_tracker.results.multi_hand_landmarks:
             for hand_landmarks in self.hand_tracker.results.multi_hand_landmarks:
                 # Draw hand landmarks
-                self.hand_tracker.mp_draw.draw_landmarks(
-                    img, hand_landmarks, self.hand_tracker.mp_hands.HAND_CONNECTIONS)
+                if self.quality.enabled("landmarks"):
+                    self.hand_tracker.mp_draw.draw_landmarks(
+                        img, hand_landmarks, self.hand_tracker.mp_hands.HAND_CONNECTIONS)
                 
                 # Check for pinch and draw indicator
                 is_pinching, index_tip = self.is_pinch_gesture(hand_landmarks)
                 if is_pinching and index_tip:
                     ix = int(index_tip.x * self.game_width)
                     iy = int(index_tip.y * self.game_height)
-                    cv2.circle(img, (ix, iy), 20, (0, 255, 0), 3)  # Green pinch indicator
+                    blit(img, get_atlas().get("ring", px(20, s), max(1, px(3, s)), (0, 255, 0)), ix, iy)  # Green pinch indicator
                 
         # Draw game statistics
         cv2.putText(img, f"Killed: {self.kill_count}/{self.total_mosquitoes}", 
-                   (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                   (px(10, s), px(30, s)), font, 0.8 * s, (255, 255, 255), max(1, px(2, s)))
         
-        cv2.putText(img, f"Remaining: {alive_count}", 
-                   (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2)
+        remaining = f"Remaining: {alive_count}"
+        if len(self.level["waves"]) > 1:
+            remaining += f"  Wave {self.wave + 1}/{len(self.level['waves'])}"
+        cv2.putText(img, remaining, 
+                   (px(10, s), px(60, s)), font, 0.8 * s, (255, 255, 0), max(1, px(2, s)))
         
         # Show elapsed time
         if not self.game_complete:
-            elapsed = time.time() - self.start_time
+            elapsed = self.clock.now() - self.start_time
             cv2.putText(img, f"Time: {elapsed:.1f}s", 
-                       (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                       (px(10, s), px(90, s)), font, 0.8 * s, (255, 255, 255), max(1, px(2, s)))
         
         # Draw kill message
-        if self.kill_message and time.time() - self.kill_message_timer < 2.0:
-            cv2.putText(img, self.kill_message, 
-                       (50, 150), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
+        if self.kill_message and self.clock.now() - self.kill_message_timer < 2.0:
+            # draw_text renders the Tamil number (Tamil text is anchored at its top-left)
+            draw_text(img, self.kill_message, (px(50, s), px(125, s)), (0, 255, 0), 1.0, 2, ui_scale=s)
         
         # Draw completion message
         if self.game_complete:
-            elapsed_time = time.time() - self.start_time
+            elapsed_time = self.clock.now() - self.start_time
             cv2.putText(img, f"Excellent! All mosquitoes killed!", 
-                       (50, self.game_height // 2 - 50), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 255), 3)
+                       (px(50, s), self.game_height // 2 - px(50, s)), font, 1.2 * s, (0, 255, 255), max(1, px(3, s)))
             cv2.putText(img, f"Time: {elapsed_time:.1f} seconds", 
-                       (50, self.game_height // 2), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 255), 2)
+                       (px(50, s), self.game_height // 2), font, 1.0 * s, (0, 255, 255), max(1, px(2, s)))
             cv2.putText(img, "Great job learning Tamil numbers!", 
-                       (50, self.game_height // 2 + 50), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 255), 2)
+                       (px(50, s), self.game_height // 2 + px(50, s)), font, 1.0 * s, (0, 255, 255), max(1, px(2, s)))
             
         # Draw Tamil numbers reference
         try:
             from utils import draw_tamil_text
-            y_pos = self.game_height - 120
-            draw_tamil_text(img, "Tamil Numbers:", (10, y_pos), font_size=20, color=(255, 255, 255))
+            y_pos = self.game_height - px(120, s)
+            draw_tamil_text(img, "Tamil Numbers:", (px(10, s), y_pos), font_size=px(20, s), color=(255, 255, 255))
             
             # Show first 5 numbers on one line
             numbers_line1 = " ".join(self.tamil_numbers[:5])
-            draw_tamil_text(img, numbers_line1, (10, y_pos + 30), font_size=16, color=(255, 200, 0))
+            draw_tamil_text(img, numbers_line1, (px(10, s), y_pos + px(30, s)), font_size=px(16, s), color=(255, 200, 0))
             
             # Show next 5 numbers on second line
             numbers_line2 = " ".join(self.tamil_numbers[5:])
-            draw_tamil_text(img, numbers_line2, (10, y_pos + 55), font_size=16, color=(255, 200, 0))
+            draw_tamil_text(img, numbers_line2, (px(10, s), y_pos + px(55, s)), font_size=px(16, s), color=(255, 200, 0))
             
         except Exception as e:
-            print(f"Tamil text rendering error: {e}")
+            get_telemetry().error("draw_tamil_text", e)
             # Fallback to showing numbers in English
             cv2.putText(img, "Learning numbers 1-10 in Tamil", 
-                       (10, self.game_height - 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+                       (px(10, s), self.game_height - px(30, s)), font, 0.6 * s, (255, 255, 255), 1)
 
 
-def game_mosquito_kill():
+def game_mosquito_kill(presenter=None):
     """Standalone function to run mosquito killing game"""
     print("[Game] Starting Tamil Mosquito Killing Game...")
-    
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 800)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 600)
-    cap.set(cv2.CAP_PROP_FPS, 30)
-    
-    # Camera warmup
-    for i in range(10):
-        ret, _ = cap.read()
-    
-    # Frame smoothing variables
-    prev_frame = None
-    frame_alpha = 0.7
+    from game_host import run_game
+    from presenter import HighGUIPresenter
     
     game = MosquitoKillGame()
-    game_initialized = False
-    
-    while True:
-        ret, img = cap.read()
-        if not ret:
-            continue
-        
-        # Frame smoothing to reduce shutter
-        if prev_frame is not None:
-            img = cv2.addWeighted(img, frame_alpha, prev_frame, 1 - frame_alpha, 0)
-        prev_frame = img.copy()
-        
-        img = cv2.flip(img, 1)
-        h, w = img.shape[:2]
-        
-        # Initialize game on first frame
-        if not game_initialized:
-            game.setup_game(w, h)
-            game_initialized = True
-        
-        # Process hand tracking
-        img = game.hand_tracker.find_hands(img, draw=True)
-        
-        # Handle game logic
-        game.handle_game_logic(img)
-        
-        # Draw game UI
-        game.draw_game_ui(img)
-        
-        cv2.imshow("Tamil Mosquito Killing Game", img)
-        
-        # Small delay to prevent excessive CPU usage
-        import time
-        time.sleep(0.03)
-        
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord('q') or game.game_complete:
-            if game.game_complete:
-                cv2.waitKey(3000)  # Show completion message for 3 seconds
-            break
-    
-    cap.release()
-    cv2.destroyAllWindows()
+    presenter = presenter or HighGUIPresenter("Tamil Mosquito Killing Game")
+    # Small delay between frames to prevent excessive CPU usage
+    run_game(game, presenter, width=800, height=600, fps=30, frame_alpha=0.7, warmup=10,
+             frame_delay=0.03, linger=3.0)
     print(f"Game ended. Final kill count: {game.kill_count}")
 
 
+class AirTraceGame:
+    """Air Tracing Letters - trace a Tamil letter in the air with the index fingertip.
+
+    Each letter's distance field is precomputed at the render size (and cached
+    on disk), so every new stroke point is scored with two lookups; the stroke
+    itself is drawn once, segment by segment, into a persistent layer.
+    """
+
+    def __init__(self, seed=None, clock=None, letters=None):
+        self.hand_tracker = HandTracker(max_hands=1, detection_confidence=0.7, tracking_confidence=0.7)
+        self.rng = random.Random(seed)
+        self.letters = list(letters or TRACE_LETTERS)
+        self.fields = get_letter_fields()
+        self.clock = clock if clock is not None else GameClock()
+        # A fist held this long erases the stroke
+        self.erase_hold = HoldTimer(0.8)
+        # A round is won once the stroke has passed near this much of the letter
+        self.coverage_goal = 0.8
+        self.total_rounds = 5
+        self.rounds_done = 0
+        self.score = 0
+
+        self.letter = None
+        self.next_letter = self.rng.choice(self.letters)
+        self.field = None
+        self.stroke = None
+        self.stroke_layer = None
+        self.stroke_box = None
+        self.last_point = None
+        self.pointer = None
+        self.pen_down = False
+        # After a round the pen must be lifted before the next letter takes ink
+        self.wait_pen_up = False
+
+        self.show_feedback = False
+        self.feedback_message = ""
+        self.feedback_color = (0, 255, 0)
+        self.feedback_started_at = 0.0
+        self.feedback_duration = 1.5
+        self.game_complete = False
+        self.ui_scale = 1.0
+        self.quality = QualityGovernor()
+        self.frame_pool = FramePool()  # GameHost replaces it with the pipeline's pool
+
+    def setup_game(self, img_w, img_h):
+        self.img_w = img_w
+        self.img_h = img_h
+        self.ui_scale = layout_scale(img_w, img_h)
+        self.stroke_layer = np.zeros((img_h, img_w), np.uint8)
+        self._start_round()
+
+    def register_effects(self, governor):
+        self.quality = governor
+        governor.register("header_blend", PRIORITY_HEADER_BLEND, "translucent header panel")
+
+    def letter_box(self):
+        """Area the letter is fitted into: between the header and the footer"""
+        s = self.ui_scale
+        return (px(40, s), px(120, s), self.img_w - px(40, s), self.img_h - px(90, s))
+
+    def _field_for(self, letter):
+        return self.fields.get(letter, (self.img_w, self.img_h), self.letter_box())
+
+    def _start_round(self):
+        self.letter = self.next_letter
+        options = [l for l in self.letters if l != self.letter]
+        self.next_letter = self.rng.choice(options) if options else self.letter
+        self.field = self._field_for(self.letter)
+        self._clear_stroke()
+        # Build (or load) the next letter's field while this one is being traced
+        self.fields.prefetch(self.next_letter, (self.img_w, self.img_h), self.letter_box())
+
+    def _clear_stroke(self):
+        self.stroke = StrokeScore(self.field)
+        if self.stroke_box is not None:
+            x0, y0, x1, y1 = self.stroke_box
+            self.stroke_layer[y0:y1, x0:x1] = 0
+        self.stroke_box = None
+        self.last_point = None
+
+    def _add_segment(self, p0, p1):
+        """Score the points from p0 (exclusive) to p1 and ink the segment; O(segment length)"""
+        x0, y0 = p0
+        x1, y1 = p1
+        # Sample at half the tolerance so no coverage cell is stepped over
+        step = max(1.0, self.field.tolerance / 2.0)
+        n = max(1, int(math.ceil(math.hypot(x1 - x0, y1 - y0) / step)))
+        for i in range(1, n + 1):
+            t = i / n
+            self.stroke.add(int(round(x0 + (x1 - x0) * t)), int(round(y0 + (y1 - y0) * t)))
+
+        thickness = max(2, px(10, self.ui_scale))
+        cv2.line(self.stroke_layer, p0, p1, 255, thickness, cv2.LINE_AA)
+        r = thickness
+        box = (max(0, min(x0, x1) - r), max(0, min(y0, y1) - r),
+               min(self.img_w, max(x0, x1) + r + 1), min(self.img_h, max(y0, y1) + r + 1))
+        if self.stroke_box is None:
+            self.stroke_box = box
+        else:
+            bx0, by0, bx1, by1 = self.stroke_box
+            self.stroke_box = (min(bx0, box[0]), min(by0, box[1]), max(bx1, box[2]), max(by1, box[3]))
+
+    def _finish_round(self):
+        accuracy = self.stroke.accuracy
+        points = 10 if accuracy >= 0.75 else 5
+        self.score += points
+        self.rounds_done += 1
+        get_telemetry().emit("letter_traced", letter=self.letter, coverage=round(self.stroke.coverage, 3),
+                             accuracy=round(accuracy, 3), points=points, game_time=round(self.clock.now(), 2))
+        if points == 10:
+            self.feedback_message = correct_letter_phrase(self.letter)
+        else:
+            self.feedback_message = try_again_letter_phrase(self.letter)
+        self.feedback_color = (0, 255, 0) if points == 10 else (0, 200, 255)
+        self.show_feedback = True
+        self.feedback_started_at = self.clock.now()
+        self.feedback_duration = 1.5
+        speak(self.feedback_message)
+        if self.rounds_done >= self.total_rounds:
+            self.game_complete = True
+        else:
+            self._start_round()
+            self.wait_pen_up = True
+
+    def handle_game_logic(self, img):
+        if self.game_complete or self.field is None:
+            return
+        dt = self.clock.tick()
+        landmarks = self.hand_tracker.get_landmarks(img)
+        p = self.hand_tracker.get_index_finger_tip(landmarks)
+        self.pointer = (int(p[0]), int(p[1])) if p is not None else None
+        states = self.hand_tracker.get_finger_states(landmarks) if landmarks else None
+
+        # Index finger up and middle finger down is a pen on the page; a fist erases
+        pen_down = self.pointer is not None and states is not None and states[1] == 1 and states[2] == 0
+        if states is not None and sum(states) == 0:
+            self.erase_hold.hold(dt)
+        else:
+            self.erase_hold.release(dt)
+        if self.erase_hold.done:
+            self.erase_hold.reset()
+            if self.stroke.points:
+                self._clear_stroke()
+                self.feedback_message = "Erased - try again"
+                self.feedback_color = (255, 200, 0)
+                self.show_feedback = True
+                self.feedback_started_at = self.clock.now()
+                self.feedback_duration = 1.0
+
+        if self.wait_pen_up:
+            self.wait_pen_up = pen_down
+            pen_down = False
+        self.pen_down = pen_down
+        if not pen_down:
+            self.last_point = None
+            return
+
+        if self.last_point is None:
+            self.stroke.add(*self.pointer)
+        elif math.hypot(self.pointer[0] - self.last_point[0], self.pointer[1] - self.last_point[1]) > self.img_h * 0.3:
+            pass  # a tracking jump, not a stroke: start a new segment here
+        else:
+            self._add_segment(self.last_point, self.pointer)
+        self.last_point = self.pointer
+
+        if self.stroke.coverage >= self.coverage_goal:
+            self._finish_round()
+
+    def draw_game_ui(self, img):
+        h, w = img.shape[:2]
+        s = self.ui_scale
+        draw_header_panel(img, px(110, s), (45, 30, 20), 0.8, self.quality.enabled("header_blend"),
+                          pool=self.frame_pool)
+        draw_text(img, "Air Tracing Letters", (w//2 - px(170, s), px(35, s)), (255, 215, 0), 1.2, 3, ui_scale=s)
+        draw_text(img, "Trace:", (px(50, s), px(85, s)), (255, 255, 255), 0.9, 2, ui_scale=s)
+        if self.letter is not None:
+            draw_text(img, self.letter, (px(150, s), px(62, s)), (0, 255, 255), 1.4, 2, ui_scale=s)
+        draw_text(img, f"Score: {self.score}", (w - px(220, s), px(60, s)), (255, 255, 255), 0.8, 2, ui_scale=s)
+        draw_text(img, f"Round: {self.rounds_done}/{self.total_rounds}", (w - px(260, s), px(85, s)), (255, 255, 255), 0.7, 1, ui_scale=s)
+
+        field = self.field
+        if field is not None and not self.game_complete:
+            # Guide letter, then the child's stroke over it (only the stroke's bounding box is touched)
+            ox, oy = field.origin
+            ih, iw = field.ink.shape
+            x0, y0 = max(0, ox), max(0, oy)
+            x1, y1 = min(w, ox + iw), min(h, oy + ih)
+            img[y0:y1, x0:x1][field.ink[y0 - oy:y1 - oy, x0 - ox:x1 - ox]] = (150, 150, 150)
+            if self.stroke_box is not None:
+                x0, y0, x1, y1 = self.stroke_box
+                roi = img[y0:y1, x0:x1]
+                roi[self.stroke_layer[y0:y1, x0:x1] > 127] = (0, 140, 255)
+
+            # Progress toward the coverage goal
+            bar_x, bar_y = w - px(260, s), px(95, s)
+            bar_w, bar_h = px(200, s), px(8, s)
+            done = min(1.0, self.stroke.coverage / self.coverage_goal)
+            cv2.rectangle(img, (bar_x, bar_y), (bar_x + bar_w, bar_y + bar_h), (80, 80, 80), -1)
+            cv2.rectangle(img, (bar_x, bar_y), (bar_x + int(bar_w * done), bar_y + bar_h), (0, 255, 0), -1)
+
+        if self.pointer is not None and not self.game_complete:
+            color = (0, 255, 0) if self.pen_down else (255, 255, 255)
+            cv2.circle(img, self.pointer, px(8, s), color, -1 if self.pen_down else max(1, px(2, s)))
+
+        # Instructions footer
+        footer_y = h - px(80, s)
+        cv2.rectangle(img, (0, footer_y), (w, h), (30, 30, 30), -1)
+        draw_text(img, "Point one finger to draw - open your hand to lift - hold a fist to erase", (px(50, s), footer_y + px(25, s)), (200, 200, 200), 0.6, 2, ui_scale=s)
+        draw_text(img, "Press 'Q' to quit", (px(50, s), footer_y + px(50, s)), (255, 100, 100), 0.6, 1, ui_scale=s)
+
+        # Feedback fade overlay
+        if self.show_feedback:
+            elapsed = self.clock.now() - self.feedback_started_at
+            if elapsed <= self.feedback_duration:
+                alpha = max(0.0, 1.0 - (elapsed / self.feedback_duration))
+                panel_w, panel_h = px(420, s), px(90, s)
+                panel_x = w//2 - panel_w//2
+                panel_y = h//2 - px(120, s)
+                border = max(1, px(2, s))
+                band, ov, top = panel_overlay(img, self.frame_pool, panel_y - border, panel_y + panel_h + border + 1)
+                y = panel_y - top
+                bg = (self.feedback_color[0]//6, self.feedback_color[1]//6, self.feedback_color[2]//6)
+                cv2.rectangle(ov, (panel_x, y), (panel_x + panel_w, y + panel_h), bg, -1)
+                cv2.rectangle(ov, (panel_x, y), (panel_x + panel_w, y + panel_h), self.feedback_color, border)
+                draw_text(ov, self.feedback_message, (panel_x + px(30, s), y + px(55, s)), self.feedback_color, 1.0, 3, ui_scale=s)
+                cv2.addWeighted(ov, alpha, band, 1 - alpha, 0, band)
+            else:
+                self.show_feedback = False
+
+        # Completion overlay
+        if self.game_complete:
+            darken(img, 0.6)
+            draw_text(img, "Great job!", (w//2 - px(100, s), h//2 - px(40, s)), (0, 255, 255), 1.2, 3, ui_scale=s)
+            draw_text(img, f"Final Score: {self.score}", (w//2 - px(120, s), h//2), (255, 255, 255), 1.0, 2, ui_scale=s)
+            draw_text(img, "Press 'Q' to return to menu", (w//2 - px(150, s), h//2 + px(40, s)), (200, 200, 200), 0.8, 2, ui_scale=s)
+
+
+def game_air_trace(presenter=None):
+    print("[Game] Starting Air Tracing Letters...")
+    from game_host import run_game
+    from presenter import HighGUIPresenter
+
+    game = AirTraceGame()
+    presenter = presenter or HighGUIPresenter("Air Tracing Letters")
+    run_game(game, presenter, width=1280, height=720, fps=30, frame_alpha=0.75, warmup=8, linger=2.0)
+
+
+# Game classes by name, for runners that pick a game from the command line.
+# Every entry accepts seed= and clock= keywords.
+GAMES = {
+    "drag_drop": DragDropGame,
+    "drag_drop_board": lambda **kw: DragDropGame(board_pairs=BOARD_DEFAULT_PAIRS, **kw),
+    "finger_count": FingerCountGame,
+    "color": ColorRecognitionGame,
+    "mosquito": MosquitoKillGame,
+    "mosquito_waves": lambda **kw: MosquitoKillGame(difficulty="hard", **kw),
+    "air_trace": AirTraceGame,
+}
+
+
 if __name__ == "__main__":
     print("Tamil Kids Learning Games")
     print("1. Drag-Drop Word Matching")
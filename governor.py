@@ -0,0 +1,108 @@
+# Frame-time governor: turns optional visual effects off when frames run over budget
+from collections import deque
+
+DEBUG = False
+
+# Frame budget for a 30 FPS camera
+DEFAULT_BUDGET_MS = 1000.0 / 30
+
+# Effects registered by the host and the games. Lower priority is shed first.
+PRIORITY_COLOR_TINT = 10
+PRIORITY_HEADER_BLEND = 20
+PRIORITY_CURSOR_PULSE = 30
+PRIORITY_LANDMARKS = 40
+PRIORITY_INPUT_BLUR = 50
+PRIORITY_FRAME_BLEND = 60
+
+
+class QualityGovernor:
+    """Watches frame time and sheds optional effects in priority order.
+
+    The quality tier is the number of effects currently shed (0 = full
+    quality). When the average of the last `window` frames goes over
+    budget * shed_ratio the lowest-priority enabled effect is turned off;
+    when it drops under budget * restore_ratio the last one shed comes back.
+    The gap between the two ratios plus a cooldown after every change keep
+    it from flapping between tiers.
+
+    An effect that was never registered is always enabled, so game code can
+    ask enabled() without caring whether a governor is driving it.
+    """
+
+    def __init__(self, budget_ms=DEFAULT_BUDGET_MS, window=30, shed_ratio=1.1, restore_ratio=0.7, cooldown=60):
+        self.budget_ms = budget_ms
+        self.shed_ratio = shed_ratio
+        self.restore_ratio = restore_ratio
+        self.cooldown = cooldown
+        self.frame_times = deque(maxlen=window)
+        self.effects = {}  # name -> (priority, description)
+        self.shed = []  # names, in the order they were turned off
+        self.frames_since_change = 0
+        self.changes = 0
+
+    def register(self, name, priority, description=""):
+        """Add an optional effect (registering the same name again is a no-op)"""
+        if name not in self.effects:
+            self.effects[name] = (priority, description)
+
+    def enabled(self, name):
+        return name not in self.shed
+
+    @property
+    def tier(self):
+        return len(self.shed)
+
+    @property
+    def average_ms(self):
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+
+    def observe(self, frame_ms):
+        """Record one frame's processing time; may shed or restore one effect"""
+        self.frame_times.append(frame_ms)
+        self.frames_since_change += 1
+        if DEBUG and self.frames_since_change % self.frame_times.maxlen == 0:
+            print(f"Quality tier {self.tier}: avg {self.average_ms:.1f} ms")
+        if len(self.frame_times) < self.frame_times.maxlen or self.frames_since_change < self.cooldown:
+            return
+        avg = self.average_ms
+        if avg > self.budget_ms * self.shed_ratio:
+            candidates = [(p, n) for n, (p, _) in self.effects.items() if n not in self.shed]
+            if candidates:
+                self._change(min(candidates)[1], shed=True, avg=avg)
+        elif avg < self.budget_ms * self.restore_ratio and self.shed:
+            self._change(self.shed[-1], shed=False, avg=avg)
+
+    def _change(self, name, shed, avg):
+        if shed:
+            self.shed.append(name)
+        else:
+            self.shed.remove(name)
+        self.frames_since_change = 0
+        self.changes += 1
+        action = "shed" if shed else "restored"
+        print(f"Quality tier {self.tier}/{len(self.effects)}: {action} {name} "
+              f"(avg {avg:.1f} ms, budget {self.budget_ms:.1f} ms)")
+
+    def set_tier(self, tier):
+        """Start with the `tier` lowest-priority registered effects shed (e.g. from a calibration profile)"""
+        order = [n for _, n in sorted((p, n) for n, (p, _) in self.effects.items())]
+        self.shed[:] = order[:max(0, tier)]
+        self.frame_times.clear()
+        self.frames_since_change = 0
+
+    def reset(self):
+        """Back to full quality, e.g. when a new game starts"""
+        self.shed.clear()
+        self.frame_times.clear()
+        self.frames_since_change = 0
+
+    def status(self):
+        """Diagnostics snapshot"""
+        return {
+            "tier": self.tier,
+            "max_tier": len(self.effects),
+            "shed": list(self.shed),
+            "avg_ms": round(self.average_ms, 2),
+            "budget_ms": round(self.budget_ms, 2),
+            "changes": self.changes,
+        }
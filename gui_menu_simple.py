@@ -7,6 +7,11 @@ import time
 import cv2
 import numpy as np
 import traceback
+from presenter import TkPresenter
+from game_host import GameHost
+from stage_timers import TIMERS, export_trace
+from stream_server import start_from_env
+from calibration import get_profile_store, get_tuning, load_profile, apply_profile, calibrate, camera_matches
 
 # Toggle verbose debug logging here
 DEBUG = False
@@ -36,19 +41,102 @@ class TamilGamesGUI:
         # Bind fullscreen toggle (F11 key)
         self.root.bind('<F11>', self.toggle_fullscreen)
         self.root.bind('<Escape>', self.exit_fullscreen)
+        # Performance HUD (F3) and Chrome trace export of the last seconds (F4)
+        self.root.bind('<F3>', lambda event: TIMERS.toggle_hud())
+        self.root.bind('<F4>', lambda event: export_trace())
+        # Optional localhost stream for a projector or a teacher's window (TAMILGAMES_STREAM=port)
+        self.stream = start_from_env()
         
         # Game state variables
         self.game_running = False
         self.game_canvas = None
-        self.photo = None
-        self.selected_camera = 0  # Default camera index
+        # Game threads hand frames to the presenter; only the Tk main thread draws them
+        self.presenter = None
+        # Camera choice and its calibration profile persist per machine (settings/profiles.json)
+        self.selected_camera = get_profile_store().selected_camera()
+        self.calibration_thread = None
+        self.calibrating_camera = None
+        self.needs_calibration = False
         
         # Handle window closing
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+        # Start the speech worker early so feedback phrases are pre-rendered before play starts
+        try:
+            from speech import get_speech_worker
+            get_speech_worker()
+        except Exception as e:
+            print(f"Speech worker not started: {e}")
+        
         self.create_main_menu()
+        self.load_camera_profile()
+
+    # --- Calibration ---
+    def load_camera_profile(self):
+        """Apply the selected camera's profile; tune in the background on first run or new hardware"""
+        if load_profile(self.selected_camera) is None:
+            self.start_calibration()
+
+    def start_calibration(self):
+        if self.calibration_thread is not None and self.calibration_thread.is_alive():
+            # Another camera is being tuned; this one goes next time the menu comes back
+            self.needs_calibration = self.calibrating_camera != self.selected_camera
+            return
+        self.needs_calibration = False
+        self.calibrating_camera = self.selected_camera
+        display = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        self.calibration_thread = threading.Thread(target=self._calibration_thread,
+                                                   args=(self.selected_camera, display),
+                                                   name="calibration", daemon=True)
+        self.calibration_thread.start()
+        self._refresh_menu()
+
+    def _calibration_thread(self, camera, display):
+        try:
+            profile = calibrate(camera, opener=self._init_camera, display_size=display)
+            get_profile_store().save_profile(profile)
+            if camera == self.selected_camera:
+                apply_profile(profile)
+        except Exception as e:
+            print(f"Calibration failed, using default settings: {e}")
+            if DEBUG:
+                traceback.print_exc()
+        self._refresh_menu()
+
+    def _refresh_menu(self):
+        """Redraw the menu (its footer shows the calibration state) if it is showing"""
+        def refresh():
+            if getattr(self, 'current_view', None) == 'menu' and not self.game_running:
+                self.create_main_menu()
+        try:
+            self.root.after(0, refresh)
+        except RuntimeError:
+            pass  # window already closed
+
+    def calibration_status(self):
+        if self.calibration_thread is not None and self.calibration_thread.is_alive():
+            return "⚙️ Tuning for this computer and camera..."
+        tuning = get_tuning()
+        width, height, fps = tuning["capture"]
+        return f"⚙️ {width}x{height}@{fps}, tracking at {int(tuning['processing_scale'] * 100)}%"
 
     # --- Camera helpers ---
+    def _open_game_camera(self):
+        """Open the selected camera in its tuned capture mode (after any calibration in progress)"""
+        thread = self.calibration_thread
+        if thread is not None and thread.is_alive():
+            print("Waiting for camera calibration to finish...")
+            thread.join()
+        width, height, fps = get_tuning()["capture"]
+        cap = self._init_camera(self.selected_camera, width, height, fps)
+        profile = get_profile_store().profile(self.selected_camera)
+        if cap is not None and profile is not None and not camera_matches(profile, cap):
+            # Same index, different camera: its profile no longer applies
+            print("📹 Camera changed since calibration; re-tuning after this game")
+            get_profile_store().forget(self.selected_camera)
+            self.needs_calibration = True
+        return cap
+
     def _camera_is_black(self, frame):
         try:
             if frame is None or frame.size == 0:
@@ -228,6 +316,7 @@ class TamilGamesGUI:
         
         buttons = [
             ("🎯 Drag-Drop Word Matching", self.start_drag_drop, "#4CAF50"),
+            ("🧩 Word Board (older kids)", self.start_word_board, "#00897B"),
             ("🖐️ Finger Counting Game", self.start_finger_count, "#2196F3"),
             ("🦟 Mosquito Killing Game", self.start_mosquito_kill, "#E91E63"),
             ("✍️ Air Tracing Letters", self.start_air_trace, "#FF9800"),
@@ -250,6 +339,10 @@ class TamilGamesGUI:
                               font=("Arial", 10), fg="#CCCCCC", bg="#1e3c72")
         camera_info.pack()
         
+        tuning_info = tk.Label(footer_frame, text=self.calibration_status(), 
+                              font=("Arial", 10), fg="#CCCCCC", bg="#1e3c72")
+        tuning_info.pack()
+        
         footer = tk.Label(footer_frame, text="🌟 Made with ❤️ for Tamil Kids 🌟", 
                          font=("Arial", 12), fg="#FFFFFF", bg="#1e3c72")
         footer.pack(pady=(5, 0))
@@ -261,6 +354,13 @@ class TamilGamesGUI:
             cv2.destroyAllWindows()
         except:
             pass
+        try:
+            from speech import shutdown_speech
+            shutdown_speech()
+        except Exception:
+            pass
+        if self.stream is not None:
+            self.stream.stop()
         self.root.quit()
         self.root.destroy()
     
@@ -268,6 +368,11 @@ class TamilGamesGUI:
         self.hide_menu()
         self.run_drag_drop_game()
     
+    def start_word_board(self):
+        from game_logic import BOARD_DEFAULT_PAIRS
+        self.hide_menu()
+        self.run_drag_drop_game(board_pairs=BOARD_DEFAULT_PAIRS)
+    
     def start_finger_count(self):
         self.hide_menu()
         self.run_finger_count_game()
@@ -277,59 +382,61 @@ class TamilGamesGUI:
         self.run_mosquito_kill_game()
     
     def start_air_trace(self):
-        self.show_coming_soon("✍️ Air Tracing Letters")
+        self.hide_menu()
+        self.create_game_header("✍️ Air Tracing Letters")
+        self.create_game_canvas()
+        self.game_running = True
+        self.root.after(100, lambda: threading.Thread(target=self._air_trace_thread, daemon=True).start())
+
+    def _air_trace_thread(self):
+        cap = None
+        try:
+            from game_logic import AirTraceGame
+            cap = self._open_game_camera()
+            if cap is None:
+                self.show_error("Camera failed to initialize. Try Camera Settings and a different device.")
+                self.game_running = False
+                if self.root.winfo_exists():
+                    self.root.after(100, self.show_menu)
+                return
+            game = AirTraceGame()
+            host = self.create_game_host(game)
+            self.run_game_loop(host, cap)
+            if game.game_complete:
+                self.game_running = False
+                if self.root.winfo_exists():
+                    self.root.after(2000, self.show_menu)
+        except Exception as e:
+            print(f"Air tracing error: {e}")
+        finally:
+            # show_menu closes any OpenCV windows
+            if cap is not None:
+                cap.release()
     
     def start_color_game(self):
         self.hide_menu()
         self.create_game_header("🎨 Color Recognition")
-        game_frame = tk.Frame(self.root, bg="#000000")
-        game_frame.pack(fill='both', expand=True)
-        self.game_canvas = tk.Canvas(game_frame, bg="#000000")
-        self.game_canvas.pack(fill='both', expand=True)
-        self.root.update_idletasks()
+        self.create_game_canvas()
         self.game_running = True
         self.root.after(100, lambda: threading.Thread(target=self._color_game_thread, daemon=True).start())
 
     def _color_game_thread(self):
         try:
             from game_logic import ColorRecognitionGame
-            cap = self._init_camera(self.selected_camera, 800, 600, 60)
+            cap = self._open_game_camera()
             if cap is None:
                 self.show_error("Camera failed to initialize. Try Camera Settings and a different device.")
                 self.game_running = False
                 if self.root.winfo_exists():
                     self.root.after(100, self.show_menu)
                 return
-            prev = None
-            alpha = 0.8
             game = ColorRecognitionGame()
-            init = False
-            while self.game_running and self.root.winfo_exists():
-                ret, img = cap.read()
-                if not ret or img is None:
-                    continue
-                if prev is not None and prev.shape == img.shape:
-                    img = cv2.addWeighted(img, alpha, prev, 1-alpha, 0)
-                prev = img.copy()
-                img = cv2.flip(img, 1)
-                h, w = img.shape[:2]
-                if not init:
-                    game.setup_game(w, h)
-                    init = True
-                img = game.hand_tracker.find_hands(img, draw=True)
-                game.handle_game_logic(img)
-                game.draw_game_ui(img)
-                try:
-                    self.update_canvas(img)
-                except Exception:
-                    pass
-                if game.game_complete:
-                    self.game_running = False
-                    if self.root.winfo_exists():
-                        self.root.after(2000, self.show_menu)
-                    break
-                import time
-                time.sleep(0.02)
+            host = self.create_game_host(game)
+            self.run_game_loop(host, cap)
+            if game.game_complete:
+                self.game_running = False
+                if self.root.winfo_exists():
+                    self.root.after(2000, self.show_menu)
         except Exception as e:
             print(f"Color game error: {e}")
         finally:
@@ -440,6 +547,8 @@ class TamilGamesGUI:
                     # Save button
                     def save_camera_settings():
                         self.selected_camera = camera_var.get()
+                        get_profile_store().select_camera(self.selected_camera)
+                        self.load_camera_profile()
                         current_label.config(text=f"Current Camera: Device {self.selected_camera}")
                         # Show confirmation
                         status_label.config(text=f"✅ Camera {self.selected_camera} selected!", fg="#44FF44")
@@ -553,6 +662,8 @@ class TamilGamesGUI:
         except:
             pass
         self.create_main_menu()
+        if self.needs_calibration:
+            self.start_calibration()
     
     def create_game_header(self, title):
         # Adjust header size for fullscreen
@@ -592,31 +703,52 @@ class TamilGamesGUI:
         
         return header_frame
     
-    def run_drag_drop_game(self):
+    def create_game_canvas(self):
+        """Create the black game canvas below the header and its frame presenter"""
+        game_frame = tk.Frame(self.root, bg="#000000")
+        game_frame.pack(fill='both', expand=True)
+        
+        self.game_canvas = tk.Canvas(game_frame, bg="#000000")
+        self.game_canvas.pack(fill='both', expand=True)
+        if self.presenter is not None:
+            self.presenter.close()
+        self.presenter = TkPresenter(self.game_canvas)
+        
+        # Force canvas to update its size
+        self.root.update_idletasks()
+        self.presenter.start()
+        return self.game_canvas
+    
+    def create_game_host(self, game):
+        """Frame pipeline for game rendering at the game canvas size"""
+        presenter = self.presenter
+        return GameHost(game, display_size_fn=lambda: presenter.target_size if presenter else None)
+    
+    def run_game_loop(self, host, cap, linger=0.0):
+        """Drive host from cap into the Tk presenter until the game ends or the player leaves"""
+        # Controlled frame rate for smooth video (~50-60 FPS)
+        presenter = self.stream.tap(self.presenter, host) if self.stream is not None else self.presenter
+        return host.run(cap, presenter, keep_running=lambda: self.game_running,
+                        frame_delay=0.018, linger=linger)
+    
+    def run_drag_drop_game(self, board_pairs=None):
         try:
             from game_logic import DragDropGame
             
-            self.create_game_header("🎯 Drag-Drop Word Matching")
-            
-            game_frame = tk.Frame(self.root, bg="#000000")
-            game_frame.pack(fill='both', expand=True)
-            
-            self.game_canvas = tk.Canvas(game_frame, bg="#000000")
-            self.game_canvas.pack(fill='both', expand=True)
-            
-            # Force canvas to update its size
-            self.root.update_idletasks()
+            self.create_game_header("🧩 Tamil Word Board" if board_pairs else "🎯 Drag-Drop Word Matching")
+            self.create_game_canvas()
             
             self.game_running = True
             # Small delay to ensure canvas is ready
-            self.root.after(100, lambda: threading.Thread(target=self._drag_drop_thread, daemon=True).start())
+            self.root.after(100, lambda: threading.Thread(target=self._drag_drop_thread, args=(board_pairs,),
+                                                          daemon=True).start())
             
         except ImportError as e:
             self.show_error(f"Game module not found: {e}")
     
-    def _drag_drop_thread(self):
+    def _drag_drop_thread(self, board_pairs=None):
         # Robust camera open with fallbacks
-        cap = self._init_camera(self.selected_camera, 800, 600, 60)
+        cap = self._open_game_camera()
         if cap is None:
             self.show_error("Camera failed to initialize. Try Camera Settings and a different device.")
             self.game_running = False
@@ -624,62 +756,18 @@ class TamilGamesGUI:
                 self.root.after(100, self.show_menu)
             return
         
-        # Frame smoothing variables for anti-shutter
-        prev_frame = None
-        frame_alpha = 0.8  # Smoothing factor (higher = less smoothing)
-        
         try:
             from game_logic import DragDropGame
-            game = DragDropGame()
-            game_initialized = False
+            game = DragDropGame(board_pairs=board_pairs)
+            host = self.create_game_host(game)
             
             print("Starting drag-drop game with smooth video...")
+            self.run_game_loop(host, cap)
             
-            while self.game_running and self.root.winfo_exists():
-                ret, img = cap.read()
-                
-                if not ret or img is None:
-                    continue
-                
-                # Anti-shutter frame smoothing
-                if prev_frame is not None and prev_frame.shape == img.shape:
-                    img = cv2.addWeighted(img, frame_alpha, prev_frame, 1 - frame_alpha, 0)
-                prev_frame = img.copy()
-                
-                # Simple mirror flip
-                img = cv2.flip(img, 1)
-                h, w = img.shape[:2]
-                
-                if not game_initialized:
-                    game.setup_game(w, h)
-                    game_initialized = True
-                
-                # Process hand tracking
-                try:
-                    img = game.hand_tracker.find_hands(img, draw=True)
-                    game.handle_game_logic(img)
-                    game.draw_game_ui(img)
-                except Exception as e:
-                    print(f"Hand tracking error: {e}")
-                    continue
-                
-                # Update canvas
-                try:
-                    self.update_canvas(img)
-                except Exception as e:
-                    print(f"Canvas update error: {e}")
-                    continue
-                
-                # Controlled frame rate for smooth video (~50-60 FPS)
-                import time
-                time.sleep(0.018)
-                
-                if game.game_complete:
-                    print("Game completed!")
-                    self.game_running = False
-                    if self.root.winfo_exists():
-                        self.root.after(2000, self.show_menu)
-                    break
+            if game.game_complete:
+                self.game_running = False
+                if self.root.winfo_exists():
+                    self.root.after(2000, self.show_menu)
                     
         except Exception as e:
             print(f"Game error: {e}")
@@ -696,15 +784,7 @@ class TamilGamesGUI:
     def run_finger_count_game(self):
         try:
             self.create_game_header("🖐️ Tamil Finger Counting Game")
-            
-            game_frame = tk.Frame(self.root, bg="#000000")
-            game_frame.pack(fill='both', expand=True)
-            
-            self.game_canvas = tk.Canvas(game_frame, bg="#000000")
-            self.game_canvas.pack(fill='both', expand=True)
-            
-            # Force canvas to update its size
-            self.root.update_idletasks()
+            self.create_game_canvas()
             
             self.game_running = True
             # Small delay to ensure canvas is ready
@@ -717,11 +797,10 @@ class TamilGamesGUI:
         # Use the new FingerCountGame class from game_logic.py
         try:
             from game_logic import FingerCountGame
-            import cv2
             import time
             
             # Robust camera open with fallbacks
-            cap = self._init_camera(self.selected_camera, 800, 600, 60)
+            cap = self._open_game_camera()
             if cap is None:
                 self.show_error("Camera failed to initialize. Try Camera Settings and a different device.")
                 return
@@ -733,57 +812,10 @@ class TamilGamesGUI:
                 time.sleep(0.1)
             
             game = FingerCountGame()
-            game_initialized = False
+            host = self.create_game_host(game)
             
             print("Starting finger counting game...")
-            
-            # Frame smoothing state
-            prev_frame = None
-            frame_alpha = 0.8
-
-            while self.game_running and self.root.winfo_exists():
-                ret, img = cap.read()
-                if not ret or img is None:
-                    continue
-                
-                # Anti-shutter frame smoothing
-                if prev_frame is not None and prev_frame.shape == img.shape:
-                    img = cv2.addWeighted(img, frame_alpha, prev_frame, 1 - frame_alpha, 0)
-                prev_frame = img.copy()
-
-                # Simple mirror flip
-                img = cv2.flip(img, 1)
-                h, w = img.shape[:2]
-                
-                # Initialize game on first frame
-                if not game_initialized:
-                    game.setup_game(w, h)
-                    game_initialized = True
-                
-                # Process hand tracking
-                try:
-                    img = game.hand_tracker.find_hands(img, draw=True)
-                    game.handle_game_logic(img)
-                    game.draw_game_ui(img)
-                except Exception as e:
-                    print(f"Hand tracking error: {e}")
-                    continue
-                
-                # Update canvas
-                try:
-                    self.update_canvas(img)
-                except Exception as e:
-                    print(f"Canvas update error: {e}")
-                    continue
-                
-                # Check for game completion
-                if game.game_complete:
-                    print("Game completed!")
-                    time.sleep(2)
-                    break
-                
-                # Simple frame rate control (~50-60 FPS)
-                time.sleep(0.018)
+            self.run_game_loop(host, cap, linger=2.0)
                 
         except Exception as e:
             print(f"Error initializing finger count game: {e}")
@@ -806,15 +838,7 @@ class TamilGamesGUI:
     def run_mosquito_kill_game(self):
         try:
             self.create_game_header("🦟 Tamil Mosquito Killing Game")
-            
-            game_frame = tk.Frame(self.root, bg="#000000")
-            game_frame.pack(fill='both', expand=True)
-            
-            self.game_canvas = tk.Canvas(game_frame, bg="#000000")
-            self.game_canvas.pack(fill='both', expand=True)
-            
-            # Force canvas to update its size
-            self.root.update_idletasks()
+            self.create_game_canvas()
             
             self.game_running = True
             # Small delay to ensure canvas is ready
@@ -827,11 +851,10 @@ class TamilGamesGUI:
         # Use the new MosquitoKillGame class from game_logic.py
         try:
             from game_logic import MosquitoKillGame
-            import cv2
             import time
             
             # Robust camera open with fallbacks
-            cap = self._init_camera(self.selected_camera, 800, 600, 60)
+            cap = self._open_game_camera()
             if cap is None:
                 self.show_error("Camera failed to initialize. Try Camera Settings and a different device.")
                 return
@@ -843,57 +866,10 @@ class TamilGamesGUI:
                 time.sleep(0.1)
             
             game = MosquitoKillGame()
-            game_initialized = False
+            host = self.create_game_host(game)
             
             print("Starting mosquito killing game...")
-            
-            # Frame smoothing state
-            prev_frame = None
-            frame_alpha = 0.8
-
-            while self.game_running and self.root.winfo_exists():
-                ret, img = cap.read()
-                if not ret or img is None:
-                    continue
-                
-                # Anti-shutter frame smoothing
-                if prev_frame is not None and prev_frame.shape == img.shape:
-                    img = cv2.addWeighted(img, frame_alpha, prev_frame, 1 - frame_alpha, 0)
-                prev_frame = img.copy()
-
-                # Simple mirror flip
-                img = cv2.flip(img, 1)
-                h, w = img.shape[:2]
-                
-                # Initialize game on first frame
-                if not game_initialized:
-                    game.setup_game(w, h)
-                    game_initialized = True
-                
-                # Process hand tracking
-                try:
-                    img = game.hand_tracker.find_hands(img, draw=True)
-                    game.handle_game_logic(img)
-                    game.draw_game_ui(img)
-                except Exception as e:
-                    print(f"Hand tracking error: {e}")
-                    continue
-                
-                # Update canvas
-                try:
-                    self.update_canvas(img)
-                except Exception as e:
-                    print(f"Canvas update error: {e}")
-                    continue
-                
-                # Check for game completion
-                if game.game_complete:
-                    print("Game completed!")
-                    time.sleep(2)
-                    break
-                
-                # Simple frame rate control (~50-60 FPS)
-                time.sleep(0.018)
+            self.run_game_loop(host, cap, linger=2.0)
                 
         except Exception as e:
             print(f"Error initializing mosquito kill game: {e}")
@@ -913,87 +889,6 @@ class TamilGamesGUI:
             if self.root.winfo_exists():
                 self.root.after(100, self.show_menu)
     
-    def update_canvas(self, img):
-        try:
-            from PIL import Image, ImageTk
-            
-            # Debug: Check if canvas exists
-            if not hasattr(self, 'game_canvas') or self.game_canvas is None:
-                print("❌ Canvas update error: game_canvas not initialized")
-                return
-            
-            # Get current canvas dimensions
-            canvas_width = self.game_canvas.winfo_width()
-            canvas_height = self.game_canvas.winfo_height()
-            
-            # Debug: Print canvas dimensions (only first few times)
-            if canvas_width <= 1 or canvas_height <= 1:
-                if DEBUG:
-                    print(f"⚠️ Canvas not ready: {canvas_width}x{canvas_height}")
-                # Try again later
-                self.root.after(10, lambda: self.update_canvas(img))
-                return
-            
-            # Validate image before processing
-            if img is None or img.size == 0:
-                if DEBUG:
-                    print("❌ Invalid image received for canvas update")
-                return
-            
-            # Only print debug info occasionally
-            if not hasattr(self, '_debug_counter'):
-                self._debug_counter = 0
-            self._debug_counter += 1
-            
-            if DEBUG and self._debug_counter % 100 == 1:  # Print every 100th frame
-                print(f"📷 Canvas update: img={img.shape}, canvas={canvas_width}x{canvas_height}")
-            
-            # Convert BGR to RGB
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            
-            # Create PIL image
-            img_pil = Image.fromarray(img_rgb)
-            
-            # Resize to fit canvas while maintaining aspect ratio
-            img_aspect = img_pil.width / img_pil.height
-            canvas_aspect = canvas_width / canvas_height
-            
-            if img_aspect > canvas_aspect:
-                # Image is wider, fit to width
-                new_width = canvas_width
-                new_height = int(canvas_width / img_aspect)
-            else:
-                # Image is taller, fit to height
-                new_height = canvas_height
-                new_width = int(canvas_height * img_aspect)
-            
-            # Resize with high quality
-            img_pil = img_pil.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            self.photo = ImageTk.PhotoImage(img_pil)
-            
-            # Clear canvas and add new image
-            self.game_canvas.delete("all")
-            
-            # Center the image on canvas
-            x_offset = (canvas_width - new_width) // 2
-            y_offset = (canvas_height - new_height) // 2
-            
-            self.game_canvas.create_image(x_offset, y_offset, anchor=tk.NW, image=self.photo)
-            
-            # Only print success message occasionally
-            if DEBUG and self._debug_counter % 100 == 1:
-                print("✅ Canvas updated successfully")
-                
-        except ImportError:
-            print("❌ PIL/Pillow not available for image processing")
-        except Exception as e:
-            print(f"❌ Canvas update error: {e}")
-            import traceback
-            traceback.print_exc()
-            # Don't raise exception to prevent crashes
-    
     def show_error(self, message):
         popup = tk.Toplevel(self.root)
         popup.title("Error")
@@ -4,24 +4,34 @@ import cv2
 import numpy as np
 from collections import deque
 import math
+from frame_pool import FramePool
+from calibration import get_tuning
 
 class HandTracker:
-    def __init__(self, max_hands=2, detection_confidence=0.6, tracking_confidence=0.7, processing_scale=0.75):
+    def __init__(self, max_hands=2, detection_confidence=0.6, tracking_confidence=0.7, processing_scale=None,
+                 model_complexity=None):
         self.mp_hands = mp.solutions.hands
+        # Unset settings come from this machine's calibration profile (calibration.py)
+        tuning = get_tuning()
+        if processing_scale is None:
+            processing_scale = tuning["processing_scale"]
+        if model_complexity is None:
+            model_complexity = tuning["model_complexity"]
 
-        # Optimized MediaPipe configuration for better detection
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=max_hands,
-            min_detection_confidence=detection_confidence,  # Lowered for better detection
-            min_tracking_confidence=tracking_confidence,    # Lowered for better tracking
-            model_complexity=0  # Use lighter model for better performance and stability
-        )
+        self.max_hands = max_hands
+        self.detection_confidence = detection_confidence
+        self.tracking_confidence = tracking_confidence
+        self.model_complexity = model_complexity
+        self.hands = self._create_hands()
 
         self.mp_draw = mp.solutions.drawing_utils
 
         # Processing scale for performance (process smaller frame for speed)
         self.processing_scale = max(0.5, min(1.0, processing_scale))
+        # Light denoise before inference (the quality governor may turn it off)
+        self.denoise = True
+        # Scratch buffers for the inference copy (GameHost shares its pipeline's pool)
+        self.pool = FramePool()
 
         # Enhanced smoothing and filtering
         self.landmark_history = deque(maxlen=3)  # Reduced for faster response
@@ -37,38 +47,66 @@ class HandTracker:
         self.smoothed_landmarks = None
         self.smoothing_factor = 0.5  # Lighter smoothing for better responsiveness
 
-    def find_hands(self, img, draw=True):
-        # Enhanced preprocessing for better hand detection
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    def _create_hands(self):
+        # Optimized MediaPipe configuration for better detection
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=self.max_hands,
+            min_detection_confidence=self.detection_confidence,  # Lowered for better detection
+            min_tracking_confidence=self.tracking_confidence,    # Lowered for better tracking
+            model_complexity=self.model_complexity  # 0 (lite) unless calibration found time for the full model
+        )
 
-        # Optional slight Gaussian blur to reduce noise
-        img_rgb = cv2.GaussianBlur(img_rgb, (3, 3), 0)
+    def configure(self, processing_scale=None, model_complexity=None):
+        """Switch inference settings in place (calibration benchmarks candidates this way)"""
+        if processing_scale is not None:
+            self.processing_scale = max(0.5, min(1.0, processing_scale))
+        if model_complexity is not None and model_complexity != self.model_complexity:
+            self.model_complexity = model_complexity
+            close = getattr(self.hands, "close", None)
+            if close is not None:
+                close()
+            self.hands = self._create_hands()
 
-        # Downscale for processing to improve performance
+    def find_hands(self, img, draw=True):
+        """Run hand detection on img. Landmarks are kept normalized, so they can
+        be mapped onto any frame size afterwards (see get_landmarks/draw_hands)."""
+        # Downscale first so colour conversion and denoising run at inference resolution
+        # MediaPipe is done with its input when process() returns, so one buffer per stage is enough
+        pool = self.pool
         if self.processing_scale < 1.0:
-            small = cv2.resize(img_rgb, None, fx=self.processing_scale, fy=self.processing_scale, interpolation=cv2.INTER_AREA)
-            self.results = self.hands.process(small)
+            h, w = img.shape[:2]
+            size = (max(1, round(w * self.processing_scale)), max(1, round(h * self.processing_scale)))
+            small = cv2.resize(img, size, dst=pool.get("track_small", (size[1], size[0], 3), depth=1),
+                               interpolation=cv2.INTER_AREA)
         else:
-            self.results = self.hands.process(img_rgb)
+            small = img
+        img_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=pool.get("track_rgb", small.shape, depth=1))
+
+        # Optional slight Gaussian blur to reduce noise
+        if self.denoise:
+            img_rgb = cv2.GaussianBlur(img_rgb, (3, 3), 0, dst=pool.get("track_blur", small.shape, depth=1))
+
+        self.results = self.hands.process(img_rgb)
 
+        if draw:
+            self.draw_hands(img)
+        return img
+
+    def draw_hands(self, img):
+        """Draw the latest detection onto img at img's own resolution"""
         if self.results.multi_hand_landmarks:
             for handLms in self.results.multi_hand_landmarks:
-                if draw:
-                    # Draw landmarks with enhanced visibility
-                    self.mp_draw.draw_landmarks(
-                        img, handLms, self.mp_hands.HAND_CONNECTIONS,
-                        self.mp_draw.DrawingSpec(color=(0, 255, 0), thickness=3, circle_radius=3),
-                        self.mp_draw.DrawingSpec(color=(255, 255, 255), thickness=2)
-                    )
-
-                    # Add hand detection confidence indicator
-                    h, w, _ = img.shape
-                    cv2.putText(img, f"Hand Detected", (10, 30),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-        else:
-            # No hands detected; avoid noisy console/UI text here
-            pass
+                # Draw landmarks with enhanced visibility
+                self.mp_draw.draw_landmarks(
+                    img, handLms, self.mp_hands.HAND_CONNECTIONS,
+                    self.mp_draw.DrawingSpec(color=(0, 255, 0), thickness=3, circle_radius=3),
+                    self.mp_draw.DrawingSpec(color=(255, 255, 255), thickness=2)
+                )
 
+                # Add hand detection confidence indicator
+                cv2.putText(img, f"Hand Detected", (10, 30),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
         return img
 
     def get_landmarks(self, img):
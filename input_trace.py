@@ -0,0 +1,304 @@
+# Record hand-landmark input of a game session and replay it deterministically
+import base64
+import json
+import time
+import cv2
+import numpy as np
+
+TRACE_VERSION = 1
+# Landmark coordinates are normalized; 5 decimals is well below a pixel at 4K
+PRECISION = 5
+# Games that read camera pixels (reads_pixels) also get the frames recorded, this wide, as JPEG
+FRAME_WIDTH = 480
+FRAME_QUALITY = 80
+
+
+class _Landmark:
+    """Stand-in for a MediaPipe NormalizedLandmark"""
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+    def HasField(self, name):
+        # Traces carry no visibility/presence, which drawing_utils checks for
+        return False
+
+
+class _HandLandmarks:
+    __slots__ = ("landmark",)
+
+    def __init__(self, points):
+        self.landmark = [_Landmark(*p) for p in points]
+
+
+class _Results:
+    """Stand-in for the result object of mp.solutions.hands.Hands.process"""
+
+    def __init__(self, hands):
+        self.multi_hand_landmarks = [_HandLandmarks(h) for h in hands] or None
+        self.multi_handedness = None
+
+
+def _hands_of(results):
+    hands = []
+    for hand in (getattr(results, "multi_hand_landmarks", None) or []):
+        hands.append([[round(lm.x, PRECISION), round(lm.y, PRECISION), round(lm.z, PRECISION)]
+                      for lm in hand.landmark])
+    return hands
+
+
+class _RecordingCapture:
+    """Capture wrapper handing every frame read to the recorder before the pipeline sees it"""
+
+    def __init__(self, capture, recorder):
+        self.capture = capture
+        self.recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self.capture, name)
+
+    def read(self, *args):
+        ret, img = self.capture.read(*args)
+        if ret and img is not None:
+            self.recorder._capture_frame(img)
+        return ret, img
+
+
+class TraceRecorder:
+    """Writes one JSON line per frame: the hand landmarks the tracker saw and
+    the clock reading the game ticked with.
+
+    attach(game) wraps the game's MediaPipe Hands object and its clock's time
+    source, so nothing else in the pipeline changes while recording. With
+    keep_frames, wrap_capture(cap) also stores each captured frame (before
+    smoothing and mirroring), scaled to FRAME_WIDTH and JPEG-encoded, in its
+    line; games that classify camera pixels cannot be replayed without them.
+    """
+
+    def __init__(self, path, game_name, seed=None, capture_size=None, keep_frames=False):
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8')
+        self.frames = 0
+        self.pending = None
+        self.keep_frames = keep_frames
+        self._frame_jpeg = None
+        header = {"version": TRACE_VERSION, "game": game_name, "seed": seed,
+                  "capture_size": list(capture_size) if capture_size else None,
+                  "frame_width": FRAME_WIDTH if keep_frames else None}
+        self.file.write(json.dumps(header) + "\n")
+
+    def wrap_capture(self, capture):
+        return _RecordingCapture(capture, self) if self.keep_frames else capture
+
+    def _capture_frame(self, img):
+        h, w = img.shape[:2]
+        if w > FRAME_WIDTH:
+            img = cv2.resize(img, (FRAME_WIDTH, max(1, round(h * FRAME_WIDTH / w))), interpolation=cv2.INTER_AREA)
+        ok, jpeg = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, FRAME_QUALITY])
+        self._frame_jpeg = base64.b64encode(jpeg.tobytes()).decode('ascii') if ok else None
+
+    def attach(self, game):
+        hands = game.hand_tracker.hands
+        recorder = self
+
+        class RecordingHands:
+            def process(self, img_rgb):
+                results = hands.process(img_rgb)
+                recorder._start_frame(_hands_of(results))
+                return results
+
+            def close(self):
+                hands.close()
+
+        game.hand_tracker.hands = RecordingHands()
+        time_source = game.clock.time_source
+
+        def recorded_time():
+            t = time_source()
+            if self.pending is not None:
+                self.pending["t"] = t
+            return t
+
+        game.clock.time_source = recorded_time
+        return game
+
+    def _start_frame(self, hands):
+        self._flush()
+        self.pending = {"t": None, "hands": hands}
+        if self._frame_jpeg is not None:
+            self.pending["jpeg"] = self._frame_jpeg
+            self._frame_jpeg = None
+
+    def _flush(self):
+        if self.pending is not None:
+            self.file.write(json.dumps(self.pending, separators=(',', ':')) + "\n")
+            self.frames += 1
+            self.pending = None
+
+    def close(self):
+        if self.file is not None:
+            self._flush()
+            self.file.close()
+            self.file = None
+            print(f"Recorded {self.frames} frames to {self.path}")
+
+
+class TraceReplayer:
+    """Feeds a recorded trace back through a game.
+
+    It doubles as the capture for GameHost.run: read() returns the recorded
+    frame scaled back to the capture size (a blank frame if the trace has no
+    frames) while frames remain, the game's Hands object returns the recorded
+    landmarks for that frame and the game clock reads the recorded time. The
+    same trace and seed give the same game state on every replay, whatever
+    the machine speed. Games that read camera pixels refuse a trace without
+    frames rather than replay it against grey.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get("version") != TRACE_VERSION:
+                raise ValueError(f"{path}: trace version {header.get('version')}, expected {TRACE_VERSION}")
+            self.frames = [json.loads(line) for line in f if line.strip()]
+        self.game_name = header["game"]
+        self.seed = header.get("seed")
+        self.capture_size = tuple(header.get("capture_size") or (800, 600))
+        self.has_frames = bool(self.frames) and all("jpeg" in frame for frame in self.frames)
+        self.index = -1
+        self.time = 0.0
+        self._blank = None
+
+    def __len__(self):
+        return len(self.frames)
+
+    def create_game(self):
+        """A fresh game of the recorded kind and seed, attached to this trace"""
+        from game_logic import GAMES
+        return self.attach(GAMES[self.game_name](seed=self.seed))
+
+    def attach(self, game):
+        if getattr(game, "reads_pixels", False) and not self.has_frames:
+            raise ValueError(f"{self.path}: {type(game).__name__} reads camera pixels, but the trace "
+                             "has no recorded frames (record it again with this version)")
+        replayer = self
+
+        class ReplayHands:
+            def process(self, img_rgb):
+                return _Results(replayer.frames[replayer.index]["hands"])
+
+            def close(self):
+                pass
+
+        game.hand_tracker.hands = ReplayHands()
+        game.clock.time_source = lambda: self.time
+        return game
+
+    # Capture interface (GameHost.run / run_game)
+    def isOpened(self):
+        return True
+
+    def read(self):
+        if self.index + 1 >= len(self.frames):
+            return False, None
+        self.index += 1
+        frame = self.frames[self.index]
+        t = frame.get("t")
+        if t is not None:
+            self.time = t
+        if "jpeg" in frame:
+            img = cv2.imdecode(np.frombuffer(base64.b64decode(frame["jpeg"]), np.uint8), cv2.IMREAD_COLOR)
+            if img is not None:
+                if (img.shape[1], img.shape[0]) != self.capture_size:
+                    img = cv2.resize(img, self.capture_size, interpolation=cv2.INTER_LINEAR)
+                return True, img
+        if self._blank is None:
+            w, h = self.capture_size
+            self._blank = np.full((h, w, 3), 90, dtype=np.uint8)
+        return True, self._blank.copy()
+
+    def release(self):
+        pass
+
+
+def record(game_name, path, seed=None, source=0, presenter_kind="highgui", max_frames=None, keep_frames=None):
+    """Play a game live and record its input trace (with frames if keep_frames, or if the game reads pixels)"""
+    from game_logic import GAMES
+    from game_host import GameHost, open_capture
+    from presenter import create_presenter
+
+    cap = open_capture(source)
+    if not cap.isOpened():
+        print(f"❌ Could not open capture source {source!r}")
+        return None
+    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 800, int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 600)
+    game = GAMES[game_name](seed=seed)
+    if keep_frames is None:
+        keep_frames = getattr(game, "reads_pixels", False)
+    recorder = TraceRecorder(path, game_name, seed, size, keep_frames)
+    recorder.attach(game)
+    presenter = create_presenter(presenter_kind, title=f"Recording {game_name}")
+    try:
+        return GameHost(game).run(recorder.wrap_capture(cap), presenter, max_frames=max_frames)
+    finally:
+        recorder.close()
+        cap.release()
+        presenter.close()
+
+
+def replay(path, presenter=None, size=None):
+    """Replay a trace as fast as possible; returns GameHost.run stats plus the final score.
+
+    The quality governor is given an unlimited budget so every replay draws
+    the same effects and the workload stays identical between runs.
+    """
+    from game_host import GameHost
+    from governor import QualityGovernor
+    from presenter import NullPresenter
+
+    replayer = TraceReplayer(path)
+    game = replayer.create_game()
+    presenter = presenter or NullPresenter(target_size=size)
+    host = GameHost(game, governor=QualityGovernor(budget_ms=float('inf')))
+    start = time.perf_counter()
+    stats = host.run(replayer, presenter, max_frames=len(replayer))
+    stats["wall_seconds"] = round(time.perf_counter() - start, 3)
+    stats["score"] = getattr(game, "score", getattr(game, "kill_count", None))
+    presenter.close()
+    return stats
+
+
+def main(argv=None):
+    import argparse
+    from game_logic import GAMES
+    from presenter import PRESENTERS
+
+    parser = argparse.ArgumentParser(description="Record or replay a game's hand-landmark input")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record")
+    rec.add_argument("--game", choices=sorted(GAMES), default="drag_drop")
+    rec.add_argument("--output", default="session.trace")
+    rec.add_argument("--seed", type=int, default=1)
+    rec.add_argument("--source", default="0", help="camera index or video file")
+    rec.add_argument("--presenter", choices=PRESENTERS, default="highgui")
+    rec.add_argument("--frames", type=int, default=None)
+    rec.add_argument("--keep-frames", action="store_true", default=None,
+                     help="also record camera frames (always on for games that read pixels)")
+    rep = sub.add_parser("replay")
+    rep.add_argument("trace")
+    rep.add_argument("--size", default=None, help="render size WxH")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        record(args.game, args.output, args.seed, args.source, args.presenter, args.frames, args.keep_frames)
+    else:
+        size = tuple(int(v) for v in args.size.lower().split("x")) if args.size else None
+        stats = replay(args.trace, size=size)
+        print(f"{args.trace}: {stats['frames']} frames in {stats['wall_seconds']}s "
+              f"({stats['fps']} FPS), score {stats['score']}, completed {stats['completed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+# Tamil letter templates for air tracing: distance fields precomputed at game resolution, cached on disk
+import hashlib
+import os
+import queue
+import threading
+import cv2
+import numpy as np
+
+DEBUG = False
+
+DEFAULT_CACHE_DIR = os.path.join("assets", "cache", "letter_fields")
+# Bump when the way fields are built changes, so old cache files are ignored
+FIELD_VERSION = 1
+
+# Letters the game picks from: shapes a child can follow in one or two strokes
+TRACE_LETTERS = ["ட", "ப", "ம", "வ", "ய", "ல", "ற", "ங", "அ", "இ", "உ", "எ", "ஒ", "க", "த", "ச"]
+
+# A stroke point counts as on the letter within this fraction of the frame height
+TOLERANCE_FRACTION = 0.035
+# The letter fills this fraction of its box
+FILL_FRACTION = 0.85
+NO_CELL = -1
+# Fields kept in memory (a 720p field is about 2.7 MB); older ones are reloaded from disk
+MEMORY_FIELDS = 4
+
+
+def skeleton(ink):
+    """Morphological skeleton of a 0/255 mask: the centre lines a finger traces along"""
+    kernel = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
+    skel = np.zeros_like(ink)
+    img = ink.copy()
+    while cv2.countNonZero(img):
+        eroded = cv2.erode(img, kernel)
+        opened = cv2.dilate(eroded, kernel)
+        cv2.bitwise_or(skel, cv2.subtract(img, opened), dst=skel)
+        img = eroded
+    return skel
+
+
+def fit_letter(letter, box):
+    """Font size and mask of letter scaled to fill box (x0, y0, x1, y1), and the mask's top-left"""
+    from utils import render_text_mask
+    x0, y0, x1, y1 = box
+    box_w, box_h = max(1, x1 - x0), max(1, y1 - y0)
+    font_size = max(12, int(box_h * FILL_FRACTION))
+    mask, _ = render_text_mask(letter, font_size)
+    # Glyph boxes differ from the font size; one rescale gets close enough
+    fit = min(box_w * FILL_FRACTION / mask.shape[1], box_h * FILL_FRACTION / mask.shape[0])
+    if abs(fit - 1.0) > 0.05:
+        font_size = max(12, int(font_size * fit))
+        mask, _ = render_text_mask(letter, font_size)
+    mh, mw = mask.shape
+    return font_size, mask, (x0 + (box_w - mw) // 2, y0 + (box_h - mh) // 2)
+
+
+class LetterField:
+    """One letter placed in a width x height frame, with everything scoring needs precomputed.
+
+    distance: uint8 (h, w), pixels from each frame pixel to the nearest ink pixel (capped at 255)
+    cells:    int16 (h, w), coverage cell of the nearest skeleton pixel for pixels within
+              tolerance of the skeleton, NO_CELL elsewhere
+    mask/origin: the glyph's coverage mask and its top-left; ink is the mask as booleans,
+              for drawing the guide with one masked assignment
+
+    The skeleton is cut into square cells of tolerance pixels; a letter has been
+    traced once most of its cells were passed near. Scoring a stroke point is
+    then two array lookups, however long the stroke or large the letter.
+    """
+
+    def __init__(self, letter, size, tolerance, distance, cells, cell_count, mask, origin):
+        self.letter = letter
+        self.size = size
+        self.tolerance = tolerance
+        self.distance = distance
+        self.cells = cells
+        self.cell_count = cell_count
+        self.mask = mask
+        self.origin = origin
+        self.ink = mask > 127
+
+    @classmethod
+    def build(cls, letter, size, box, tolerance):
+        w, h = size
+        _, mask, (ox, oy) = fit_letter(letter, box)
+        ink = np.zeros((h, w), np.uint8)
+        mh, mw = mask.shape
+        cx0, cy0 = max(0, ox), max(0, oy)
+        cx1, cy1 = min(w, ox + mw), min(h, oy + mh)
+        ink[cy0:cy1, cx0:cx1][mask[cy0 - oy:cy1 - oy, cx0 - ox:cx1 - ox] > 127] = 255
+
+        distance = cv2.distanceTransform(cv2.bitwise_not(ink), cv2.DIST_L2, 3)
+        distance = np.minimum(distance, 255).astype(np.uint8)
+
+        # Each skeleton pixel gets the cell it falls in; every frame pixel near the
+        # skeleton inherits the cell of its nearest skeleton pixel
+        skel = skeleton(ink)
+        sy, sx = np.nonzero(skel)  # raster order, matching DIST_LABEL_PIXEL label numbering
+        cells = np.full((h, w), NO_CELL, np.int16)
+        if len(sy):
+            step = max(1, int(tolerance))
+            cell_keys = (sy // step).astype(np.int64) * (w // step + 1) + sx // step
+            _, cell_of_pixel = np.unique(cell_keys, return_inverse=True)
+            cell_count = int(cell_of_pixel.max()) + 1
+            skel_dist, labels = cv2.distanceTransformWithLabels(cv2.bitwise_not(skel), cv2.DIST_L2, 3,
+                                                                labelType=cv2.DIST_LABEL_PIXEL)
+            near = skel_dist <= tolerance
+            cells[near] = cell_of_pixel[labels[near] - 1]
+        else:
+            cell_count = 0
+        return cls(letter, size, tolerance, distance, cells, cell_count, mask, (ox, oy))
+
+    def save(self, path):
+        tmp_path = path + ".tmp.npz"
+        np.savez_compressed(tmp_path, distance=self.distance, cells=self.cells, mask=self.mask,
+                            meta=np.array([self.cell_count, self.origin[0], self.origin[1]], np.int32))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, letter, size, tolerance):
+        with np.load(path) as data:
+            cell_count, ox, oy = (int(v) for v in data["meta"])
+            field = cls(letter, size, tolerance, data["distance"], data["cells"], cell_count, data["mask"], (ox, oy))
+        if field.distance.shape != (size[1], size[0]):
+            raise ValueError(f"field is {field.distance.shape}, expected {size}")
+        return field
+
+
+def field_key(letter, size, box, tolerance):
+    from asset_bundle import _font_id
+    source = f"{FIELD_VERSION}\0{letter}\0{size}\0{box}\0{tolerance}\0{FILL_FRACTION}\0{_font_id()}"
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()[:20]
+
+
+class LetterFieldCache:
+    """LetterFields by (letter, size, box), kept in memory and as .npz files in cache_dir.
+
+    A field takes tens of milliseconds to build at 720p (mostly the two distance
+    transforms); loading a cached one takes a few, so a round can start mid-game
+    without a visible hitch once the cache is warm. prefetch() loads or builds
+    a field on one background worker; get() returns a field in memory at once,
+    waits for one being prefetched, and otherwise loads or builds it itself.
+    The lock only guards the bookkeeping, never a load or build.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._fields = {}
+        self._pending = {}  # key -> Event set when that field's load/build finishes
+        self._lock = threading.Lock()
+        self._prefetch_queue = queue.Queue()
+        self._worker = None
+        self.hits = 0
+        self.builds = 0
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, key + ".npz")
+
+    def get(self, letter, size, box, tolerance=None):
+        size = (int(size[0]), int(size[1]))
+        box = tuple(int(v) for v in box)
+        if tolerance is None:
+            tolerance = default_tolerance(size)
+        key = field_key(letter, size, box, tolerance)
+        while True:
+            with self._lock:
+                field = self._fields.get(key)
+                if field is not None:
+                    return field
+                done = self._pending.get(key)
+                if done is None:
+                    done = self._pending[key] = threading.Event()
+                    break
+            # Another thread is loading this field: wait for it rather than build it twice
+            done.wait()
+
+        try:
+            field = self._load_or_build(key, letter, size, box, tolerance)
+            with self._lock:
+                if len(self._fields) >= MEMORY_FIELDS:
+                    del self._fields[next(iter(self._fields))]
+                self._fields[key] = field
+            return field
+        finally:
+            with self._lock:
+                del self._pending[key]
+            done.set()
+
+    def _load_or_build(self, key, letter, size, box, tolerance):
+        path = self.path_for(key)
+        try:
+            field = LetterField.load(path, letter, size, tolerance)
+            self.hits += 1
+        except (OSError, ValueError, KeyError) as e:
+            if DEBUG and not isinstance(e, FileNotFoundError):
+                print(f"Letter field {path} unusable: {e}")
+            field = LetterField.build(letter, size, box, tolerance)
+            self.builds += 1
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                field.save(path)
+            except OSError as e:
+                print(f"Could not cache letter field for {letter!r}: {e}")
+        return field
+
+    def prefetch(self, letter, size, box, tolerance=None):
+        """Load or build a field in the background so a later get() finds it in memory"""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._prefetch_loop, name="letter-fields", daemon=True)
+                self._worker.start()
+        self._prefetch_queue.put((letter, size, box, tolerance))
+
+    def _prefetch_loop(self):
+        while True:
+            letter, size, box, tolerance = self._prefetch_queue.get()
+            try:
+                self.get(letter, size, box, tolerance)
+            except Exception as e:
+                print(f"Could not prefetch letter field for {letter!r}: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._fields.clear()
+
+
+def default_tolerance(size):
+    return max(6, int(round(size[1] * TOLERANCE_FRACTION)))
+
+
+_cache = None
+
+
+def get_letter_fields():
+    """The process-wide letter field cache"""
+    global _cache
+    if _cache is None:
+        _cache = LetterFieldCache()
+    return _cache
+
+
+class StrokeScore:
+    """Running score of one traced stroke against a LetterField.
+
+    add(x, y) costs O(1): it reads the point's distance and cell and updates
+    the counters, so scoring a frame costs as much as the points it added.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self.covered = np.zeros(max(1, field.cell_count), bool)
+        self.covered_count = 0
+        self.points = 0
+        self.on_path = 0
+        self.distance_sum = 0
+
+    def add(self, x, y):
+        field = self.field
+        h, w = field.distance.shape
+        if not (0 <= x < w and 0 <= y < h):
+            self.points += 1
+            return
+        d = int(field.distance[y, x])
+        self.points += 1
+        self.distance_sum += d
+        if d <= field.tolerance:
+            self.on_path += 1
+        cell = field.cells[y, x]
+        if cell != NO_CELL and not self.covered[cell]:
+            self.covered[cell] = True
+            self.covered_count += 1
+
+    @property
+    def coverage(self):
+        """Fraction of the letter's skeleton the stroke has passed near"""
+        return self.covered_count / self.field.cell_count if self.field.cell_count else 0.0
+
+    @property
+    def accuracy(self):
+        """Fraction of stroke points that were on the letter"""
+        return self.on_path / self.points if self.points else 0.0
+
+    @property
+    def mean_distance(self):
+        return self.distance_sum / self.points if self.points else 0.0
+
+
+def main(argv=None):
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="Precompute the air tracing letter fields for a game resolution")
+    parser.add_argument("--size", default="1280x720", help="game frame size WxH")
+    args = parser.parse_args(argv)
+    width, height = (int(v) for v in args.size.lower().split("x"))
+
+    from game_logic import AirTraceGame
+    game = AirTraceGame()
+    game.setup_game(width, height)
+    cache = get_letter_fields()
+    start = time.perf_counter()
+    for letter in TRACE_LETTERS:
+        field = cache.get(letter, (width, height), game.letter_box())
+        if DEBUG:
+            print(f"{letter}: {field.cell_count} cells")
+    seconds = time.perf_counter() - start
+    print(f"{len(TRACE_LETTERS)} letter fields at {width}x{height}: {cache.builds} built, {cache.hits} cached, "
+          f"{seconds:.2f}s ({cache.cache_dir})")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,188 @@
+# Micro-benchmarks for the per-frame hot functions (no camera or display needed)
+import gc
+import json
+import statistics
+import sys
+import time
+import cv2
+import numpy as np
+
+# Each sample is a batch of calls lasting at least this long
+MIN_SAMPLE_SECONDS = 0.02
+DEFAULT_SAMPLES = 25
+WARMUP_SECONDS = 0.1
+
+FRAME_SIZE = (1280, 720)
+
+
+def calibrate(fn, min_time=MIN_SAMPLE_SECONDS):
+    """Calls per sample so that one sample takes at least min_time (like timeit.autorange)"""
+    reps = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            return reps
+        reps = reps * 10 if elapsed < min_time / 10 else max(reps + 1, int(reps * min_time / max(elapsed, 1e-9) * 1.2))
+
+
+def measure(fn, samples=DEFAULT_SAMPLES, warmup=WARMUP_SECONDS):
+    """Warm fn up, calibrate the batch size, then time `samples` batches.
+    Returns a summary in microseconds per call."""
+    end = time.perf_counter() + warmup
+    while time.perf_counter() < end:
+        fn()
+    reps = calibrate(fn)
+    per_call = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # collections would land in random samples
+    try:
+        for _ in range(samples):
+            t0 = time.perf_counter()
+            for _ in range(reps):
+                fn()
+            per_call.append((time.perf_counter() - t0) / reps * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    per_call.sort()
+    q1, median, q3 = statistics.quantiles(per_call, n=4) if len(per_call) > 1 else (per_call[0],) * 3
+    return {
+        "reps": reps,
+        "samples": samples,
+        "min_us": round(per_call[0], 2),
+        "median_us": round(median, 2),
+        "mean_us": round(statistics.fmean(per_call), 2),
+        "stdev_us": round(statistics.stdev(per_call), 2) if len(per_call) > 1 else 0.0,
+        "iqr_us": round(q3 - q1, 2),
+        "p95_us": round(float(np.percentile(per_call, 95)), 2),
+    }
+
+
+def _frame(size=FRAME_SIZE, seed=0):
+    w, h = size
+    rng = np.random.default_rng(seed)
+    return cv2.resize(rng.integers(0, 256, (h // 20, w // 20, 3), dtype=np.uint8), (w, h),
+                      interpolation=cv2.INTER_LINEAR)
+
+
+def _hand_landmarks(size=FRAME_SIZE):
+    """Pixel landmarks [(id, x, y)] of the benchmark's scripted hand"""
+    from benchmark import scripted_hand
+    w, h = size
+    return [(i, int(x * w), int(y * h)) for i, (x, y, _) in enumerate(scripted_hand(0, w / h))]
+
+
+# Each case: name -> setup() returning a zero-argument callable.
+# Setups import lazily so one missing dependency only skips its own cases.
+
+def _find_hands_case(scale):
+    def setup():
+        from hand_tracker import HandTracker
+        tracker = HandTracker(max_hands=2, processing_scale=scale)
+        img = _frame()
+        return lambda: tracker.find_hands(img, draw=False)
+    return setup
+
+
+def _finger_states_setup():
+    from hand_tracker import HandTracker
+    tracker = HandTracker()
+    landmarks = _hand_landmarks()
+    return lambda: tracker.get_finger_states(landmarks)
+
+
+def _smooth_landmarks_setup():
+    from hand_tracker import HandTracker
+    tracker = HandTracker()
+    landmarks = _hand_landmarks()
+    tracker.smooth_landmarks(landmarks)
+    return lambda: tracker.smooth_landmarks(landmarks)
+
+
+def _draw_text_case(text, scale):
+    def setup():
+        from utils import draw_text
+        img = _frame()
+        return lambda: draw_text(img, text, (40, 200), (255, 255, 255), scale, 2, ui_scale=1.6)
+    return setup
+
+
+def _convert_case(size):
+    def setup():
+        from presenter import FrameConverter
+        converter = FrameConverter()
+        img = _frame()
+        return lambda: converter.convert(img, *size)
+    return setup
+
+
+def _color_game_setup(method):
+    def setup():
+        from game_logic import ColorRecognitionGame
+        game = ColorRecognitionGame(seed=1)
+        game.setup_game(*FRAME_SIZE)
+        img = _frame()
+        if method == "tint":
+            return lambda: game._draw_target_tint(img.copy())
+        patch = img[300:309, 600:609].copy()
+        return lambda: game._matches_target(patch)
+    return setup
+
+
+CASES = {
+    "find_hands[scale=0.5]": _find_hands_case(0.5),
+    "find_hands[scale=0.75]": _find_hands_case(0.75),
+    "find_hands[scale=1.0]": _find_hands_case(1.0),
+    "get_finger_states": _finger_states_setup,
+    "smooth_landmarks": _smooth_landmarks_setup,
+    "draw_text[latin]": _draw_text_case("Score: 120  Progress: 3/20", 1.0),
+    "draw_text[tamil]": _draw_text_case("வணக்கம் நண்பர்களே", 1.0),
+    "update_canvas[convert 1280x720]": _convert_case(FRAME_SIZE),
+    "update_canvas[convert+resize 1920x1080]": _convert_case((1920, 1080)),
+    "color_game[tint mask]": _color_game_setup("tint"),
+    "color_game[fingertip patch]": _color_game_setup("patch"),
+}
+
+
+def run(names=None, samples=DEFAULT_SAMPLES):
+    results = {}
+    for name, setup in CASES.items():
+        if names and not any(pattern in name for pattern in names):
+            continue
+        try:
+            fn = setup()
+        except Exception as e:
+            print(f"{name:42s} skipped ({e})")
+            continue
+        stats = measure(fn, samples)
+        results[name] = stats
+        print(f"{name:42s} median {stats['median_us']:10.1f} us  p95 {stats['p95_us']:10.1f}  "
+              f"iqr {stats['iqr_us']:8.1f}  ({stats['reps']} x {stats['samples']})")
+    return results
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Micro-benchmarks of the per-frame hot functions")
+    parser.add_argument("filter", nargs="*", help="only cases whose name contains one of these")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--json", default=None, help="write results to this file")
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+    results = run(args.filter, args.samples)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"python": sys.version.split()[0], "opencv": cv2.__version__, "results": results}, f, indent=2)
+        print(f"Wrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
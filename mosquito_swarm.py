@@ -0,0 +1,94 @@
+# Mosquito swarm stored as NumPy arrays (struct-of-arrays) for the mosquito game
+import numpy as np
+
+# Waves of mosquitoes per difficulty level; speed is in 800x600 layout pixels per frame
+DIFFICULTY_LEVELS = {
+    "easy": {"waves": (10,), "speed": 4.0, "jitter": 3.0},
+    "normal": {"waves": (10, 30, 60), "speed": 5.0, "jitter": 3.5},
+    "hard": {"waves": (50, 150, 300), "speed": 7.0, "jitter": 4.5},
+}
+
+
+class MosquitoSwarm:
+    """Positions, velocities and alive flags for a whole swarm.
+
+    All mosquitoes move in one vectorized step (a damped random walk that
+    bounces off the play area), and hits are resolved with a single
+    mosquito x fingertip distance matrix.
+    """
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.pos = np.zeros((0, 2), dtype=np.float32)
+        self.vel = np.zeros((0, 2), dtype=np.float32)
+        self.alive = np.zeros(0, dtype=bool)
+        self.bounds = (0.0, 0.0, 1.0, 1.0)
+        self.max_speed = 1.0
+        self.jitter = 1.0
+
+    def __len__(self):
+        return len(self.alive)
+
+    @property
+    def alive_count(self):
+        return int(np.count_nonzero(self.alive))
+
+    def spawn(self, count, bounds, max_speed, jitter):
+        """Replace the swarm with count mosquitoes spread uniformly over bounds (x0, y0, x1, y1)"""
+        x0, y0, x1, y1 = bounds
+        self.bounds = bounds
+        self.max_speed = float(max_speed)
+        self.jitter = float(jitter)
+        low = np.array([x0, y0], dtype=np.float32)
+        high = np.array([x1, y1], dtype=np.float32)
+        self.pos = self.rng.uniform(low, high, size=(count, 2)).astype(np.float32)
+        angle = self.rng.uniform(0.0, 2.0 * np.pi, size=count)
+        speed = self.rng.uniform(0.3, 1.0, size=count) * self.max_speed
+        self.vel = np.stack([np.cos(angle) * speed, np.sin(angle) * speed], axis=1).astype(np.float32)
+        self.alive = np.ones(count, dtype=bool)
+
+    def step(self):
+        """Advance every live mosquito one frame"""
+        if not len(self.alive):
+            return
+        x0, y0, x1, y1 = self.bounds
+        self.vel += self.rng.uniform(-self.jitter, self.jitter, size=self.vel.shape).astype(np.float32)
+        # Cap speed so jitter cannot accumulate into runaway velocities
+        speed = np.hypot(self.vel[:, 0], self.vel[:, 1])
+        too_fast = speed > self.max_speed
+        if too_fast.any():
+            self.vel[too_fast] *= (self.max_speed / speed[too_fast])[:, None]
+        self.vel[~self.alive] = 0.0
+        self.pos += self.vel
+
+        # Bounce off the edges of the play area
+        for axis, low, high in ((0, x0, x1), (1, y0, y1)):
+            out = (self.pos[:, axis] < low) | (self.pos[:, axis] > high)
+            if out.any():
+                self.vel[out, axis] *= -1.0
+                np.clip(self.pos[:, axis], low, high, out=self.pos[:, axis])
+
+    def hit(self, points, radius):
+        """Kill at most one mosquito (the nearest in range) per point.
+        points is an (P, 2) array of fingertip positions; returns the killed indices."""
+        if not len(points) or not self.alive.any():
+            return np.zeros(0, dtype=np.intp)
+        live = np.flatnonzero(self.alive)
+        pts = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        diff = self.pos[live, None, :] - pts[None, :, :]
+        dist2 = np.einsum('mpk,mpk->mp', diff, diff)  # (live mosquitoes, points)
+        dist2[dist2 > radius * radius] = np.inf
+
+        killed = []
+        for p in range(dist2.shape[1]):
+            m = int(np.argmin(dist2[:, p]))
+            if np.isfinite(dist2[m, p]):
+                killed.append(live[m])
+                dist2[m, :] = np.inf  # one mosquito can only die once
+        killed = np.array(killed, dtype=np.intp)
+        self.alive[killed] = False
+        return killed
+
+    def live_positions(self):
+        """Integer (x, y) of live mosquitoes, as an (M, 2) array"""
+        return self.pos[self.alive].astype(np.int32)
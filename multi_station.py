@@ -0,0 +1,271 @@
+# Multi-station mode: one game session per camera, each in its own worker process
+import os
+import queue
+import sys
+import time
+import multiprocessing as mp
+from system_info import available_cpus
+
+DEBUG = False
+
+# Seconds between station status messages and supervisor reports
+REPORT_INTERVAL = 2.0
+SYNTHETIC_SOURCE = "synthetic"
+
+
+def assign_cores(stations, cpus=None):
+    """Split the CPUs into one disjoint, contiguous set per station.
+    With more stations than CPUs, stations share CPUs round-robin."""
+    cpus = list(cpus if cpus is not None else available_cpus())
+    if stations <= 0:
+        return []
+    if stations > len(cpus):
+        return [[cpus[i % len(cpus)]] for i in range(stations)]
+    per, extra = divmod(len(cpus), stations)
+    sets, start = [], 0
+    for i in range(stations):
+        count = per + (1 if i < extra else 0)
+        sets.append(cpus[start:start + count])
+        start += count
+    return sets
+
+
+def pin_to_cores(cores):
+    """Restrict the current process (and OpenCV's worker threads) to cores; best effort"""
+    pinned = False
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, cores)
+            pinned = True
+        except OSError as e:
+            if DEBUG:
+                print(f"sched_setaffinity failed: {e}")
+    else:
+        try:
+            import psutil
+            psutil.Process().cpu_affinity(list(cores))
+            pinned = True
+        except Exception as e:
+            if DEBUG:
+                print(f"cpu_affinity unavailable: {e}")
+    import cv2
+    cv2.setNumThreads(max(1, len(cores)))
+    return pinned
+
+
+def _open_source(source, width, height, fps):
+    if source == SYNTHETIC_SOURCE:
+        from benchmark import SyntheticCapture
+        return SyntheticCapture((width, height), count=sys.maxsize)
+    from game_host import open_capture
+    return open_capture(source, width, height, fps)
+
+
+def station_main(index, config, cores, status_queue, stop_event):
+    """Worker process: run games on one camera until stopped, reporting FPS to the supervisor"""
+    if config.get("mute"):
+        os.environ["TAMILGAMES_TTS"] = "null"
+    pinned = pin_to_cores(cores)
+
+    from game_logic import GAMES
+    from game_host import GameHost
+    from presenter import create_presenter
+    from telemetry import TelemetryWriter, DEFAULT_LOG_DIR, set_telemetry, telemetry_enabled
+
+    # One log per station: processes must not rotate the same file
+    set_telemetry(TelemetryWriter(path=os.path.join(DEFAULT_LOG_DIR, f"station{index}.jsonl"),
+                                  enabled=telemetry_enabled()).start())
+
+    name = config["game"]
+    source = config["source"]
+    width, height = config.get("size", (1280, 720))
+    cap = _open_source(source, width, height, config.get("fps", 30))
+    status = {"station": index, "game": name, "source": source, "cores": cores, "pinned": pinned}
+    if not cap.isOpened():
+        status_queue.put(dict(status, error=f"could not open capture source {source!r}", final=True))
+        return
+
+    presenter = create_presenter(config.get("presenter", "highgui"), title=f"Station {index + 1}: {name}",
+                                 fullscreen=config.get("fullscreen", False), size=config.get("render_size"))
+    max_frames = config.get("frames")
+    frames = games = 0
+    start = time.perf_counter()
+    last_report = [start, 0]
+    host = None
+
+    def keep_running():
+        if stop_event.is_set():
+            return False
+        now = time.perf_counter()
+        if now - last_report[0] >= REPORT_INTERVAL:
+            done = frames + host.frame_count
+            fps = (done - last_report[1]) / (now - last_report[0])
+            status_queue.put(dict(status, fps=round(fps, 1), frames=done, games=games,
+                                  tier=host.governor.tier))
+            last_report[0], last_report[1] = now, done
+        return True
+
+    try:
+        # A finished game is followed by a new one, so the station keeps running for the next child
+        while not stop_event.is_set() and not presenter.closed:
+            host = GameHost(GAMES[name](seed=config.get("seed")))
+            remaining = None if max_frames is None else max_frames - frames
+            stats = host.run(cap, presenter, keep_running=keep_running, linger=config.get("linger", 3.0),
+                             max_frames=remaining)
+            frames += stats["frames"]
+            games += 1
+            if not stats["completed"] or (max_frames is not None and frames >= max_frames):
+                break
+    finally:
+        cap.release()
+        presenter.close()
+        seconds = time.perf_counter() - start
+        status_queue.put(dict(status, frames=frames, games=games, seconds=round(seconds, 3),
+                              fps=round(frames / seconds, 1) if seconds > 0 else 0.0, final=True))
+
+
+class StationSupervisor:
+    """Starts one worker process per station, pins each to its own cores and
+    collects their FPS reports.
+
+    Each station has its own camera, HandTracker and MediaPipe graph, so
+    stations share no locks or GIL; the only shared state is read-only and
+    lives in the OS page cache (the memory-mapped asset bundle, fonts, the
+    word bank file). Throughput therefore grows with the number of stations
+    until they run out of cores.
+
+    stations is a list of dicts: source (camera index, video file or
+    "synthetic"), game, and optionally presenter, size, render_size, seed,
+    frames, mute, fullscreen.
+    """
+
+    def __init__(self, stations, cpus=None, report_interval=REPORT_INTERVAL):
+        self.stations = stations
+        self.cores = assign_cores(len(stations), cpus)
+        self.report_interval = report_interval
+        self.context = mp.get_context("spawn")  # the default on Windows and macOS; same behaviour everywhere
+        self.status_queue = self.context.Queue()
+        self.stop_event = self.context.Event()
+        self.processes = []
+        self.status = {}
+        self.finals = {}
+
+    def start(self):
+        if len(self.stations) > len(available_cpus()):
+            print(f"⚠️ {len(self.stations)} stations on {len(available_cpus())} CPUs: stations will share cores")
+        for i, config in enumerate(self.stations):
+            process = self.context.Process(target=station_main, name=f"station-{i}",
+                                           args=(i, config, self.cores[i], self.status_queue, self.stop_event),
+                                           daemon=True)
+            process.start()
+            self.processes.append(process)
+            print(f"Station {i + 1}: {config['game']} on {config['source']!r}, cores {self.cores[i]}")
+        return self
+
+    def poll(self, timeout=0.0):
+        """Collect pending status messages"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                message = self.status_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                return
+            station = message["station"]
+            self.status[station] = message
+            if message.get("final"):
+                self.finals[station] = message
+            if message.get("error"):
+                print(f"❌ Station {station + 1}: {message['error']}")
+
+    def alive(self):
+        return any(p.is_alive() for p in self.processes)
+
+    def report(self):
+        total = 0.0
+        for i in range(len(self.stations)):
+            message = self.status.get(i)
+            if message is None:
+                print(f"  Station {i + 1}: starting")
+                continue
+            fps = message.get("fps", 0.0)
+            total += fps
+            print(f"  Station {i + 1}: {message['game']:<14s} {fps:6.1f} FPS  frames {message.get('frames', 0):6d}  "
+                  f"games {message.get('games', 0)}  cores {message['cores']}"
+                  + ("  (done)" if message.get("final") else ""))
+        print(f"  Total: {total:.1f} FPS")
+        return total
+
+    def run(self, duration=None):
+        """Run until every station has exited, duration seconds have passed or Ctrl+C"""
+        self.start()
+        start = time.monotonic()
+        next_report = start + self.report_interval
+        try:
+            while self.alive():
+                self.poll(timeout=0.2)
+                now = time.monotonic()
+                if duration is not None and now - start >= duration:
+                    break
+                if now >= next_report:
+                    self.report()
+                    next_report = now + self.report_interval
+        except KeyboardInterrupt:
+            print("Stopping stations...")
+        self.stop()
+        return self.summary()
+
+    def stop(self, timeout=5.0):
+        self.stop_event.set()
+        deadline = time.monotonic() + timeout
+        for process in self.processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+        self.poll(timeout=0.5)
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+
+    def summary(self):
+        """Final per-station results and their total FPS"""
+        stations = [self.finals.get(i, self.status.get(i, {"station": i})) for i in range(len(self.stations))]
+        return {"stations": stations, "total_fps": round(sum(s.get("fps", 0.0) for s in stations), 1)}
+
+
+def main(argv=None):
+    import argparse
+    from game_logic import GAMES
+    from presenter import PRESENTERS
+
+    parser = argparse.ArgumentParser(description="Run one game session per camera, each in its own process")
+    parser.add_argument("--sources", default="0,1", help="comma-separated camera indices, video files or 'synthetic'")
+    parser.add_argument("--games", default="drag_drop", help="comma-separated games, one per station (the last repeats)")
+    parser.add_argument("--presenter", choices=PRESENTERS, default="highgui")
+    parser.add_argument("--size", default="1280x720", help="capture size WxH")
+    parser.add_argument("--frames", type=int, default=None, help="stop each station after this many frames")
+    parser.add_argument("--seconds", type=float, default=None, help="stop all stations after this long")
+    parser.add_argument("--cpus", default=None, help="comma-separated CPU ids to spread the stations over")
+    parser.add_argument("--mute", action="store_true", help="no speech (stations share one sound card)")
+    parser.add_argument("--fullscreen", action="store_true")
+    args = parser.parse_args(argv)
+
+    sources = [s.strip() for s in args.sources.split(",") if s.strip()]
+    games = [g.strip() for g in args.games.split(",") if g.strip()]
+    for game in games:
+        if game not in GAMES:
+            parser.error(f"unknown game {game!r} (choose from {', '.join(sorted(GAMES))})")
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    stations = [{"source": source, "game": games[min(i, len(games) - 1)], "presenter": args.presenter,
+                 "size": size, "render_size": size if args.presenter != "highgui" else None,
+                 "frames": args.frames, "mute": args.mute, "fullscreen": args.fullscreen}
+                for i, source in enumerate(sources)]
+    cpus = [int(c) for c in args.cpus.split(",")] if args.cpus else None
+
+    result = StationSupervisor(stations, cpus).run(args.seconds)
+    print("Final:")
+    for s in result["stations"]:
+        print(f"  Station {s['station'] + 1}: {s.get('frames', 0)} frames, {s.get('fps', 0.0)} FPS")
+    print(f"  Total: {result['total_fps']} FPS over {len(stations)} stations")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
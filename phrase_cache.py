@@ -0,0 +1,121 @@
+# On-disk cache of pre-synthesized feedback phrases (WAV clips)
+import hashlib
+import os
+import sys
+
+DEFAULT_CACHE_DIR = os.path.join("assets", "cache", "phrases")
+
+
+def _wav_player():
+    """Return a blocking WAV player function, or None if this platform has none"""
+    if sys.platform.startswith("win"):
+        try:
+            import winsound
+
+            def play(path):
+                winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_NODEFAULT)
+            return play
+        except ImportError:
+            return None
+    return None
+
+
+def _wav_memory_player():
+    """Return a blocking player for in-memory WAV bytes, or None if this platform has none"""
+    if sys.platform.startswith("win"):
+        try:
+            import winsound
+
+            def play(data):
+                winsound.PlaySound(data, winsound.SND_MEMORY | winsound.SND_NODEFAULT)
+            return play
+        except ImportError:
+            return None
+    return None
+
+
+class PhraseCache:
+    """WAV clips keyed by (voice, text).
+
+    Clips are rendered in the background by the speech worker's engine
+    (pyttsx3 save_to_file), so playing a known phrase is just a file play.
+    Clips compiled into the asset bundle are played straight from memory.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, voice_id="default", player=None, bundle=None,
+                 memory_player=None):
+        self.cache_dir = cache_dir
+        self.voice_id = voice_id
+        self.player = player if player is not None else _wav_player()
+        self.bundle = bundle
+        self.memory_player = memory_player if memory_player is not None else _wav_memory_player()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return self.player is not None
+
+    def key(self, text):
+        return hashlib.sha1(f"{self.voice_id}\0{text}".encode('utf-8')).hexdigest()[:20]
+
+    def path_for(self, text):
+        return os.path.join(self.cache_dir, self.key(text) + ".wav")
+
+    def bundled(self, text):
+        """WAV bytes for text from the asset bundle, or None"""
+        if self.bundle is None or self.memory_player is None:
+            return None
+        return self.bundle.audio(self.key(text))
+
+    def has(self, text):
+        if self.bundled(text) is not None:
+            return True
+        try:
+            return os.path.getsize(self.path_for(text)) > 44  # more than a bare WAV header
+        except OSError:
+            return False
+
+    def play(self, text):
+        """Play the cached clip for text; returns False on a miss"""
+        data = self.bundled(text)
+        if data is not None:
+            try:
+                self.memory_player(data)
+                self.hits += 1
+                return True
+            except Exception:
+                pass
+        if not self.enabled or not self.has(text):
+            self.misses += 1
+            return False
+        try:
+            self.player(self.path_for(text))
+        except Exception:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def render(self, backend, text):
+        """Synthesize text to disk with backend; returns True if a clip was written"""
+        if not self.enabled or self.has(text):
+            return False
+        save = getattr(backend, 'save_to_file', None)
+        if save is None:
+            return False
+        os.makedirs(self.cache_dir, exist_ok=True)
+        final_path = self.path_for(text)
+        tmp_path = final_path + ".tmp.wav"
+        try:
+            if not save(text, tmp_path) or not os.path.exists(tmp_path):
+                return False
+            os.replace(tmp_path, final_path)
+            return True
+        except Exception as e:
+            print(f"Phrase cache render failed for {text!r}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
@@ -0,0 +1,64 @@
+# Fixed feedback phrases shared by the games and the speech cache
+import os
+
+# Only the first words of a large bank get a pre-rendered "Correct!" phrase
+PRERENDER_WORD_LIMIT = 200
+
+# Tamil numbers 1-10 (index 0 is "one")
+TAMIL_NUMBERS = [
+    "ஒன்று", "இரண்டு", "மூன்று", "நான்கு", "ஐந்து",
+    "ஆறு", "ஏழு", "எட்டு", "ஒன்பது", "பத்து"
+]
+
+CORRECT_PREFIX = "சரி!"
+# "Good try!": a traced letter that was not accurate enough
+TRY_AGAIN_PREFIX = "நல்ல முயற்சி!"
+DRAG_DROP_COMPLETE = "Congratulations! You matched all words!"
+CONGRATULATIONS = "வாழ்த்துகள்!"
+
+
+def correct_word_phrase(tamil_word):
+    return f"Correct! {tamil_word}"
+
+
+def correct_number_phrase(number):
+    return f"{CORRECT_PREFIX} {TAMIL_NUMBERS[number - 1]}"
+
+
+def correct_letter_phrase(letter):
+    return f"{CORRECT_PREFIX} {letter}"
+
+
+def try_again_letter_phrase(letter):
+    return f"{TRY_AGAIN_PREFIX} {letter}"
+
+
+def load_tamil_words(words_path=os.path.join("assets", "words.json"), limit=PRERENDER_WORD_LIMIT):
+    """Tamil side of the first `limit` word-bank entries"""
+    from word_bank import WORDS_JSON, get_word_bank, load_word_bank
+    shared = os.path.normpath(words_path) == os.path.normpath(WORDS_JSON)
+    try:
+        bank = get_word_bank() if shared else load_word_bank(json_path=words_path)
+    except Exception as e:
+        print(f"Could not open word bank for phrase list: {e}")
+        return []
+    try:
+        if 'tamil' not in bank.fields:
+            return []
+        return [w for w in bank.column('tamil', limit) if w]
+    finally:
+        if not shared:
+            bank.close()
+
+
+def feedback_phrases(words_path=os.path.join("assets", "words.json")):
+    """Every phrase the games can speak (up to PRERENDER_WORD_LIMIT words), in a stable order"""
+    phrases = list(TAMIL_NUMBERS)
+    phrases += [correct_number_phrase(n) for n in range(1, len(TAMIL_NUMBERS) + 1)]
+    phrases += [correct_word_phrase(w) for w in load_tamil_words(words_path)]
+    from letter_fields import TRACE_LETTERS
+    phrases += [correct_letter_phrase(letter) for letter in TRACE_LETTERS]
+    phrases += [try_again_letter_phrase(letter) for letter in TRACE_LETTERS]
+    phrases += [DRAG_DROP_COMPLETE, CONGRATULATIONS]
+    # De-duplicate while keeping order
+    return list(dict.fromkeys(phrases))
@@ -0,0 +1,324 @@
+# Frame presenters: where finished game frames go (Tk canvas, OpenCV window, video file, nowhere)
+import time
+import cv2
+import numpy as np
+from utils import letterbox_geometry
+from frame_mailbox import FrameMailbox
+from stage_timers import TIMERS
+from telemetry import get_telemetry
+
+# Toggle per-frame conversion timing logs here
+DEBUG = False
+
+# How often the Tk main thread checks for a new frame (ms)
+PRESENT_INTERVAL_MS = 10
+
+
+class Presenter:
+    """Interface shared by all presenters.
+
+    present(frame) is called from the game thread with a finished BGR frame.
+    target_size is the (width, height) games should render at, or None if
+    the presenter has no preference. poll_key() returns the last key pressed
+    (-1 if none) and closed turns True once the user closed the output.
+    """
+    name = "base"
+
+    def __init__(self):
+        self.target_size = None
+        self.closed = False
+        self.frames = 0
+
+    def present(self, frame):
+        raise NotImplementedError
+
+    def poll_key(self):
+        return -1
+
+    def wait(self, seconds):
+        """Keep the output alive for a while (e.g. on the completion screen)"""
+        time.sleep(seconds)
+
+    def close(self):
+        self.closed = True
+
+
+class NullPresenter(Presenter):
+    """Discards frames: capture + inference + game logic with no display cost"""
+    name = "null"
+
+    def __init__(self, target_size=None):
+        super().__init__()
+        self.target_size = target_size
+
+    def present(self, frame):
+        self.frames += 1
+
+    def wait(self, seconds):
+        pass
+
+
+class RecorderPresenter(Presenter):
+    """Writes frames to a video file; the size is fixed by the first frame"""
+    name = "record"
+
+    def __init__(self, path, fps=30.0, fourcc="MJPG", target_size=None):
+        super().__init__()
+        self.path = path
+        self.fps = fps
+        self.fourcc = fourcc
+        self.target_size = target_size
+        self.writer = None
+        self._size = None
+
+    def present(self, frame):
+        h, w = frame.shape[:2]
+        if self.writer is None:
+            self._size = (w, h)
+            self.writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, self._size)
+            if not self.writer.isOpened():
+                print(f"❌ Could not open video writer for {self.path}")
+                self.writer = None
+                self.closed = True
+                return
+        if (w, h) != self._size:
+            frame = cv2.resize(frame, self._size, interpolation=cv2.INTER_LINEAR)
+        self.writer.write(frame)
+        self.frames += 1
+
+    def wait(self, seconds):
+        pass
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None
+        super().close()
+
+
+class HighGUIPresenter(Presenter):
+    """OpenCV window, optionally fullscreen; low overhead on kiosks without Tk.
+
+    HighGUI is not thread-safe: create, present and close from one thread.
+    """
+    name = "highgui"
+
+    def __init__(self, title="Tamil Kids Learning Games", fullscreen=False):
+        super().__init__()
+        self.title = title
+        self.fullscreen = fullscreen
+        self._last_key = -1
+        cv2.namedWindow(self.title, cv2.WINDOW_NORMAL)
+        if fullscreen:
+            cv2.setWindowProperty(self.title, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
+            cv2.waitKey(1)
+            try:
+                _, _, w, h = cv2.getWindowImageRect(self.title)
+                if w > 1 and h > 1:
+                    self.target_size = (w, h)
+            except cv2.error:
+                pass
+
+    def present(self, frame):
+        cv2.imshow(self.title, frame)
+        key = cv2.waitKey(1)
+        if key != -1:
+            self._last_key = key & 0xFF
+        self.frames += 1
+        try:
+            if cv2.getWindowProperty(self.title, cv2.WND_PROP_VISIBLE) < 1:
+                self.closed = True
+        except cv2.error:
+            self.closed = True
+
+    def poll_key(self):
+        key, self._last_key = self._last_key, -1
+        return key
+
+    def wait(self, seconds):
+        cv2.waitKey(max(1, int(seconds * 1000)))
+
+    def close(self):
+        try:
+            cv2.destroyWindow(self.title)
+        except cv2.error:
+            pass
+        super().close()
+
+
+class FrameConverter:
+    """BGR frame -> RGB buffer at display size, reusing its output buffers"""
+
+    def __init__(self, interpolation=cv2.INTER_LINEAR):
+        self.interpolation = interpolation
+        self._resized = None
+        self._rgb = None
+
+    def _buffer(self, buf, h, w):
+        if buf is None or buf.shape[0] != h or buf.shape[1] != w:
+            buf = np.empty((h, w, 3), dtype=np.uint8)
+        return buf
+
+    def convert(self, img, new_w, new_h):
+        h, w = img.shape[:2]
+        if (w, h) != (new_w, new_h):
+            self._resized = self._buffer(self._resized, new_h, new_w)
+            cv2.resize(img, (new_w, new_h), dst=self._resized, interpolation=self.interpolation)
+            src = self._resized
+        else:
+            src = img
+        self._rgb = self._buffer(self._rgb, new_h, new_w)
+        cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        return self._rgb
+
+
+class TkPresenter(Presenter):
+    """Shows frames on a Tk canvas with one image item and one PhotoImage.
+
+    present() may be called from any thread; it copies the frame into a
+    buffer the mailbox owns (game frames come from a FramePool and are
+    reused) and publishes it in a latest-wins FrameMailbox. start() runs an after() loop on the Tk main
+    thread that draws the newest frame. The PhotoImage is only recreated when
+    the display size changes; every other frame is pasted into it.
+    """
+    name = "tk"
+
+    def __init__(self, canvas, interpolation=cv2.INTER_LINEAR, interval_ms=PRESENT_INTERVAL_MS):
+        super().__init__()
+        self.canvas = canvas
+        self.converter = FrameConverter(interpolation)
+        self.mailbox = FrameMailbox()
+        self.interval_ms = interval_ms
+        self.photo = None
+        self.image_item = None
+        self._geometry_key = None
+        self._geometry = None
+        self._photo_size = None
+        self._image_pos = None
+        self._job = None
+        self.last_convert_ms = 0.0
+        self.avg_convert_ms = 0.0
+        # Last known canvas size; read by game threads to pick their render size
+        self.canvas.bind('<Configure>', self._on_configure, add='+')
+
+    def _on_configure(self, event):
+        if event.width > 1 and event.height > 1:
+            self.target_size = (event.width, event.height)
+
+    def canvas_size(self):
+        size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        if size[0] > 1 and size[1] > 1:
+            self.target_size = size
+        return size
+
+    def geometry(self, img_w, img_h, canvas_w, canvas_h):
+        key = (img_w, img_h, canvas_w, canvas_h)
+        if key != self._geometry_key:
+            self._geometry_key = key
+            self._geometry = letterbox_geometry(img_w, img_h, canvas_w, canvas_h)
+        return self._geometry
+
+    def present(self, frame):
+        """Publish a finished frame; safe to call from game threads"""
+        if frame is None or frame.size == 0:
+            return
+        self.mailbox.publish_copy(frame)
+
+    def start(self):
+        """Start the presentation loop (Tk main thread)"""
+        self.canvas_size()
+        self._job = self.canvas.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        self._job = None
+        try:
+            alive = bool(self.canvas.winfo_exists())
+        except Exception:
+            alive = False
+        if not alive or self.closed:
+            self.closed = True
+            stats = self.mailbox.stats()
+            print(f"Frames presented: {stats['presented']}, dropped: {stats['dropped']}")
+            return
+
+        img = self.mailbox.take()
+        if img is not None:
+            try:
+                with TIMERS.stage("update_canvas"):
+                    drawn = self.draw(img)
+                if not drawn:
+                    # Canvas not laid out yet; keep the frame unless a newer one arrived
+                    self.mailbox.put_back(img)
+                    img = None
+                elif DEBUG and self.frames % 100 == 1:  # Print every 100th frame
+                    stats = self.mailbox.stats()
+                    print(f"📷 Canvas update: img={img.shape}, dropped={stats['dropped']}")
+            except Exception as e:
+                get_telemetry().error("update_canvas", e)
+            finally:
+                if img is not None:
+                    self.mailbox.release(img)
+
+        self._job = self.canvas.after(self.interval_ms, self._tick)
+
+    def draw(self, img):
+        """Draw img on the canvas now (Tk main thread). Returns False if the canvas is not ready yet."""
+        import tkinter as tk
+        from PIL import Image, ImageTk
+
+        canvas_w, canvas_h = self.canvas_size()
+        if canvas_w <= 1 or canvas_h <= 1:
+            return False
+
+        h, w = img.shape[:2]
+        new_w, new_h, x_off, y_off = self.geometry(w, h, canvas_w, canvas_h)
+
+        t0 = time.perf_counter()
+        rgb = self.converter.convert(img, new_w, new_h)
+        frame_pil = Image.frombuffer('RGB', (new_w, new_h), rgb, 'raw', 'RGB', 0, 1)
+
+        if self._photo_size != (new_w, new_h):
+            self.photo = ImageTk.PhotoImage('RGB', (new_w, new_h))
+            self._photo_size = (new_w, new_h)
+            if self.image_item is None:
+                self.image_item = self.canvas.create_image(x_off, y_off, anchor=tk.NW, image=self.photo)
+                self._image_pos = (x_off, y_off)
+            else:
+                self.canvas.itemconfigure(self.image_item, image=self.photo)
+        self.photo.paste(frame_pil)
+
+        if self._image_pos != (x_off, y_off):
+            self.canvas.coords(self.image_item, x_off, y_off)
+            self._image_pos = (x_off, y_off)
+
+        self.last_convert_ms = (time.perf_counter() - t0) * 1000.0
+        self.avg_convert_ms = self.last_convert_ms if self.frames == 0 else \
+            0.95 * self.avg_convert_ms + 0.05 * self.last_convert_ms
+        self.frames += 1
+        if DEBUG:
+            print(f"📷 Present {w}x{h} -> {new_w}x{new_h}: {self.last_convert_ms:.2f} ms "
+                  f"(avg {self.avg_convert_ms:.2f} ms)")
+        return True
+
+    def close(self):
+        if self._job is not None:
+            try:
+                self.canvas.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+        super().close()
+
+
+PRESENTERS = ("highgui", "null", "record")
+
+
+def create_presenter(kind, title="Tamil Kids Learning Games", output=None, fullscreen=False, size=None):
+    """Build a standalone presenter by name (Tk presenters need a canvas, see TkPresenter)"""
+    if kind == "highgui":
+        return HighGUIPresenter(title, fullscreen=fullscreen)
+    if kind == "null":
+        return NullPresenter(target_size=size)
+    if kind == "record":
+        return RecorderPresenter(output or "session.avi", target_size=size)
+    raise ValueError(f"Unknown presenter: {kind}")
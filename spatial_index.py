@@ -0,0 +1,86 @@
+# Uniform-grid spatial hash for hit-testing screen rectangles
+import math
+
+
+class UniformGrid:
+    """Buckets axis-aligned rects into square cells.
+
+    A point lookup only checks the rects registered in that point's cell, and
+    a nearest-centre search only visits cells within the search radius, so
+    both cost the same no matter how many rects the board holds (as long as
+    cell_size is about the size of one rect).
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = max(1, int(cell_size))
+        self.cells = {}
+        self.items = {}  # item_id -> (rect, center)
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def _cells_for_rect(self, rect):
+        x, y, w, h = rect
+        cx0, cy0 = self._cell(x, y)
+        cx1, cy1 = self._cell(x + w, y + h)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                yield cx, cy
+
+    def insert(self, item_id, rect, center=None):
+        if item_id in self.items:
+            self.remove(item_id)
+        x, y, w, h = rect
+        if center is None:
+            center = (x + w // 2, y + h // 2)
+        self.items[item_id] = (rect, center)
+        for cell in self._cells_for_rect(rect):
+            self.cells.setdefault(cell, []).append(item_id)
+
+    def remove(self, item_id):
+        entry = self.items.pop(item_id, None)
+        if entry is None:
+            return
+        for cell in self._cells_for_rect(entry[0]):
+            bucket = self.cells.get(cell)
+            if bucket and item_id in bucket:
+                bucket.remove(item_id)
+                if not bucket:
+                    del self.cells[cell]
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+
+    def __len__(self):
+        return len(self.items)
+
+    def query_point(self, x, y):
+        """Return the id of a rect containing (x, y), or None"""
+        for item_id in self.cells.get(self._cell(x, y), ()):
+            rx, ry, rw, rh = self.items[item_id][0]
+            if rx <= x <= rx + rw and ry <= y <= ry + rh:
+                return item_id
+        return None
+
+    def nearest(self, x, y, max_dist):
+        """Return (item_id, distance) of the closest rect centre within max_dist, or (None, inf)"""
+        best_id, best_dist = None, float('inf')
+        if not self.items:
+            return best_id, best_dist
+        # Centres can sit up to half a rect away from the cells their rect covers,
+        # so widen the search by one cell on each side.
+        reach = int(math.ceil(max_dist / self.cell_size)) + 1
+        cx0, cy0 = self._cell(x, y)
+        seen = set()
+        for cy in range(cy0 - reach, cy0 + reach + 1):
+            for cx in range(cx0 - reach, cx0 + reach + 1):
+                for item_id in self.cells.get((cx, cy), ()):
+                    if item_id in seen:
+                        continue
+                    seen.add(item_id)
+                    ccx, ccy = self.items[item_id][1]
+                    d = math.hypot(x - ccx, y - ccy)
+                    if d <= max_dist and d < best_dist:
+                        best_id, best_dist = item_id, d
+        return best_id, best_dist
@@ -0,0 +1,316 @@
+# Background text-to-speech worker for game feedback
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+DEBUG = False
+
+
+class NullSpeechBackend:
+    """Backend that discards speech (tests, headless runs, machines without audio)"""
+    name = "null"
+    voice_id = "null"
+
+    def __init__(self):
+        self.spoken = []
+
+    def say(self, text):
+        self.spoken.append(text)
+
+    def save_to_file(self, text, path):
+        return False
+
+    def close(self):
+        pass
+
+
+class Pyttsx3Backend:
+    """One long-lived pyttsx3 engine; must be created and used on the worker thread"""
+    name = "pyttsx3"
+
+    def __init__(self, rate=None):
+        import pyttsx3
+        self.engine = pyttsx3.init()
+        if rate is not None:
+            self.engine.setProperty('rate', rate)
+        try:
+            self.voice_id = str(self.engine.getProperty('voice'))
+        except Exception:
+            self.voice_id = "default"
+
+    def say(self, text):
+        self.engine.say(text)
+        self.engine.runAndWait()
+
+    def save_to_file(self, text, path):
+        self.engine.save_to_file(text, path)
+        self.engine.runAndWait()
+        return True
+
+    def close(self):
+        try:
+            self.engine.stop()
+        except Exception:
+            pass
+
+
+def create_backend(kind=None):
+    """Create a speech backend. TAMILGAMES_TTS=null forces the silent backend."""
+    kind = kind or os.environ.get("TAMILGAMES_TTS", "pyttsx3")
+    if kind == "null":
+        return NullSpeechBackend()
+    try:
+        return Pyttsx3Backend()
+    except Exception as e:
+        print(f"Speech engine unavailable ({e}); feedback will be silent")
+        return NullSpeechBackend()
+
+
+class SpeechWorker:
+    """Speaks queued phrases on a dedicated thread so callers never block.
+
+    The queue is bounded; when it is full the oldest phrase is dropped.
+    Before speaking, pending phrases are coalesced: phrases older than
+    max_age are skipped (only the newest survives), duplicates are dropped,
+    and a phrase repeated within repeat_window of being spoken is ignored.
+
+    With a phrase cache, cached clips are played instead of synthesizing
+    live, and clips for prerender() phrases and cache misses are rendered
+    using the same engine. Live phrases have strict priority: a render only
+    starts when no phrase is waiting and none was queued in the last
+    render_idle seconds, so at most the one render already in progress can
+    delay a phrase (feedback tends to come in bursts). prerender_source is a
+    callable returning phrases to pre-render; it is called on the worker
+    thread, so building the list never stalls the first caller of speak().
+    """
+
+    def __init__(self, backend_factory=create_backend, max_queue=4, max_age=2.0, repeat_window=1.0,
+                 phrase_cache_dir=None, prerender_source=None, render_idle=1.0):
+        self.backend_factory = backend_factory
+        self.backend = None
+        self.phrase_cache_dir = phrase_cache_dir
+        self.phrase_cache = None
+        self.prerender_source = prerender_source
+        self._render_jobs = deque()
+        self.render_idle = render_idle
+        self._last_queued_at = 0.0
+        self.last_latency_ms = None
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.max_age = max_age
+        self.repeat_window = repeat_window
+        self.dropped = 0
+        self.spoken_count = 0
+        self._last_text = None
+        self._last_spoken_at = 0.0
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="speech-worker", daemon=True)
+        self._thread.start()
+        return self
+
+    def speak(self, text):
+        """Queue a phrase; returns immediately and never raises"""
+        if not text:
+            return
+        item = (text, time.monotonic())
+        self._last_queued_at = item[1]
+        while True:
+            try:
+                self.queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()  # the evicted phrase is finished, or wait_idle never returns
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def prerender(self, phrases):
+        """Queue phrases to be rendered to the phrase cache while idle"""
+        self._render_jobs.extend(phrases)
+        try:
+            self.queue.put_nowait(None)  # wake the worker if it is blocked on an empty queue
+        except queue.Full:
+            pass
+
+    def wait_idle(self, timeout=5.0):
+        """Block until everything queued so far has been handled (for tests/tools)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def stop(self, timeout=1.0):
+        if not self._running:
+            return
+        self._running = False
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _coalesce(self, first):
+        """Drain pending phrases; returns (phrases to speak, number of queue items taken)"""
+        items = [first]
+        while True:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        taken = len(items)
+        items = [it for it in items if it is not None]
+        if not items:
+            return [], taken
+
+        now = time.monotonic()
+        newest = items[-1]
+        fresh = [it for it in items if now - it[1] <= self.max_age]
+        if not fresh:
+            fresh = [newest]
+        self.dropped += len(items) - len(fresh)
+
+        phrases = []
+        seen = set()
+        for text, queued_at in fresh:
+            if text in seen:
+                self.dropped += 1
+                continue
+            seen.add(text)
+            phrases.append((text, queued_at))
+        return phrases, taken
+
+    def _say(self, text, queued_at):
+        now = time.monotonic()
+        if text == self._last_text and now - self._last_spoken_at < self.repeat_window:
+            self.dropped += 1
+            return
+        self.last_latency_ms = (now - queued_at) * 1000.0
+        if self.phrase_cache is None or not self.phrase_cache.play(text):
+            self.backend.say(text)
+            if self.phrase_cache is not None and self.phrase_cache.enabled:
+                self._render_jobs.append(text)
+        self._last_text = text
+        self._last_spoken_at = time.monotonic()
+        self.spoken_count += 1
+
+    def _run(self):
+        try:
+            self.backend = self.backend_factory()
+        except Exception as e:
+            print(f"Speech backend failed to start: {e}")
+            self.backend = NullSpeechBackend()
+        if self.phrase_cache_dir is not None:
+            from phrase_cache import PhraseCache
+            from asset_bundle import get_bundle
+            self.phrase_cache = PhraseCache(self.phrase_cache_dir, voice_id=self.backend.voice_id,
+                                            bundle=get_bundle())
+        if self.prerender_source is not None and self.phrase_cache is not None and self.phrase_cache.enabled:
+            try:
+                self._render_jobs.extend(self.prerender_source())
+            except Exception as e:
+                print(f"Could not list phrases to pre-render: {e}")
+
+        while self._running:
+            wait = self._render_wait()
+            try:
+                if wait is None:
+                    first = self.queue.get()
+                elif wait > 0:
+                    first = self.queue.get(timeout=wait)
+                else:
+                    first = self.queue.get_nowait()
+            except queue.Empty:
+                # Only render straight after finding the live queue empty, never in place of a wait
+                if wait == 0:
+                    self._render_next()
+                continue
+            phrases, taken = self._coalesce(first)
+            for text, queued_at in phrases:
+                try:
+                    self._say(text, queued_at)
+                except Exception as e:
+                    if DEBUG:
+                        print(f"Speech error: {e}")
+            for _ in range(taken):
+                self.queue.task_done()
+
+        try:
+            self.backend.close()
+        except Exception:
+            pass
+
+    def _render_wait(self):
+        """Seconds until a render may start: None with nothing to render, 0 to render now"""
+        if not self._render_jobs:
+            return None
+        return max(0.0, self._last_queued_at + self.render_idle - time.monotonic())
+
+    def _render_next(self):
+        try:
+            text = self._render_jobs.popleft()
+        except IndexError:
+            return
+        if self.phrase_cache is None or not self.phrase_cache.enabled:
+            self._render_jobs.clear()
+            return
+        self.phrase_cache.render(self.backend, text)
+
+
+def _feedback_phrases():
+    # Loads the word bank and the tracing letters: run on the speech worker, not the game thread
+    from phrases import feedback_phrases
+    return feedback_phrases()
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def get_speech_worker():
+    """Return the shared speech worker, starting it on first use"""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            from phrase_cache import DEFAULT_CACHE_DIR
+            _worker = SpeechWorker(phrase_cache_dir=DEFAULT_CACHE_DIR, prerender_source=_feedback_phrases).start()
+        return _worker
+
+
+def set_speech_worker(worker):
+    """Replace the shared worker (e.g. with a null backend for tests)"""
+    global _worker
+    with _worker_lock:
+        old = _worker
+        _worker = worker
+    if old is not None and old is not worker:
+        old.stop()
+
+
+def speak(text):
+    """Fire-and-forget speech; safe to call from the camera/game threads"""
+    try:
+        get_speech_worker().speak(text)
+    except Exception as e:
+        if DEBUG:
+            print(f"Speech enqueue failed: {e}")
+
+
+def shutdown_speech():
+    global _worker
+    with _worker_lock:
+        worker = _worker
+        _worker = None
+    if worker is not None:
+        worker.stop()
@@ -0,0 +1,173 @@
+# Split-screen two-player mode: one wide camera, one game per half, halves processed in parallel
+import random
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+import numpy as np
+from game_host import GameHost
+from stage_timers import TIMERS
+from calibration import get_tuning, tier_for
+from utils import draw_text, layout_scale, px
+
+PLAYER_COLORS = ((255, 180, 0), (0, 140, 255))
+
+
+class SplitScreenMatch:
+    """The two players' games seen as one: complete as soon as either player finishes"""
+
+    def __init__(self, games):
+        self.games = list(games)
+        self.winner = None
+
+    @property
+    def game_complete(self):
+        if self.winner is None:
+            for i, game in enumerate(self.games):
+                if game.game_complete:
+                    self.winner = i
+                    break
+        return self.winner is not None
+
+    @property
+    def score(self):
+        return [getattr(g, "score", getattr(g, "kill_count", None)) for g in self.games]
+
+
+class SplitScreenHost(GameHost):
+    """GameHost for two players sharing one camera.
+
+    Smoothing and the mirror flip run once on the whole capture frame, so
+    each child stays on their own side of the screen. The frame is then cut
+    into a left and a right half, and each half goes through its own
+    GameHost (own HandTracker, game, clock and frame pool) on a separate
+    worker thread; MediaPipe and OpenCV release the GIL, so the two
+    inferences run in parallel. Each player's game renders at half the
+    display width, and the two finished halves are copied side by side.
+
+    Landmarks are normalized to the half they were found in, so each game
+    sees coordinates in its own half without any remapping code, and a
+    hand reaching across the middle belongs to the half its landmarks are in.
+
+    Use it like GameHost: run(capture, presenter, ...) stops when either
+    player completes their game; self.game.winner says who.
+    """
+
+    def __init__(self, games, display_size_fn=None, frame_alpha=None, mirror=True, draw_landmarks=True,
+                 governor=None, pool=None):
+        if len(games) != 2:
+            raise ValueError("split screen needs exactly two games")
+        self.game = SplitScreenMatch(games)
+        self._init_pipeline(display_size_fn, frame_alpha, mirror, draw_landmarks, governor, pool, get_tuning())
+        # Per-player pipelines: no smoothing or flip of their own, and one shared quality governor
+        self.players = [GameHost(game, display_size_fn=self._half_display_size, frame_alpha=1.0, mirror=False,
+                                 draw_landmarks=draw_landmarks, governor=self.governor)
+                        for game in games]
+        for player in self.players:
+            player.show_hud = False  # drawn once, across the whole frame, in process_frame
+        # The players share one governor, so start at the tier of the heavier game
+        tier = max(tier_for(game) for game in games)
+        if governor is None and tier:
+            self.governor.set_tier(tier)
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="split-player")
+
+    def _half_display_size(self):
+        display = self.display_size_fn() if self.display_size_fn else None
+        if not display or display[0] <= 1 or display[1] <= 1:
+            return None
+        return max(1, display[0] // 2), display[1]
+
+    def process_frame(self, img):
+        """Turn one captured frame into the two players' halves side by side"""
+        pool = self.pool
+        pool.begin_frame()
+        if self.frame_alpha < 1.0 and self.prev_frame is not None and self.prev_frame.shape == img.shape \
+                and self.governor.enabled("frame_blend"):
+            img = cv2.addWeighted(img, self.frame_alpha, self.prev_frame, 1 - self.frame_alpha, 0,
+                                  dst=pool.get("blend", img.shape, depth=2))
+        self.prev_frame = img
+        if self.mirror:
+            img = cv2.flip(img, 1, dst=pool.get("mirror", img.shape))
+
+        mid = img.shape[1] // 2
+        halves = (img[:, :mid], img[:, mid:2 * mid])
+        futures = [self.executor.submit(player.process_frame, half) for player, half in zip(self.players, halves)]
+        left, right = [future.result() for future in futures]
+        self.last_inference_ms = max(p.last_inference_ms or 0.0 for p in self.players)
+
+        h = min(left.shape[0], right.shape[0])
+        lw, rw = left.shape[1], right.shape[1]
+        self.render_size = (lw + rw, h)
+        frame = pool.get("render", (h, lw + rw, 3))
+        np.copyto(frame[:, :lw], left[:h])
+        np.copyto(frame[:, lw:], right[:h])
+        self._draw_overlay(frame, lw)
+        if TIMERS.hud and self.show_hud:
+            TIMERS.draw_hud(frame)
+        self.frame_count += 1
+        return frame
+
+    def _draw_overlay(self, frame, split_x):
+        h, w = frame.shape[:2]
+        s = layout_scale(w // 2, h)
+        cv2.line(frame, (split_x, 0), (split_x, h), (255, 255, 255), max(2, px(4, s)))
+        # Player tags in the bottom-right corner of each half
+        for i, color in enumerate(PLAYER_COLORS):
+            x = (split_x if i == 0 else w) - px(110, s)
+            draw_text(frame, f"Player {i + 1}", (x, h - px(12, s)), color, 0.7, 2, ui_scale=s)
+        if self.game.game_complete:
+            text = f"Player {self.game.winner + 1} wins!"
+            draw_text(frame, text, (w // 2 - px(150, s), h // 2 - px(120, s)),
+                      PLAYER_COLORS[self.game.winner], 1.6, 4, ui_scale=s)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def main(argv=None):
+    import argparse
+    from game_logic import GAMES
+    from game_host import open_capture
+    from presenter import PRESENTERS, create_presenter
+
+    parser = argparse.ArgumentParser(description="Two players side by side on one wide camera")
+    parser.add_argument("--games", default="finger_count",
+                        help="one game for both players, or two comma-separated games (left,right)")
+    parser.add_argument("--presenter", choices=PRESENTERS, default="highgui")
+    parser.add_argument("--source", default="0", help="camera index or video file")
+    parser.add_argument("--size", default="1920x1080", help="capture size WxH (wide cameras work best)")
+    parser.add_argument("--seed", type=int, default=None, help="same seed for both players (fair race)")
+    parser.add_argument("--frames", type=int, default=None)
+    parser.add_argument("--output", default="split.avi", help="video file for --presenter record")
+    parser.add_argument("--fullscreen", action="store_true")
+    args = parser.parse_args(argv)
+
+    names = [g.strip() for g in args.games.split(",") if g.strip()]
+    names = (names * 2)[:2]
+    for name in names:
+        if name not in GAMES:
+            parser.error(f"unknown game {name!r} (choose from {', '.join(sorted(GAMES))})")
+    seed = args.seed if args.seed is not None else random.randrange(1 << 30)
+    width, height = (int(v) for v in args.size.lower().split("x"))
+
+    cap = open_capture(args.source, width, height)
+    if not cap.isOpened():
+        print(f"❌ Could not open capture source {args.source!r}")
+        return 1
+    presenter = create_presenter(args.presenter, title="Tamil Games - Two Players", output=args.output,
+                                 fullscreen=args.fullscreen,
+                                 size=(width, height) if args.presenter != "highgui" else None)
+    host = SplitScreenHost([GAMES[name](seed=seed) for name in names])
+    try:
+        stats = host.run(cap, presenter, linger=3.0, max_frames=args.frames)
+    finally:
+        host.close()
+        cap.release()
+        presenter.close()
+    winner = host.game.winner
+    print(f"Split screen: {stats['frames']} frames at {stats['fps']} FPS, scores {host.game.score}"
+          + (f", player {winner + 1} wins" if winner is not None else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
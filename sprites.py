@@ -0,0 +1,169 @@
+# Sprite atlas of pre-rendered RGBA shapes and a batched alpha blitter
+import cv2
+import numpy as np
+
+
+class Sprite:
+    """A BGR + alpha image with an anchor point (the pixel placed at the blit position).
+
+    Fully opaque pixels are copied through a mask; only the partly
+    transparent (anti-aliased) fringe is alpha blended, from flat index
+    arrays so a blit never touches pixels outside the shape.
+    """
+
+    def __init__(self, bgra, anchor, premultiplied=True):
+        self.bgra = np.ascontiguousarray(bgra, dtype=np.uint8)
+        self.height, self.width = self.bgra.shape[:2]
+        self.anchor = np.array(anchor, dtype=np.int32)
+        alpha = self.bgra[:, :, 3]
+        self.bgr = np.ascontiguousarray(self.bgra[:, :, :3])
+        self.opaque = (alpha == 255).astype(np.uint8)
+        self.ys, self.xs = np.nonzero((alpha > 0) & (alpha < 255))
+        a = alpha[self.ys, self.xs].astype(np.uint16)[:, None]
+        bgr = self.bgr[self.ys, self.xs].astype(np.uint16)
+        # Shapes drawn with cv2 onto a transparent canvas already have colour
+        # scaled by coverage at anti-aliased edges, i.e. they are premultiplied.
+        self.premult = bgr * 255 if premultiplied else bgr * a
+        self.inv_alpha = 255 - a
+
+
+def _canvas(w, h):
+    return np.zeros((h, w, 4), dtype=np.uint8)
+
+
+def _shape_color(color):
+    return (int(color[0]), int(color[1]), int(color[2]), 255)
+
+
+def render_mosquito(scale):
+    """Red body with two grey wings (same geometry as the old per-frame drawing)"""
+    body_r = max(2, int(round(15 * scale)))
+    wing_dx, wing_dy = int(round(10 * scale)), int(round(5 * scale))
+    wing_axes = (max(1, int(round(8 * scale))), max(1, int(round(4 * scale))))
+    half = max(body_r, wing_dx + wing_axes[0], wing_dy + wing_axes[1]) + 2
+    img = _canvas(2 * half + 1, 2 * half + 1)
+    c = (half, half)
+    cv2.circle(img, c, body_r, _shape_color((0, 0, 255)), -1, cv2.LINE_AA)
+    cv2.ellipse(img, (half - wing_dx, half - wing_dy), wing_axes, 0, 0, 360, _shape_color((100, 100, 100)), -1, cv2.LINE_AA)
+    cv2.ellipse(img, (half + wing_dx, half - wing_dy), wing_axes, 0, 0, 360, _shape_color((100, 100, 100)), -1, cv2.LINE_AA)
+    return img, c
+
+
+def render_ring(radius, thickness, color):
+    half = radius + thickness + 2
+    img = _canvas(2 * half + 1, 2 * half + 1)
+    cv2.circle(img, (half, half), radius, _shape_color(color), thickness, cv2.LINE_AA)
+    return img, (half, half)
+
+
+def render_disc(radius, color):
+    half = radius + 2
+    img = _canvas(2 * half + 1, 2 * half + 1)
+    cv2.circle(img, (half, half), radius, _shape_color(color), -1, cv2.LINE_AA)
+    return img, (half, half)
+
+
+def render_dashed_rect(width, height, color, thickness, dash):
+    """Dashed rectangle outline; anchored at its top-left corner"""
+    pad = thickness
+    img = _canvas(width + 2 * pad + 1, height + 2 * pad + 1)
+    col = _shape_color(color)
+    x, y = pad, pad
+    for pos in range(0, width, dash * 2):
+        cv2.line(img, (x + pos, y), (x + min(pos + dash, width), y), col, thickness)
+        cv2.line(img, (x + pos, y + height), (x + min(pos + dash, width), y + height), col, thickness)
+    for pos in range(0, height, dash * 2):
+        cv2.line(img, (x, y + pos), (x, y + min(pos + dash, height)), col, thickness)
+        cv2.line(img, (x + width, y + pos), (x + width, y + min(pos + dash, height)), col, thickness)
+    return img, (pad, pad)
+
+
+class SpriteAtlas:
+    """Named sprite builders plus a cache of every variant built so far.
+
+    get("ring", radius=20, thickness=3, color=(0, 255, 0)) renders the ring
+    once and returns the same Sprite on every later call with those
+    arguments, so scaled variants are built on first use only.
+    """
+
+    def __init__(self):
+        self.builders = {
+            "mosquito": render_mosquito,
+            "ring": render_ring,
+            "disc": render_disc,
+            "dashed_rect": render_dashed_rect,
+        }
+        self.cache = {}
+
+    def register(self, name, builder):
+        self.builders[name] = builder
+
+    def get(self, name, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        sprite = self.cache.get(key)
+        if sprite is None:
+            bgra, anchor = self.builders[name](*args, **kwargs)
+            sprite = Sprite(bgra, anchor)
+            self.cache[key] = sprite
+        return sprite
+
+
+_atlas = None
+
+
+def get_atlas():
+    """Process-wide sprite atlas"""
+    global _atlas
+    if _atlas is None:
+        _atlas = SpriteAtlas()
+    return _atlas
+
+
+def blit(img, sprite, x, y):
+    """Blend one sprite with its anchor at (x, y), clipped to img"""
+    blit_many(img, sprite, ((x, y),))
+
+
+def _blend_fringe(img, sprite, ys, xs, keep=None):
+    inv_alpha, premult = sprite.inv_alpha, sprite.premult
+    if keep is not None:
+        inv_alpha, premult = inv_alpha[keep], premult[keep]
+    flat = img.reshape(-1, 3)
+    idx = (ys * img.shape[1] + xs).ravel()
+    dst = np.take(flat, idx, axis=0).reshape(*ys.shape, 3).astype(np.uint16)
+    flat[idx] = ((dst * inv_alpha + premult + 127) // 255).astype(np.uint8).reshape(-1, 3)
+
+
+def blit_many(img, sprite, points):
+    """Blend a sprite at every (x, y) in points.
+
+    Opaque interiors are copied per sprite (cv2.copyTo, all in C); the
+    anti-aliased fringes of every sprite wholly inside img are then
+    blended in one vectorized gather/blend/scatter. Sprites crossing an
+    edge are clipped and handled one by one.
+    """
+    pts = np.asarray(points, dtype=np.int32).reshape(-1, 2) - sprite.anchor
+    if not len(pts):
+        return
+    ih, iw = img.shape[:2]
+    h, w = sprite.height, sprite.width
+    inside = (pts[:, 0] >= 0) & (pts[:, 1] >= 0) & (pts[:, 0] + w <= iw) & (pts[:, 1] + h <= ih)
+
+    full = pts[inside]
+    for x0, y0 in full.tolist():
+        cv2.copyTo(sprite.bgr, sprite.opaque, img[y0:y0 + h, x0:x0 + w])
+    if len(full) and len(sprite.ys):
+        _blend_fringe(img, sprite, full[:, 1, None] + sprite.ys, full[:, 0, None] + sprite.xs)
+
+    for x0, y0 in pts[~inside].tolist():
+        # Clip the sprite rectangle to the image
+        sx0, sy0 = max(0, -x0), max(0, -y0)
+        sx1, sy1 = min(w, iw - x0), min(h, ih - y0)
+        if sx0 >= sx1 or sy0 >= sy1:
+            continue
+        cv2.copyTo(sprite.bgr[sy0:sy1, sx0:sx1], sprite.opaque[sy0:sy1, sx0:sx1],
+                   img[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1])
+        ys, xs = sprite.ys + y0, sprite.xs + x0
+        keep = (ys >= 0) & (ys < ih) & (xs >= 0) & (xs < iw)
+        if keep.any():
+            _blend_fringe(img, sprite, ys[keep], xs[keep], keep)
@@ -0,0 +1,214 @@
+# Per-stage frame timers, an on-screen performance HUD and Chrome trace export
+import json
+import os
+import threading
+import time
+import cv2
+import numpy as np
+
+# Frames kept for the HUD averages and sparkline
+FRAME_HISTORY = 240
+# Stage events kept for trace export (a few thousand per second at most)
+EVENT_CAPACITY = 65536
+TRACE_SECONDS = 10.0
+# Frame budget line drawn on the sparkline
+BUDGET_MS = 1000.0 / 30
+
+# Stages in HUD order; others are added as they are first seen
+STAGES = ["capture", "find_hands", "game_logic", "draw_ui", "draw_text", "present", "update_canvas"]
+
+
+class _NullStage:
+    """Returned by stage() while timing is off: entering and leaving it does nothing"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("timers", "index", "start")
+
+    def __init__(self, timers, index):
+        self.timers = timers
+        self.index = index
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.timers._record(self.index, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+
+class StageTimers:
+    """Stage timing for the whole process.
+
+    with TIMERS.stage("find_hands"): ... times a block. Every block lands in a
+    ring buffer of (stage, thread, start, duration) events for trace export,
+    and is added to the current frame's per-stage total; frame_done() closes
+    a frame and pushes those totals into per-frame ring buffers for the HUD.
+    Stages may nest (draw_text runs inside draw_ui).
+
+    While disabled, stage() returns a shared no-op context manager and
+    frame_done() returns at once, so the instrumentation can stay in place.
+    """
+
+    def __init__(self, frame_history=FRAME_HISTORY, event_capacity=EVENT_CAPACITY):
+        self.enabled = False
+        self.hud = False
+        self.names = list(STAGES)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._lock = threading.Lock()
+        # Event ring (trace export)
+        self.ev_stage = np.zeros(event_capacity, dtype=np.int16)
+        self.ev_thread = np.zeros(event_capacity, dtype=np.int64)
+        self.ev_start = np.zeros(event_capacity, dtype=np.int64)
+        self.ev_dur = np.zeros(event_capacity, dtype=np.int64)
+        self.ev_count = 0
+        # Per-frame rings (HUD), in nanoseconds
+        self.frame_history = frame_history
+        self.stage_ns = np.zeros((frame_history, 32), dtype=np.int64)
+        self.frame_ns = np.zeros(frame_history, dtype=np.int64)
+        self.frame_count = 0
+        self._current = np.zeros(32, dtype=np.int64)
+        self._last_frame_end = None
+
+    def enable(self, on=True):
+        self.enabled = on
+        if not on:
+            self.hud = False
+
+    def toggle_hud(self):
+        """HUD hotkey: showing the HUD turns timing on"""
+        self.hud = not self.hud
+        if self.hud:
+            self.enabled = True
+        print(f"Performance HUD {'on' if self.hud else 'off'}")
+        return self.hud
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NULL_STAGE
+        index = self._index.get(name)
+        if index is None:
+            with self._lock:
+                index = self._index.get(name)
+                if index is None and len(self.names) < self.stage_ns.shape[1]:
+                    index = len(self.names)
+                    self.names.append(name)
+                    self._index[name] = index
+            if index is None:
+                return _NULL_STAGE
+        return _Stage(self, index)
+
+    def _record(self, index, start, duration):
+        with self._lock:
+            slot = self.ev_count % len(self.ev_start)
+            self.ev_stage[slot] = index
+            self.ev_thread[slot] = threading.get_ident()
+            self.ev_start[slot] = start
+            self.ev_dur[slot] = duration
+            self.ev_count += 1
+            self._current[index] += duration
+
+    def frame_done(self):
+        """Close the current frame (called once per frame by the game loop)"""
+        if not self.enabled:
+            self._last_frame_end = None
+            return
+        now = time.perf_counter_ns()
+        with self._lock:
+            slot = self.frame_count % self.frame_history
+            self.stage_ns[slot] = self._current
+            self._current[:] = 0
+            self.frame_ns[slot] = now - self._last_frame_end if self._last_frame_end is not None else 0
+            self.frame_count += 1
+        self._last_frame_end = now
+
+    def summary(self, frames=60):
+        """{'fps', 'frame_ms', 'stages': {name: mean ms per frame}} over the last frames"""
+        n = min(frames, self.frame_count, self.frame_history)
+        if n == 0:
+            return {"fps": 0.0, "frame_ms": 0.0, "stages": {}}
+        slots = [(self.frame_count - 1 - i) % self.frame_history for i in range(n)]
+        frame_ns = self.frame_ns[slots]
+        frame_ns = frame_ns[frame_ns > 0]
+        frame_ms = float(frame_ns.mean()) / 1e6 if len(frame_ns) else 0.0
+        means = self.stage_ns[slots].mean(axis=0) / 1e6
+        stages = {name: round(float(means[i]), 2) for i, name in enumerate(self.names) if means[i] > 0}
+        return {"fps": round(1000.0 / frame_ms, 1) if frame_ms else 0.0, "frame_ms": round(frame_ms, 2),
+                "stages": stages}
+
+    def recent_frame_ms(self, count):
+        n = min(count, self.frame_count, self.frame_history)
+        slots = [(self.frame_count - n + i) % self.frame_history for i in range(n)]
+        return self.frame_ns[slots] / 1e6
+
+    def draw_hud(self, img):
+        """Overlay FPS, per-stage milliseconds and a frame-time sparkline in the top-right corner"""
+        info = self.summary()
+        h, w = img.shape[:2]
+        lines = [f"FPS {info['fps']:.1f}  frame {info['frame_ms']:.1f} ms"]
+        lines += [f"{name:<14s}{ms:6.2f} ms" for name, ms in info["stages"].items()]
+        line_h, panel_w, spark_h = 18, 250, 50
+        panel_h = line_h * len(lines) + spark_h + 16
+        x0, y0 = max(0, w - panel_w - 10), 10
+        roi = img[y0:min(h, y0 + panel_h), x0:min(w, x0 + panel_w)]
+        cv2.addWeighted(roi, 0.35, np.zeros_like(roi), 0.65, 0, roi)
+        for i, text in enumerate(lines):
+            cv2.putText(img, text, (x0 + 8, y0 + 16 + i * line_h), cv2.FONT_HERSHEY_PLAIN, 1.0,
+                        (0, 255, 255) if i == 0 else (230, 230, 230), 1, cv2.LINE_AA)
+
+        # Sparkline of recent frame times, scaled so the budget sits mid-height
+        top = y0 + line_h * len(lines) + 8
+        values = self.recent_frame_ms(panel_w - 16)
+        if len(values) > 1:
+            scale = spark_h / (2 * BUDGET_MS)
+            ys = top + spark_h - np.minimum(values * scale, spark_h)
+            xs = x0 + 8 + np.arange(len(values))
+            pts = np.stack([xs, ys], axis=1).astype(np.int32)
+            budget_y = int(top + spark_h - BUDGET_MS * scale)
+            cv2.line(img, (x0 + 8, budget_y), (x0 + panel_w - 8, budget_y), (0, 0, 200), 1)
+            cv2.polylines(img, [pts], False, (0, 255, 0), 1)
+        return img
+
+    def export_chrome_trace(self, path, seconds=TRACE_SECONDS):
+        """Write the last `seconds` of stage events as Chrome trace events (chrome://tracing, Perfetto)"""
+        with self._lock:
+            count = min(self.ev_count, len(self.ev_start))
+            order = [(self.ev_count - count + i) % len(self.ev_start) for i in range(count)]
+            stage, thread = self.ev_stage[order], self.ev_thread[order]
+            start, dur = self.ev_start[order], self.ev_dur[order]
+        cutoff = time.perf_counter_ns() - int(seconds * 1e9)
+        keep = start >= cutoff
+        pid = os.getpid()
+        events = [{"name": self.names[s], "cat": "stage", "ph": "X", "pid": pid, "tid": int(t),
+                   "ts": st / 1000.0, "dur": d / 1000.0}
+                  for s, t, st, d in zip(stage[keep].tolist(), thread[keep].tolist(),
+                                         start[keep].tolist(), dur[keep].tolist())]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        print(f"Wrote {len(events)} trace events ({seconds:.0f} s) to {path}")
+        return path
+
+
+TIMERS = StageTimers()
+if os.environ.get("TAMILGAMES_PROFILE", "").strip() in ("1", "true", "yes"):
+    TIMERS.enable()
+
+
+def export_trace(directory="."):
+    """Trace hotkey: dump the last seconds to a timestamped file"""
+    path = os.path.join(directory, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+    if not TIMERS.enabled:
+        print("Stage timing is off; press the HUD key (or set TAMILGAMES_PROFILE=1) first")
+        return None
+    return TIMERS.export_chrome_trace(path)
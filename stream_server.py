@@ -0,0 +1,491 @@
+# Opt-in localhost streaming of the game frame (MJPEG over HTTP) and of landmarks/game events (binary)
+import json
+import queue
+import struct
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import cv2
+import numpy as np
+
+DEBUG = False
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+JPEG_QUALITY = 80
+# Frames wider than this are scaled down before encoding
+MAX_STREAM_WIDTH = 1280
+MAX_STREAM_FPS = 30
+# Landmark/event messages kept for /events clients that fall behind (about 8 s of landmarks)
+MESSAGE_HISTORY = 256
+# A /frame.jpg request keeps the encoder running this long without MJPEG viewers
+SNAPSHOT_DEMAND_SECONDS = 2.0
+
+BOUNDARY = b"tamilgamesframe"
+
+# Binary protocol on /events: a stream of messages, each HEADER followed by `length` payload bytes.
+#   MSG_LANDMARKS payload: u8 player, u8 hand count, then per hand 21 x (x, y, z) float16 little-endian,
+#                          normalized to that player's part of the frame (as MediaPipe reports them)
+#   MSG_EVENT payload:     UTF-8 JSON object (telemetry events such as mosquito_killed, score changes)
+MSG_LANDMARKS = 1
+MSG_EVENT = 2
+HEADER = struct.Struct("<BIdI")  # type, sequence number, time (s, perf_counter of the game machine), length
+LANDMARKS_PER_HAND = 21
+
+
+def pack_landmarks(hands, player=0):
+    """Landmark payload for [[[x, y, z] * 21] per hand]"""
+    points = np.asarray(hands, dtype='<f2').reshape(-1)
+    return struct.pack("<BB", player, len(hands)) + points.tobytes()
+
+
+def unpack_landmarks(payload):
+    """(player, float32 array of shape (hands, 21, 3))"""
+    player, count = struct.unpack_from("<BB", payload)
+    points = np.frombuffer(payload, dtype='<f2', offset=2).astype(np.float32)
+    return player, points.reshape(count, LANDMARKS_PER_HAND, 3)
+
+
+def encode_message(kind, seq, t, payload):
+    return HEADER.pack(kind, seq & 0xFFFFFFFF, t, len(payload)) + payload
+
+
+def read_message(stream):
+    """Read one message from a binary file-like object: (kind, seq, t, decoded) or None at end of stream.
+    decoded is (player, landmarks) for MSG_LANDMARKS and a dict for MSG_EVENT."""
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    kind, seq, t, length = HEADER.unpack(header)
+    payload = stream.read(length)
+    if len(payload) < length:
+        return None
+    if kind == MSG_LANDMARKS:
+        return kind, seq, t, unpack_landmarks(payload)
+    if kind == MSG_EVENT:
+        return kind, seq, t, json.loads(payload.decode('utf-8'))
+    return kind, seq, t, payload
+
+
+def hands_of(tracker):
+    """The hands in a HandTracker's latest results, as MediaPipe returned them.
+    A results object is never changed after process() returns, so it may be read on another thread."""
+    results = getattr(tracker, "results", None)
+    return list(getattr(results, "multi_hand_landmarks", None) or [])
+
+
+def landmark_points(hands):
+    """Normalized [[x, y, z] * 21] per hand, from MediaPipe hand landmarks or points already in that form"""
+    return [[[lm.x, lm.y, lm.z] for lm in hand.landmark] if hasattr(hand, "landmark") else hand
+            for hand in hands]
+
+
+INDEX_PAGE = b"""<!doctype html><html><head><title>Tamil Games stream</title>
+<style>body{margin:0;background:#000}img{width:100vw;height:100vh;object-fit:contain}</style>
+</head><body><img src="/stream.mjpg"></body></html>"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.0"
+
+    def log_message(self, fmt, *args):
+        if DEBUG:
+            print("stream: " + fmt % args)
+
+    def do_GET(self):
+        stream = self.server.stream
+        path = self.path.split("?")[0]
+        try:
+            if path == "/":
+                self._send(200, "text/html", INDEX_PAGE)
+            elif path == "/frame.jpg":
+                jpeg = stream.snapshot()
+                if jpeg is None:
+                    self._send(503, "text/plain", b"no frame yet\n")
+                else:
+                    self._send(200, "image/jpeg", jpeg)
+            elif path == "/stream.mjpg":
+                self._stream_mjpeg(stream)
+            elif path == "/events":
+                self._stream_events(stream)
+            else:
+                self._send(404, "text/plain", b"not found\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send(self, code, content_type, body):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_mjpeg(self, stream):
+        self.send_response(200)
+        self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=" + BOUNDARY.decode())
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        seq = 0
+        with stream.viewer():
+            while stream.running:
+                jpeg, seq = stream.wait_jpeg(seq)
+                if jpeg is None:
+                    continue
+                self.wfile.write(b"--" + BOUNDARY + b"\r\nContent-Type: image/jpeg\r\nContent-Length: "
+                                 + str(len(jpeg)).encode() + b"\r\n\r\n" + jpeg + b"\r\n")
+                self.wfile.flush()
+
+    def _stream_events(self, stream):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        seq = stream.message_seq
+        with stream.listener():
+            while stream.running:
+                messages, seq = stream.wait_messages(seq)
+                if messages:
+                    self.wfile.write(b"".join(messages))
+                    self.wfile.flush()
+
+
+class _ClientCount:
+    def __init__(self, server, attr, lock):
+        self.server, self.attr, self.lock = server, attr, lock
+
+    def __enter__(self):
+        with self.lock:
+            setattr(self.server, self.attr, getattr(self.server, self.attr) + 1)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            setattr(self.server, self.attr, getattr(self.server, self.attr) - 1)
+        return False
+
+
+class StreamServer:
+    """Publishes the finished game frame and the game's landmarks/events to localhost clients.
+
+    - GET /            page showing the live stream (for a projector or a teacher's browser)
+    - GET /stream.mjpg MJPEG stream
+    - GET /frame.jpg   latest frame
+    - GET /events      binary landmark/event messages (see read_message)
+
+    publish_frame() never blocks and never encodes: it copies the frame
+    (scaled to MAX_STREAM_WIDTH) only when the encoder thread is idle and
+    someone is watching, so a slow encoder or client drops frames instead
+    of slowing the game. The encoder turns the latest frame into a JPEG
+    that every MJPEG client shares. Landmarks and events (including the
+    telemetry events it subscribes to) are only put on a bounded queue by
+    the game thread, and only while an /events client is connected; a
+    message thread packs and encodes them into a ring buffer, and each
+    /events client sends what it hasn't sent yet and skips ahead if it
+    falls more than MESSAGE_HISTORY messages behind.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, quality=JPEG_QUALITY, max_width=MAX_STREAM_WIDTH,
+                 max_fps=MAX_STREAM_FPS):
+        self.host = host
+        self.requested_port = port
+        self.quality = quality
+        self.max_width = max_width
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self.running = False
+        self.httpd = None
+        # Frame hand-off: one buffer the encoder owns while encoding
+        self._frame_buf = None
+        self._frame_ready = threading.Event()
+        self._encoder_idle = threading.Event()
+        self._encoder_idle.set()
+        self._last_frame_at = 0.0
+        self.frames_dropped = 0
+        self.frames_encoded = 0
+        # Latest JPEG, shared by all viewers
+        self._jpeg = None
+        self._jpeg_seq = 0
+        self._jpeg_cond = threading.Condition()
+        self.viewers = 0
+        self._snapshot_until = 0.0
+        # Landmark/event ring
+        self._messages = deque(maxlen=MESSAGE_HISTORY)
+        self._outbox = queue.Queue(maxsize=MESSAGE_HISTORY)
+        self.message_seq = 0
+        self.messages_dropped = 0
+        self.listeners = 0
+        self._messages_cond = threading.Condition()
+        self._threads = []
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1] if self.httpd else self.requested_port
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        if self.running:
+            return self
+        self.httpd = ThreadingHTTPServer((self.host, self.requested_port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.stream = self
+        self.running = True
+        for target, name in ((self.httpd.serve_forever, "stream-http"), (self._encode_loop, "stream-encoder"),
+                             (self._message_loop, "stream-messages")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        from telemetry import get_telemetry
+        get_telemetry().subscribe(self.publish_event)
+        print(f"📡 Streaming on {self.url}")
+        return self
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        from telemetry import get_telemetry
+        get_telemetry().unsubscribe(self.publish_event)
+        self._frame_ready.set()
+        try:
+            self._outbox.put_nowait(None)
+        except queue.Full:
+            pass
+        with self._jpeg_cond:
+            self._jpeg_cond.notify_all()
+        with self._messages_cond:
+            self._messages_cond.notify_all()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        for thread in self._threads:
+            thread.join(1.0)
+
+    # Game side (never blocks)
+
+    def publish_frame(self, frame):
+        if not self.running or (self.viewers == 0 and time.monotonic() > self._snapshot_until):
+            return
+        now = time.perf_counter()
+        if not self._encoder_idle.is_set() or now - self._last_frame_at < self.min_interval:
+            self.frames_dropped += 1
+            return
+        self._last_frame_at = now
+        h, w = frame.shape[:2]
+        if w > self.max_width:
+            size = (self.max_width, max(1, round(h * self.max_width / w)))
+        else:
+            size = (w, h)
+        if self._frame_buf is None or self._frame_buf.shape[:2] != (size[1], size[0]):
+            self._frame_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        if size == (w, h):
+            np.copyto(self._frame_buf, frame)
+        else:
+            cv2.resize(frame, size, dst=self._frame_buf, interpolation=cv2.INTER_AREA)
+        self._encoder_idle.clear()
+        self._frame_ready.set()
+
+    def publish_landmarks(self, hands, player=0, t=None):
+        """hands: MediaPipe hand landmarks (hands_of) or [[x, y, z] * 21] per hand; packed on the message thread"""
+        if self.listeners == 0:
+            return
+        self._enqueue(MSG_LANDMARKS, (hands, player), t)
+
+    def publish_event(self, fields):
+        """Telemetry subscriber: called on the emitting (game) thread, so it only enqueues"""
+        if self.listeners == 0:
+            return
+        self._enqueue(MSG_EVENT, fields, None)
+
+    def _enqueue(self, kind, payload, t):
+        if not self.running:
+            return
+        try:
+            self._outbox.put_nowait((kind, payload, t if t is not None else time.perf_counter()))
+        except queue.Full:
+            self.messages_dropped += 1
+
+    # Encoder and client side
+
+    def _message_loop(self):
+        while self.running:
+            item = self._outbox.get()
+            if item is None:
+                continue
+            kind, payload, t = item
+            try:
+                if kind == MSG_LANDMARKS:
+                    hands, player = payload
+                    payload = pack_landmarks(landmark_points(hands), player)
+                elif kind == MSG_EVENT:
+                    payload = json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+                self._publish(kind, payload, t)
+            except Exception as e:
+                if DEBUG:
+                    print(f"Stream message error: {e}")
+
+    def _publish(self, kind, payload, t):
+        if not self.running or self.listeners == 0:
+            return
+        with self._messages_cond:
+            self.message_seq += 1
+            self._messages.append((self.message_seq, encode_message(kind, self.message_seq,
+                                                                    t if t is not None else time.perf_counter(),
+                                                                    payload)))
+            self._messages_cond.notify_all()
+
+    def _encode_loop(self):
+        while self.running:
+            self._frame_ready.wait()
+            self._frame_ready.clear()
+            if not self.running:
+                break
+            ok, jpeg = cv2.imencode(".jpg", self._frame_buf, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+            self._encoder_idle.set()
+            if not ok:
+                continue
+            with self._jpeg_cond:
+                self._jpeg = jpeg.tobytes()
+                self._jpeg_seq += 1
+                self.frames_encoded += 1
+                self._jpeg_cond.notify_all()
+
+    def wait_jpeg(self, last_seq, timeout=1.0):
+        """Block until a JPEG newer than last_seq exists: (jpeg or None, seq)"""
+        with self._jpeg_cond:
+            if self._jpeg_seq == last_seq:
+                self._jpeg_cond.wait(timeout)
+            if self._jpeg_seq == last_seq:
+                return None, last_seq
+            return self._jpeg, self._jpeg_seq
+
+    def snapshot(self, timeout=1.0):
+        """Latest JPEG, waiting briefly for one if nobody has been watching"""
+        stale = self.viewers == 0 and time.monotonic() > self._snapshot_until
+        self._snapshot_until = time.monotonic() + SNAPSHOT_DEMAND_SECONDS
+        with self._jpeg_cond:
+            if self._jpeg is None or stale:
+                self._jpeg_cond.wait(timeout)
+            return self._jpeg
+
+    def viewer(self):
+        """Context manager counting an MJPEG client (frames are only encoded while there are some)"""
+        return _ClientCount(self, "viewers", self._jpeg_cond)
+
+    def listener(self):
+        """Context manager counting an /events client (messages are only built while there are some)"""
+        return _ClientCount(self, "listeners", self._messages_cond)
+
+    def wait_messages(self, last_seq, timeout=1.0):
+        """Messages newer than last_seq (waiting up to timeout for one): (list of bytes, newest seq)"""
+        with self._messages_cond:
+            if self.message_seq == last_seq:
+                self._messages_cond.wait(timeout)
+            messages = [data for seq, data in self._messages if seq > last_seq]
+            return messages, self.message_seq
+
+    def tap(self, presenter, host=None):
+        """Wrap presenter so every presented frame (and host's landmarks) is also streamed"""
+        return StreamTap(presenter, self, host)
+
+    def stats(self):
+        return {"viewers": self.viewers, "listeners": self.listeners, "encoded": self.frames_encoded, "dropped": self.frames_dropped,
+                "messages": self.message_seq, "messages_dropped": self.messages_dropped}
+
+
+class StreamTap:
+    """Presenter wrapper: presents on the wrapped presenter, then publishes the frame, each
+    player's landmarks and score changes. Everything else is the wrapped presenter's."""
+
+    def __init__(self, presenter, server, host=None):
+        self.presenter = presenter
+        self.server = server
+        self.host = host
+        self._scores = None
+
+    def __getattr__(self, name):
+        return getattr(self.presenter, name)
+
+    def present(self, frame):
+        self.presenter.present(frame)
+        server = self.server
+        server.publish_frame(frame)
+        if self.host is None:
+            return
+        players = getattr(self.host, "players", None) or [self.host]
+        if server.listeners:
+            now = time.perf_counter()
+            for i, player in enumerate(players):
+                tracker = getattr(player.game, "hand_tracker", None)
+                if tracker is not None:
+                    server.publish_landmarks(hands_of(tracker), player=i, t=now)
+        scores = [getattr(p.game, "score", getattr(p.game, "kill_count", None)) for p in players]
+        if scores != self._scores:
+            self._scores = scores
+            server.publish_event({"event": "score", "scores": scores})
+
+
+def start_from_env():
+    """A running StreamServer if TAMILGAMES_STREAM is set (to a port, or 1 for the default), else None"""
+    import os
+    value = os.environ.get("TAMILGAMES_STREAM", "").strip().lower()
+    if value in ("", "0", "off", "false", "no"):
+        return None
+    port = int(value) if value.isdigit() and value != "1" else DEFAULT_PORT
+    try:
+        return StreamServer(port=port).start()
+    except OSError as e:
+        print(f"❌ Stream server not started on port {port}: {e}")
+        return None
+
+
+def main(argv=None):
+    import argparse
+    from urllib.request import urlopen
+
+    parser = argparse.ArgumentParser(description="Watch a running game's stream")
+    sub = parser.add_subparsers(dest="command", required=True)
+    view = sub.add_parser("view", help="show the frame stream in an OpenCV window")
+    view.add_argument("--url", default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}/stream.mjpg")
+    view.add_argument("--fullscreen", action="store_true")
+    events = sub.add_parser("events", help="print landmark/event messages")
+    events.add_argument("--url", default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}/events")
+    args = parser.parse_args(argv)
+
+    if args.command == "view":
+        cap = cv2.VideoCapture(args.url)
+        if not cap.isOpened():
+            print(f"❌ Could not open {args.url}")
+            return 1
+        from presenter import HighGUIPresenter
+        presenter = HighGUIPresenter("Tamil Games - mirror", fullscreen=args.fullscreen)
+        while not presenter.closed:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            presenter.present(frame)
+            if presenter.poll_key() in (ord('q'), 27):
+                break
+        cap.release()
+        presenter.close()
+        return 0
+
+    with urlopen(args.url) as stream:
+        while True:
+            message = read_message(stream)
+            if message is None:
+                break
+            kind, seq, t, data = message
+            if kind == MSG_LANDMARKS:
+                player, hands = data
+                tip = ", ".join(f"({h[8][0]:.3f}, {h[8][1]:.3f})" for h in hands)
+                print(f"#{seq} t={t:.3f} player {player}: {len(hands)} hand(s) {tip}")
+            else:
+                print(f"#{seq} t={t:.3f} {data}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
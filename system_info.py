@@ -0,0 +1,9 @@
+# What this machine offers the games: shared by calibration and multi-station mode
+import os
+
+
+def available_cpus():
+    """CPU ids this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
@@ -0,0 +1,315 @@
+# Session telemetry: rotating JSONL written by a background thread, with rate-limited error events
+import json
+import os
+import queue
+import threading
+import time
+import traceback
+
+DEBUG = False
+
+DEFAULT_LOG_DIR = "logs"
+LOG_NAME = "telemetry.jsonl"
+# Rotate at this size, keeping this many old files (telemetry.jsonl.1 is the newest)
+MAX_BYTES = 1024 * 1024
+BACKUP_COUNT = 5
+MAX_QUEUE = 1024
+# The same error is logged (and printed) at most once per this many seconds
+ERROR_INTERVAL = 5.0
+
+
+class RotatingJsonlFile:
+    """Appends JSON lines to path, rotating it once it grows past max_bytes"""
+
+    def __init__(self, path, max_bytes=MAX_BYTES, backups=BACKUP_COUNT):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, 'a', encoding='utf-8')
+        self.size = self.file.tell()
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str) + "\n"
+        if self.size and self.size + len(line) > self.max_bytes:
+            self.rotate()
+        self.file.write(line)
+        self.size += len(line.encode('utf-8'))
+
+    def rotate(self):
+        self.file.close()
+        for i in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, 'a', encoding='utf-8')
+        self.size = 0
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class TelemetryWriter:
+    """Writes telemetry events from a dedicated thread so game loops never block on disk.
+
+    emit(kind, **fields) only does a non-blocking enqueue; when the queue is
+    full the event is counted in self.dropped and discarded. error() also
+    deduplicates: repeats of the same error within error_interval are only
+    counted, and the next logged occurrence carries that count as "repeats".
+    That keeps a failure that happens every frame from flooding the console
+    or the log.
+    """
+
+    def __init__(self, path=None, max_bytes=MAX_BYTES, backups=BACKUP_COUNT, max_queue=MAX_QUEUE,
+                 error_interval=ERROR_INTERVAL, enabled=True):
+        self.path = path or os.path.join(DEFAULT_LOG_DIR, LOG_NAME)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.enabled = enabled
+        self.error_interval = error_interval
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.written = 0
+        self._errors = {}
+        self.subscribers = []
+        self._errors_lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running or not self.enabled:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def emit(self, kind, **fields):
+        """Queue one event (and hand it to subscribers); returns immediately and never raises"""
+        if not self.enabled and not self.subscribers:
+            return
+        fields["event"] = kind
+        fields["ts"] = round(time.time(), 3)
+        for subscriber in self.subscribers:
+            try:
+                subscriber(fields)
+            except Exception as e:
+                if DEBUG:
+                    print(f"Telemetry subscriber error: {e}")
+        if not self.enabled:
+            return
+        try:
+            self.queue.put_nowait(fields)
+        except queue.Full:
+            self.dropped += 1
+
+    def subscribe(self, callback):
+        """Also pass every event to callback(fields), on the emitting thread (often the game
+        thread): like emit itself it must only enqueue, and do any real work on its own thread"""
+        self.subscribers = self.subscribers + [callback]
+
+    def unsubscribe(self, callback):
+        self.subscribers = [s for s in self.subscribers if s != callback]
+
+    def error(self, where, exc, echo=True):
+        """Log an error from `where` at most once per error_interval per distinct message.
+        Returns True if this occurrence was logged."""
+        message = f"{type(exc).__name__}: {exc}" if isinstance(exc, BaseException) else str(exc)
+        key = (where, message)
+        now = time.monotonic()
+        with self._errors_lock:
+            state = self._errors.get(key)
+            if state is not None and now - state[0] < self.error_interval:
+                state[1] += 1
+                return False
+            repeats = state[1] if state is not None else 0
+            self._errors[key] = [now, 0]
+
+        fields = {"where": where, "message": message, "repeats": repeats}
+        if isinstance(exc, BaseException) and exc.__traceback__ is not None:
+            fields["traceback"] = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        self.emit("error", **fields)
+        if echo:
+            suffix = f" (repeated {repeats} more times)" if repeats else ""
+            print(f"❌ {where}: {message}{suffix}")
+            if DEBUG and "traceback" in fields:
+                print(fields["traceback"], end="")
+        return True
+
+    def flush(self, timeout=2.0):
+        """Block until everything queued so far is on disk (for tools and shutdown)"""
+        deadline = time.monotonic() + timeout
+        while self._running and time.monotonic() < deadline:
+            if self.queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return self.queue.unfinished_tasks == 0
+
+    def stop(self, timeout=2.0):
+        if not self._running:
+            return
+        self.flush(timeout)
+        self._running = False
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            out = RotatingJsonlFile(self.path, self.max_bytes, self.backups)
+        except OSError as e:
+            print(f"Telemetry disabled: cannot open {self.path} ({e})")
+            self.enabled = False
+            self._drain_forever()
+            return
+
+        while self._running:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for record in batch:
+                    if record is not None:
+                        out.write(record)
+                        self.written += 1
+                out.flush()
+            except Exception as e:
+                if DEBUG:
+                    print(f"Telemetry write error: {e}")
+            for _ in batch:
+                self.queue.task_done()
+        out.close()
+
+    def _drain_forever(self):
+        while self._running:
+            self.queue.get()
+            self.queue.task_done()
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q / 100.0 * len(sorted_values)))]
+
+
+class SessionStats:
+    """Per-frame numbers for one game session, summarized once at the end.
+
+    frame_ms is processing latency (process + present); interval_ms is the
+    time between consecutive finished frames, capture wait included, and is
+    what the FPS distribution is built from.
+    add_frame() is a couple of list appends, cheap enough for the game loop.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.frame_ms = []
+        self.inference_ms = []
+        self.interval_ms = []
+        self.failed_reads = 0
+
+    def add_frame(self, frame_ms, inference_ms=None, interval_ms=None):
+        self.frame_ms.append(frame_ms)
+        if inference_ms is not None:
+            self.inference_ms.append(inference_ms)
+        if interval_ms is not None:
+            self.interval_ms.append(interval_ms)
+
+    @staticmethod
+    def distribution(values):
+        values = sorted(values)
+        if not values:
+            return None
+        return {
+            "mean": round(sum(values) / len(values), 2),
+            "p50": round(_percentile(values, 50), 2),
+            "p95": round(_percentile(values, 95), 2),
+            "p99": round(_percentile(values, 99), 2),
+            "max": round(values[-1], 2),
+        }
+
+    def summary(self, seconds=None):
+        frames = len(self.frame_ms)
+        seconds = seconds if seconds is not None else time.time() - self.started
+        fps = [1000.0 / ms for ms in self.interval_ms if ms > 0]
+        return {
+            "frames": frames,
+            "seconds": round(seconds, 3),
+            "fps": round(frames / seconds, 1) if seconds > 0 else 0.0,
+            "fps_distribution": self.distribution(fps),
+            "frame_ms": self.distribution(self.frame_ms),
+            "inference_ms": self.distribution(self.inference_ms),
+            "failed_reads": self.failed_reads,
+        }
+
+
+def capture_config(capture):
+    """The settings a cv2.VideoCapture (or look-alike) actually delivered"""
+    import cv2
+    config = {"source": type(capture).__name__}
+    if hasattr(capture, "get"):
+        try:
+            config.update(width=int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                          height=int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                          fps=round(float(capture.get(cv2.CAP_PROP_FPS)), 2))
+        except Exception:
+            pass
+    if hasattr(capture, "getBackendName"):
+        try:
+            config["backend"] = capture.getBackendName()
+        except Exception:
+            pass
+    return config
+
+
+def game_result(game):
+    """Score-like attributes of a finished game"""
+    result = {"game": type(game).__name__}
+    for name in ("score", "level", "kill_count", "game_complete"):
+        if hasattr(game, name):
+            result[name] = getattr(game, name)
+    return result
+
+
+def telemetry_enabled():
+    return os.environ.get("TAMILGAMES_TELEMETRY", "1").strip().lower() not in ("0", "off", "false", "no")
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_telemetry():
+    """Return the shared telemetry writer, starting it on first use.
+    TAMILGAMES_TELEMETRY=0 turns writing off (errors are still rate-limited on the console)."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = TelemetryWriter(enabled=telemetry_enabled()).start()
+            import atexit
+            atexit.register(_writer.stop)
+        return _writer
+
+
+def set_telemetry(writer):
+    """Replace the shared writer (e.g. with a disabled one for tools)"""
+    global _writer
+    with _writer_lock:
+        if _writer is not None and _writer is not writer:
+            _writer.stop()
+        _writer = writer
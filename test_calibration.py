@@ -0,0 +1,47 @@
+# Checks for calibration's tuning choices (run with: python -m pytest test_calibration.py)
+import cv2
+import numpy as np
+
+from calibration import DEFAULT_TUNING, FAST_CAMERA_FPS, camera_identity, camera_matches, frame_alpha_for
+
+
+def test_fast_camera_blends_less_previous_frame():
+    """frame_alpha weights the current frame, so a fast camera's alpha must be above the default"""
+    slow = frame_alpha_for(30)
+    fast = frame_alpha_for(FAST_CAMERA_FPS)
+    assert slow == DEFAULT_TUNING["frame_alpha"]
+    assert DEFAULT_TUNING["frame_alpha"] < fast <= 1.0
+
+    # Blended the way GameHost does it: a fast camera's output stays closer to the new frame
+    current = np.full((2, 2, 3), 200, np.uint8)
+    previous = np.zeros((2, 2, 3), np.uint8)
+    blended = {alpha: int(cv2.addWeighted(current, alpha, previous, 1 - alpha, 0)[0, 0, 0])
+               for alpha in (slow, fast)}
+    assert abs(200 - blended[fast]) < abs(200 - blended[slow])
+
+
+class FakeCamera:
+    def __init__(self, size=(1280, 720), fps=30.0, backend="DSHOW"):
+        self.props = {cv2.CAP_PROP_FRAME_WIDTH: size[0], cv2.CAP_PROP_FRAME_HEIGHT: size[1], cv2.CAP_PROP_FPS: fps}
+        self.backend = backend
+
+    def get(self, prop):
+        return self.props.get(prop, 0.0)
+
+    def getBackendName(self):
+        if self.backend is None:
+            raise cv2.error("no backend")
+        return self.backend
+
+
+def test_camera_identity_covers_size_backend_and_fps():
+    profile = {"camera_identity": camera_identity(FakeCamera())}
+    assert profile["camera_identity"] == {"delivered": [1280, 720], "backend": "DSHOW", "fps": 30.0}
+    assert camera_matches(profile, FakeCamera())
+    assert not camera_matches(profile, FakeCamera(size=(640, 480)))
+    assert not camera_matches(profile, FakeCamera(backend="MSMF"))
+    assert not camera_matches(profile, FakeCamera(fps=15.0))
+    # Whatever the camera does not report is not held against it
+    assert camera_matches(profile, FakeCamera(fps=0.0, backend=None))
+    # Profiles tuned on a recording have no camera to compare
+    assert camera_matches({"camera_identity": None}, FakeCamera(size=(640, 480)))
@@ -0,0 +1,49 @@
+# Checks for the colour lookup table (run with: python -m pytest test_color_lut.py)
+import cv2
+import numpy as np
+
+from color_lut import (COLOR_RANGES, LUT_BITS, NO_CLASS, build_color_lut, classify_bgr, classify_image,
+                       lut_fingerprint)
+
+
+def _hsv_class(bgr):
+    """Reference answer: the first colour whose HSV ranges contain the pixel"""
+    hsv = cv2.cvtColor(np.uint8([[bgr]]), cv2.COLOR_BGR2HSV)
+    for idx, color in enumerate(COLOR_RANGES):
+        for low, high in color["ranges"]:
+            if cv2.inRange(hsv, low, high)[0, 0]:
+                return idx
+    return NO_CLASS
+
+
+def test_swatches_classify_as_themselves():
+    lut = build_color_lut()
+    assert lut.shape == (1 << LUT_BITS,) * 3
+    for idx, color in enumerate(COLOR_RANGES):
+        assert classify_bgr(lut, color["bgr"]) == idx, color["name"]
+    assert classify_bgr(lut, (128, 128, 128)) == NO_CLASS  # grey has no saturation
+
+
+def test_lut_agrees_with_hsv_ranges_at_bin_centres():
+    lut = build_color_lut()
+    rng = np.random.default_rng(5)
+    shift = 8 - LUT_BITS
+    for bgr in rng.integers(0, 1 << LUT_BITS, size=(300, 3)):
+        centre = tuple(int(c) << shift | (1 << shift >> 1) for c in bgr)
+        assert classify_bgr(lut, centre) == _hsv_class(centre)
+
+
+def test_classify_image_matches_per_pixel_lookup():
+    lut = build_color_lut()
+    img = np.random.default_rng(8).integers(0, 256, size=(12, 17, 3), dtype=np.uint8)
+    classes = classify_image(lut, img)
+    assert classes.shape == img.shape[:2]
+    for y in range(img.shape[0]):
+        for x in range(img.shape[1]):
+            assert classes[y, x] == classify_bgr(lut, img[y, x])
+
+
+def test_fingerprint_tracks_the_inputs():
+    assert lut_fingerprint() == lut_fingerprint(COLOR_RANGES, LUT_BITS)
+    assert lut_fingerprint(bits=LUT_BITS + 1) != lut_fingerprint()
+    assert lut_fingerprint(COLOR_RANGES[:-1]) != lut_fingerprint()
@@ -0,0 +1,28 @@
+# Checks for the drag-drop word game's setup (run with: python -m pytest test_drag_drop.py)
+import pytest
+
+pytest.importorskip("mediapipe")  # game_logic builds a HandTracker
+
+from game_logic import FALLBACK_WORDS, DragDropGame  # noqa: E402
+from word_bank import WordBank  # noqa: E402
+
+
+def test_board_layout_of_no_words():
+    game = DragDropGame(board_pairs=12, seed=1)
+    assert game._board_layout(0, 1280, 720) == ([], [])
+
+
+@pytest.mark.parametrize("board_pairs", [None, 12])
+def test_empty_bank_falls_back_to_built_in_words(board_pairs):
+    game = DragDropGame(board_pairs=board_pairs, seed=1)
+    game.words = WordBank.from_entries([])
+    game.setup_game(1280, 720)
+    assert len(game.word_boxes) == len(FALLBACK_WORDS)
+    assert {box['word']['english'] for box in game.word_boxes} == {w['english'] for w in FALLBACK_WORDS}
+
+
+def test_unmatched_filters_use_the_whole_bank():
+    game = DragDropGame(board_pairs=12, category="no-such-category", seed=1)
+    game.words = WordBank.from_entries(FALLBACK_WORDS)
+    game.setup_game(800, 600)
+    assert len(game.word_boxes) == len(FALLBACK_WORDS)
@@ -0,0 +1,79 @@
+# Checks for the latest-wins frame mailbox (run with: python -m pytest test_frame_mailbox.py)
+import threading
+
+import numpy as np
+
+from frame_mailbox import FrameMailbox
+
+
+def _frame(value):
+    return np.full((4, 6, 3), value, np.uint8)
+
+
+def test_latest_frame_wins():
+    box = FrameMailbox()
+    assert box.take() is None
+    first, second = _frame(1), _frame(2)
+    box.publish(first)
+    box.publish(second)
+    assert box.take() is second
+    assert box.take() is None
+    assert box.stats() == {"published": 2, "presented": 1, "dropped": 1}
+
+
+def test_put_back_keeps_a_newer_frame():
+    box = FrameMailbox()
+    old = _frame(1)
+    box.publish(old)
+    assert box.take() is old
+    box.put_back(old)
+    assert box.take() is old  # nothing newer arrived, so it is back in the slot
+    newer = _frame(2)
+    box.publish(newer)
+    box.put_back(old)
+    assert box.take() is newer
+    assert box.stats()["dropped"] == 1
+
+
+def test_publish_copy_never_overwrites_a_taken_frame():
+    box = FrameMailbox()
+    source = _frame(0)
+    box.publish_copy(source)
+    held = box.take()
+    assert held is not source
+    for value in range(1, 20):
+        source[:] = value  # the producer reuses its buffer straight away
+        box.publish_copy(source)
+        assert int(held[0, 0, 0]) == 0
+    latest = box.take()
+    assert int(latest[0, 0, 0]) == 19
+    box.release(held)
+    box.release(latest)
+
+
+def test_threaded_counts_add_up():
+    box = FrameMailbox()
+    done = threading.Event()
+    seen = []
+
+    def consume():
+        while not done.is_set() or seen[-1:] != [199]:
+            frame = box.take()
+            if frame is None:
+                continue
+            seen.append(int(frame[0, 0, 0]))
+            box.release(frame)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    source = np.zeros((4, 6, 3), np.uint8)
+    for value in range(200):
+        source[:] = value
+        box.publish_copy(source)
+    done.set()
+    consumer.join(5.0)
+    assert not consumer.is_alive()
+    stats = box.stats()
+    assert stats["published"] == 200
+    assert stats["presented"] + stats["dropped"] == 200
+    assert seen == sorted(seen)  # frames arrive in order and are never torn back to older values
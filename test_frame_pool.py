@@ -0,0 +1,39 @@
+# Checks for the pooled frame buffers (run with: python -m pytest test_frame_pool.py)
+import numpy as np
+
+from frame_pool import FramePool
+
+
+def test_buffers_rotate_through_depth():
+    pool = FramePool(depth=3)
+    shape = (8, 10, 3)
+    first = [pool.get("frame", shape) for _ in range(3)]
+    assert len({id(b) for b in first}) == 3
+    again = [pool.get("frame", shape) for _ in range(3)]
+    assert all(a is b for a, b in zip(again, first))
+    assert pool.get("scratch", shape, depth=1) is pool.get("scratch", shape, depth=1)
+    assert pool.get("frame", (8, 10)) is not first[0]  # a new shape is a new key
+
+
+def test_steady_state_allocates_nothing():
+    pool = FramePool()
+    src = np.arange(6 * 4 * 3, dtype=np.uint8).reshape(6, 4, 3)
+    for _ in range(10):
+        pool.begin_frame()
+        out = pool.copy("frame", src)
+        assert np.array_equal(out, src) and out is not src
+        pool.get("mask", src.shape[:2], depth=1)
+        pool.filled("panel", src.shape, (40, 40, 40))
+    assert pool.allocations == 3 + 1 + 1
+    assert pool.last_frame_allocations == 0
+    assert pool.stats()["buffers"] == 5
+
+
+def test_filled_refills_only_on_a_new_value():
+    pool = FramePool()
+    dark = pool.filled("panel", (2, 2, 3), (10, 20, 30))
+    assert dark[1, 1].tolist() == [10, 20, 30]
+    light = pool.filled("panel", (2, 2, 3), (200, 200, 200))
+    assert light is dark and light[0, 0].tolist() == [200, 200, 200]
+    pool.clear()
+    assert pool.stats()["buffers"] == 0 and pool.bytes == 0
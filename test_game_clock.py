@@ -0,0 +1,53 @@
+# Checks for frame-rate independent game time (run with: python -m pytest test_game_clock.py)
+import pytest
+
+from game_clock import MAX_FRAME_DT, SIM_HZ, GameClock, HoldTimer
+
+
+class FakeTime:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        return self.t
+
+
+@pytest.mark.parametrize("fps", [15, 24, 30, 60])
+def test_steps_per_second_do_not_depend_on_frame_rate(fps):
+    now = FakeTime()
+    clock = GameClock(time_source=now)
+    assert clock.tick() == 0.0 and clock.steps == 0  # the first frame only starts the clock
+    steps = 0
+    for _ in range(fps * 2):
+        now.t += 1.0 / fps
+        clock.tick()
+        steps += clock.steps
+    assert abs(steps - 2 * SIM_HZ) <= 1
+    assert clock.now() == pytest.approx(2.0)
+
+
+def test_a_stall_is_capped():
+    now = FakeTime()
+    clock = GameClock(time_source=now)
+    clock.tick()
+    now.t += 5.0
+    assert clock.tick() == MAX_FRAME_DT
+    now.t -= 1.0  # a clock going backwards never runs game time backwards
+    assert clock.tick() == 0.0
+    assert clock.now() == pytest.approx(MAX_FRAME_DT)
+
+
+def test_hold_timer_fills_and_drains():
+    timer = HoldTimer(1.0)
+    for _ in range(5):
+        timer.hold(0.1)
+    assert timer.progress == pytest.approx(0.5) and not timer.done
+    timer.release(0.1, rate=2.0)
+    assert timer.progress == pytest.approx(0.3)
+    timer.hold(5.0)
+    assert timer.done and timer.progress == 1.0
+    timer.release(10.0)
+    assert timer.held == 0.0
+    timer.hold(0.4)
+    timer.reset()
+    assert timer.progress == 0.0
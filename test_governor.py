@@ -0,0 +1,52 @@
+# Checks for the frame-time quality governor (run with: python -m pytest test_governor.py)
+from governor import QualityGovernor
+
+
+def _governor():
+    gov = QualityGovernor(budget_ms=10.0, window=5, cooldown=5)
+    gov.register("blend", 60)
+    gov.register("tint", 10)
+    gov.register("pulse", 30)
+    return gov
+
+
+def _run(gov, frame_ms, frames):
+    for _ in range(frames):
+        gov.observe(frame_ms)
+
+
+def test_sheds_lowest_priority_first_then_restores_in_reverse():
+    gov = _governor()
+    _run(gov, 20.0, 5)
+    assert gov.shed == ["tint"]
+    _run(gov, 20.0, 5)
+    assert gov.shed == ["tint", "pulse"]
+    assert not gov.enabled("pulse") and gov.enabled("blend")
+    _run(gov, 2.0, 5)
+    assert gov.shed == ["tint"]
+    _run(gov, 2.0, 5)
+    assert gov.tier == 0 and gov.status()["changes"] == 4
+
+
+def test_cooldown_and_dead_band_prevent_flapping():
+    gov = _governor()
+    _run(gov, 20.0, 4)
+    assert gov.tier == 0  # the window is not full yet
+    _run(gov, 20.0, 1)
+    assert gov.tier == 1
+    _run(gov, 20.0, 4)
+    assert gov.tier == 1  # still cooling down
+    gov.reset()
+    gov.set_tier(1)
+    _run(gov, 9.0, 50)  # between budget * restore_ratio and budget * shed_ratio: stays put
+    assert gov.tier == 1 and gov.status()["changes"] == 1
+
+
+def test_set_tier_reset_and_unregistered_effects():
+    gov = _governor()
+    assert gov.enabled("never-registered")
+    gov.set_tier(2)
+    assert gov.shed == ["tint", "pulse"]
+    assert gov.status()["max_tier"] == 3
+    gov.reset()
+    assert gov.tier == 0 and gov.average_ms == 0.0
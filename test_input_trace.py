@@ -0,0 +1,65 @@
+# Checks that an input trace replays to the same game state (run with: python -m pytest test_input_trace.py)
+import json
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("mediapipe")  # the replayed games build a HandTracker
+
+from game_host import GameHost  # noqa: E402
+from governor import QualityGovernor  # noqa: E402
+from input_trace import TRACE_VERSION, TraceReplayer, replay  # noqa: E402
+from presenter import NullPresenter  # noqa: E402
+
+
+def _hand(cx, cy, pinch):
+    points = [[cx + 0.02 * math.cos(i), cy + 0.02 * math.sin(i), 0.0] for i in range(21)]
+    points[8] = [cx, cy - 0.05, 0.0]
+    points[4] = [cx + 0.01, cy - 0.05, 0.0] if pinch else [cx + 0.12, cy, 0.0]
+    return points
+
+
+def _write_trace(path, frames=150):
+    """A hand sweeping the play area and pinching, at an uneven frame rate"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({"version": TRACE_VERSION, "game": "mosquito_waves", "seed": 42,
+                            "capture_size": [640, 480], "frame_width": None}) + "\n")
+        t = 10.0
+        for i in range(frames):
+            t += 1 / 30 if i % 7 else 1 / 12
+            hand = _hand(0.5 + 0.35 * math.sin(i / 9), 0.5 + 0.3 * math.cos(i / 13), pinch=i % 6 < 3)
+            f.write(json.dumps({"t": round(t, 5), "hands": [hand]}) + "\n")
+    return str(path)
+
+
+def _play(path):
+    replayer = TraceReplayer(path)
+    game = replayer.create_game()
+    host = GameHost(game, governor=QualityGovernor(budget_ms=float('inf')))
+    host.run(replayer, NullPresenter(target_size=(640, 480)), max_frames=len(replayer))
+    return game
+
+
+def test_same_trace_same_game_state(tmp_path):
+    path = _write_trace(tmp_path / "sweep.trace")
+    first, second = _play(path), _play(path)
+    assert first.clock.frames == second.clock.frames == 150
+    assert first.clock.now() == second.clock.now()
+    assert first.kill_count == second.kill_count > 0
+    assert np.array_equal(first.swarm.alive, second.swarm.alive)
+    assert np.array_equal(first.swarm.pos, second.swarm.pos)
+
+
+def test_replay_reports_the_same_score(tmp_path):
+    path = _write_trace(tmp_path / "sweep.trace")
+    scores = {replay(path, size=(640, 480))["score"] for _ in range(2)}
+    assert len(scores) == 1 and None not in scores
+
+
+def test_pixel_games_need_recorded_frames(tmp_path):
+    path = tmp_path / "color.trace"
+    path.write_text(json.dumps({"version": TRACE_VERSION, "game": "color", "seed": 1}) + "\n"
+                    + json.dumps({"t": 1.0, "hands": []}) + "\n", encoding='utf-8')
+    with pytest.raises(ValueError):
+        TraceReplayer(str(path)).create_game()
@@ -0,0 +1,47 @@
+# Checks for the array-backed mosquito swarm (run with: python -m pytest test_mosquito_swarm.py)
+import numpy as np
+
+from mosquito_swarm import DIFFICULTY_LEVELS, MosquitoSwarm
+
+BOUNDS = (50.0, 100.0, 750.0, 550.0)
+
+
+def _swarm(count=200, seed=3):
+    swarm = MosquitoSwarm(rng=np.random.default_rng(seed))
+    level = DIFFICULTY_LEVELS["hard"]
+    swarm.spawn(count, BOUNDS, level["speed"], level["jitter"])
+    return swarm
+
+
+def test_stays_in_bounds_and_under_max_speed():
+    swarm = _swarm()
+    for _ in range(300):
+        swarm.step()
+    x0, y0, x1, y1 = BOUNDS
+    assert ((swarm.pos[:, 0] >= x0) & (swarm.pos[:, 0] <= x1)).all()
+    assert ((swarm.pos[:, 1] >= y0) & (swarm.pos[:, 1] <= y1)).all()
+    assert (np.hypot(swarm.vel[:, 0], swarm.vel[:, 1]) <= swarm.max_speed + 1e-3).all()
+
+
+def test_same_seed_same_flight():
+    a, b = _swarm(seed=11), _swarm(seed=11)
+    for _ in range(50):
+        a.step()
+        b.step()
+    assert np.array_equal(a.pos, b.pos)
+
+
+def test_each_point_kills_at_most_the_nearest_live_mosquito():
+    swarm = MosquitoSwarm(rng=np.random.default_rng(0))
+    swarm.spawn(3, BOUNDS, 1.0, 0.0)
+    swarm.pos[:] = [[100, 200], [110, 200], [400, 400]]
+    killed = swarm.hit(np.array([[104, 200], [106, 200]]), radius=20)
+    assert sorted(killed.tolist()) == [0, 1]  # both points near the pair, one kill each
+    assert swarm.alive_count == 1
+    assert swarm.hit(np.array([[100, 200]]), radius=20).size == 0  # the dead stay dead
+    assert swarm.live_positions().tolist() == [[400, 400]]
+
+    frozen = swarm.pos[0].copy()
+    swarm.step()
+    assert np.array_equal(swarm.pos[0], frozen)  # dead mosquitoes no longer move
+    assert swarm.hit(np.zeros((0, 2)), radius=20).size == 0
@@ -0,0 +1,50 @@
+# Checks for the uniform-grid hit-testing index (run with: python -m pytest test_spatial_index.py)
+import math
+import random
+
+from spatial_index import UniformGrid
+
+
+def _board(rng, count=60):
+    rects = {}
+    for i in range(count):
+        rects[i] = (rng.randrange(0, 1200), rng.randrange(0, 700), rng.randrange(20, 160), rng.randrange(20, 80))
+    return rects
+
+
+def test_point_and_nearest_match_a_linear_scan():
+    rng = random.Random(7)
+    rects = _board(rng)
+    grid = UniformGrid(100)
+    for item_id, rect in rects.items():
+        grid.insert(item_id, rect)
+    assert len(grid) == len(rects)
+
+    for _ in range(500):
+        x, y = rng.randrange(-50, 1400), rng.randrange(-50, 850)
+        hit = grid.query_point(x, y)
+        inside = {i for i, (rx, ry, rw, rh) in rects.items() if rx <= x <= rx + rw and ry <= y <= ry + rh}
+        assert hit in inside if inside else hit is None
+
+        best_id, best_dist = grid.nearest(x, y, 150)
+        dists = {i: math.hypot(x - (rx + rw // 2), y - (ry + rh // 2)) for i, (rx, ry, rw, rh) in rects.items()}
+        in_reach = [d for d in dists.values() if d <= 150]
+        if in_reach:
+            assert best_dist == min(in_reach) and dists[best_id] == best_dist
+        else:
+            assert (best_id, best_dist) == (None, float('inf'))
+
+
+def test_remove_and_reinsert():
+    grid = UniformGrid(50)
+    grid.insert("a", (0, 0, 120, 40))
+    grid.insert("b", (200, 0, 40, 40))
+    assert grid.query_point(100, 20) == "a"
+    grid.insert("a", (300, 300, 40, 40))  # moving an id drops its old cells
+    assert grid.query_point(100, 20) is None
+    assert grid.query_point(310, 310) == "a"
+    grid.remove("a")
+    grid.remove("missing")
+    assert len(grid) == 1 and grid.nearest(310, 310, 20) == (None, float('inf'))
+    grid.clear()
+    assert len(grid) == 0 and not grid.cells
@@ -0,0 +1,107 @@
+# Checks for the background speech worker with the silent backend (run with: python -m pytest test_speech.py)
+import threading
+import time
+
+import pytest
+
+from speech import NullSpeechBackend, SpeechWorker
+
+
+class GatedBackend(NullSpeechBackend):
+    """Null backend whose say() waits for the gate, so tests can queue phrases behind it"""
+
+    def __init__(self, gate):
+        super().__init__()
+        self.gate = gate
+        self.busy = threading.Event()
+
+    def say(self, text):
+        self.busy.set()
+        self.gate.wait(5.0)
+        super().say(text)
+
+
+@pytest.fixture
+def gated():
+    """A started worker blocked inside its first phrase ("first"); yields (worker, gate)"""
+    gate = threading.Event()
+    backends = []
+
+    def factory():
+        backends.append(GatedBackend(gate))
+        return backends[0]
+
+    def start(**kwargs):
+        worker = SpeechWorker(backend_factory=factory, **kwargs).start()
+        worker.speak("first")
+        for _ in range(500):
+            if backends and backends[0].busy.is_set():
+                break
+            time.sleep(0.01)
+        assert backends and backends[0].busy.is_set()
+        workers.append(worker)
+        return worker, gate
+
+    workers = []
+    yield start
+    gate.set()
+    for worker in workers:
+        worker.stop()
+
+
+def test_pending_duplicates_are_spoken_once(gated):
+    worker, gate = gated(max_queue=8)
+    for text in ("a", "b", "a", "b", "a"):
+        worker.speak(text)
+    gate.set()
+    assert worker.wait_idle()
+    assert worker.backend.spoken == ["first", "a", "b"]
+
+
+def test_stale_phrases_coalesce_to_the_newest(gated):
+    worker, gate = gated(max_age=0.05)
+    for text in ("one", "two", "three"):
+        worker.speak(text)
+    time.sleep(0.15)
+    gate.set()
+    assert worker.wait_idle()
+    assert worker.backend.spoken == ["first", "three"]
+    assert worker.dropped == 2
+
+
+def test_full_queue_drops_the_oldest(gated):
+    worker, gate = gated(max_queue=2)
+    for text in ("p1", "p2", "p3", "p4", "p5"):
+        worker.speak(text)
+    assert worker.dropped == 3
+    gate.set()
+    assert worker.wait_idle()
+    assert worker.backend.spoken == ["first", "p4", "p5"]
+
+
+def test_repeat_within_window_is_skipped(gated):
+    worker, gate = gated(repeat_window=10.0)
+    gate.set()
+    assert worker.wait_idle()
+    worker.speak("first")
+    assert worker.wait_idle()
+    assert worker.backend.spoken == ["first"]
+
+
+def test_speak_never_blocks(gated):
+    worker, gate = gated(max_queue=4)
+    start = time.perf_counter()
+    for i in range(1000):
+        worker.speak(f"phrase {i}")
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.5  # the backend is still stuck inside "first"
+    assert worker.queue.qsize() <= 4
+    gate.set()
+    assert worker.wait_idle()
+
+
+def test_empty_text_is_ignored():
+    worker = SpeechWorker(backend_factory=NullSpeechBackend)  # not started: nothing may reach the queue
+    worker.speak("")
+    worker.speak(None)
+    assert worker.queue.empty()
@@ -0,0 +1,33 @@
+# Checks for the two-player split-screen host (run with: python -m pytest test_split_screen.py)
+import numpy as np
+import pytest
+
+pytest.importorskip("mediapipe")  # each player's game builds a HandTracker
+
+from game_logic import FingerCountGame  # noqa: E402
+from split_screen import SplitScreenHost  # noqa: E402
+from stage_timers import TIMERS  # noqa: E402
+
+
+@pytest.fixture
+def host():
+    split = SplitScreenHost([FingerCountGame(seed=1), FingerCountGame(seed=1)], frame_alpha=1.0)
+    yield split
+    split.close()
+
+
+def test_halves_are_composited_side_by_side(host):
+    frame = host.process_frame(np.full((360, 1280, 3), 90, np.uint8))
+    assert frame.shape == (360, 1280, 3)
+    assert host.render_size == (1280, 360)
+    assert all(player.render_size == (640, 360) for player in host.players)
+    assert all(player.governor is host.governor for player in host.players)
+
+
+@pytest.mark.parametrize("hud", [False, True])
+def test_hud_is_drawn_once_on_the_whole_frame(host, monkeypatch, hud):
+    drawn = []
+    monkeypatch.setattr(TIMERS, "hud", hud)
+    monkeypatch.setattr(TIMERS, "draw_hud", lambda img: drawn.append(img.shape))
+    host.process_frame(np.full((360, 1280, 3), 90, np.uint8))
+    assert drawn == ([(360, 1280, 3)] if hud else [])
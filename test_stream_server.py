@@ -0,0 +1,104 @@
+# Checks for the localhost frame/landmark stream over loopback (run with: python -m pytest test_stream_server.py)
+import threading
+import time
+import types
+import urllib.error
+from urllib.request import urlopen
+
+import cv2
+import numpy as np
+import pytest
+
+from stream_server import MSG_EVENT, MSG_LANDMARKS, LANDMARKS_PER_HAND, StreamServer, read_message
+from telemetry import TelemetryWriter, set_telemetry
+
+
+@pytest.fixture
+def server():
+    set_telemetry(TelemetryWriter(enabled=False))
+    stream = StreamServer(port=0).start()
+    yield stream
+    stream.stop()
+    set_telemetry(None)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def _hand(offset):
+    return [[offset + i / 100, 0.5 - i / 100, -i / 1000] for i in range(LANDMARKS_PER_HAND)]
+
+
+def test_frame_snapshot(server):
+    frame = np.zeros((48, 64, 3), np.uint8)
+    frame[:, :32] = (0, 0, 255)
+    server.publish_frame(frame)
+    assert server.frames_encoded == 0  # nobody asked for a frame yet, so nothing is encoded
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urlopen(server.url + "frame.jpg", timeout=5)  # opens the snapshot window
+    assert error.value.code == 503
+    server.publish_frame(frame)
+    _wait_for(lambda: server.frames_encoded == 1)
+
+    with urlopen(server.url + "frame.jpg", timeout=5) as response:
+        assert response.headers["Content-Type"] == "image/jpeg"
+        img = cv2.imdecode(np.frombuffer(response.read(), np.uint8), cv2.IMREAD_COLOR)
+    assert img.shape == frame.shape
+    assert img[24, 8, 2] > 200 and img[24, 56, 2] < 50
+
+
+def test_landmarks_and_events_round_trip(server):
+    server.publish_landmarks([_hand(0.1)])  # dropped: no listener yet
+    with urlopen(server.url + "events", timeout=5) as stream:
+        _wait_for(lambda: server.listeners == 1)
+        hands = [_hand(0.1), _hand(0.3)]
+        server.publish_landmarks(hands, player=1, t=12.5)
+        server.publish_event({"event": "score", "scores": [3]})
+
+        kind, seq, t, (player, points) = read_message(stream)
+        assert (kind, seq, t, player) == (MSG_LANDMARKS, 1, 12.5, 1)
+        assert points.shape == (2, LANDMARKS_PER_HAND, 3)
+        assert np.allclose(points, hands, atol=1e-3)
+        assert read_message(stream)[::3] == (MSG_EVENT, {"event": "score", "scores": [3]})
+
+
+def test_tap_packs_mediapipe_hands_only_for_listeners(server):
+    class Tracker:
+        reads = 0
+
+        @property
+        def results(self):
+            Tracker.reads += 1
+            landmarks = [types.SimpleNamespace(landmark=[types.SimpleNamespace(x=x, y=y, z=z) for x, y, z in _hand(0.2)])]
+            return types.SimpleNamespace(multi_hand_landmarks=landmarks)
+
+    presented = []
+    host = types.SimpleNamespace(game=types.SimpleNamespace(hand_tracker=Tracker(), score=0))
+    tap = server.tap(types.SimpleNamespace(present=presented.append), host)
+    frame = np.zeros((8, 8, 3), np.uint8)
+    tap.present(frame)
+    assert presented == [frame] and Tracker.reads == 0  # no /events client: the tracker is never read
+
+    with urlopen(server.url + "events", timeout=5) as stream:
+        _wait_for(lambda: server.listeners == 1)
+        tap.present(frame)
+        kind, _, _, (player, points) = read_message(stream)
+    assert kind == MSG_LANDMARKS and player == 0
+    assert np.allclose(points[0], _hand(0.2), atol=1e-3)
+
+
+def test_stop_ends_clients_and_threads(server):
+    with urlopen(server.url + "events", timeout=5) as stream:
+        _wait_for(lambda: server.listeners == 1)
+        stopper = threading.Thread(target=server.stop)
+        stopper.start()
+        stopper.join(5.0)
+        assert not stopper.is_alive()
+        assert read_message(stream) is None
+    assert not server.running
+    assert not any(thread.is_alive() for thread in server._threads)
@@ -0,0 +1,44 @@
+# Checks for the indexed word bank (run with: python -m pytest test_word_bank.py)
+import json
+import random
+
+from word_bank import WordBank, build_word_bank, open_word_bank
+
+ENTRIES = [
+    {"tamil": "பூ", "english": "flower", "category": "nature", "difficulty": 1},
+    {"tamil": "பால்", "english": "milk", "category": "food", "difficulty": 1},
+    {"tamil": "நீர்", "english": "water", "category": "nature", "difficulty": 2},
+    {"tamil": "மரம்", "english": "tree", "category": "nature", "difficulty": 1},
+]
+
+
+def test_filters_and_lookup():
+    bank = WordBank.from_entries(ENTRIES)
+    assert len(bank) == 4
+    assert sorted(bank.categories()) == ["food", "nature"]
+    assert bank.difficulties() == [1, 2]
+    assert sorted(int(i) for i in bank.ids(category="nature")) == [0, 2, 3]
+    assert sorted(int(i) for i in bank.ids(category="nature", difficulty=1)) == [0, 3]
+    assert len(bank.ids(category="missing")) == 0
+    assert bank.get(1) == {"tamil": "பால்", "english": "milk"}
+    assert list(bank.column("english", limit=2)) == ["flower", "milk"]
+
+
+def test_sample_is_seeded_and_filtered():
+    bank = WordBank.from_entries(ENTRIES)
+    first = bank.sample(2, category="nature", rng=random.Random(3))
+    again = bank.sample(2, category="nature", rng=random.Random(3))
+    assert first == again
+    assert all(word["english"] in ("flower", "water", "tree") for word in first)
+    assert bank.sample(5, category="food") == [{"tamil": "பால்", "english": "milk"}]
+
+
+def test_close_with_ids_still_referenced(tmp_path):
+    source = tmp_path / "words.json"
+    source.write_text(json.dumps({"words": ENTRIES}, ensure_ascii=False), encoding="utf-8")
+    bank_path = str(tmp_path / "words.bank")
+    build_word_bank(str(source), bank_path)
+    bank = open_word_bank(bank_path)
+    kept = [bank.ids(category="nature"), bank.ids(difficulty=1), bank.ids(category="nature", difficulty=1)]
+    bank.close()  # must not raise BufferError while the ids above are alive
+    assert sorted(int(i) for i in kept[0]) == [0, 2, 3]
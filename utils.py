@@ -3,73 +3,156 @@ from PIL import ImageFont, ImageDraw, Image
 import numpy as np
 import cv2
 import os
+import threading
+from stage_timers import TIMERS
+from telemetry import get_telemetry
+
+# Tamil-supporting fonts in order of preference
+TAMIL_FONT_PATHS = [
+    "assets/fonts/Latha.ttf",  # Local Tamil font (already exists!)
+    "C:/Windows/Fonts/LATHA.TTF",  # System Tamil font on Windows
+    "C:/Windows/Fonts/Mangal.ttf",  # Another Tamil font
+    "C:/Windows/Fonts/arial.ttf",
+]
+
+# Rasterized text masks kept per process: (text, font_size) -> (mask, (dx, dy))
+TEXT_MASK_CACHE_SIZE = 512
+_fonts = {}
+_text_masks = {}
+_text_masks_lock = threading.Lock()
+
+def find_tamil_font_path():
+    for font_path in TAMIL_FONT_PATHS:
+        if os.path.exists(font_path):
+            return font_path
+    return None
+
+def get_tamil_font(font_size):
+    """Load (once) the preferred Tamil font at font_size"""
+    font = _fonts.get(font_size)
+    if font is None:
+        font_path = find_tamil_font_path()
+        if font_path is not None:
+            try:
+                font = ImageFont.truetype(font_path, font_size)
+            except OSError:
+                font = None
+        if font is None:
+            font = ImageFont.load_default()
+        _fonts[font_size] = font
+    return font
+
+def render_text_mask(text, font_size):
+    """Rasterize text to a coverage mask.
+    Returns (mask uint8 HxW, (dx, dy)): the mask's offset from the draw position."""
+    font = get_tamil_font(font_size)
+    left, top, right, bottom = font.getbbox(text)
+    w, h = max(1, right - left), max(1, bottom - top)
+    mask_img = Image.new('L', (w, h), 0)
+    ImageDraw.Draw(mask_img).text((-left, -top), text, font=font, fill=255)
+    return np.asarray(mask_img, dtype=np.uint8), (left, top)
+
+def get_text_mask(text, font_size):
+    """Text mask from the asset bundle, else rasterized once and cached"""
+    key = (text, font_size)
+    sprite = _text_masks.get(key)
+    if sprite is None:
+        # Split-screen players draw from two threads; PIL fonts are not shared between renders
+        with _text_masks_lock:
+            sprite = _text_masks.get(key)
+            if sprite is None:
+                from asset_bundle import get_bundle
+                bundle = get_bundle()
+                sprite = bundle.text_mask(text, font_size) if bundle is not None else None
+                if sprite is None:
+                    sprite = render_text_mask(text, font_size)
+                if len(_text_masks) >= TEXT_MASK_CACHE_SIZE:
+                    _text_masks.clear()
+                _text_masks[key] = sprite
+    return sprite
+
+def blit_mask(img, mask, x, y, color):
+    """Blend a solid BGR color into img through a coverage mask at (x, y), clipped to img"""
+    mh, mw = mask.shape[:2]
+    ih, iw = img.shape[:2]
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(iw, x + mw), min(ih, y + mh)
+    if x0 >= x1 or y0 >= y1:
+        return
+    m = mask[y0 - y:y1 - y, x0 - x:x1 - x, None].astype(np.uint16)
+    roi = img[y0:y1, x0:x1]
+    col = np.asarray(color, dtype=np.uint16)
+    roi[:] = ((roi * (255 - m) + col * m + 127) // 255).astype(np.uint8)
 
 def draw_tamil_text(img, text, position=(50, 50), font_size=40, color=(255, 255, 255)):
     """
-    Draw Tamil text on OpenCV image using PIL for proper Unicode support
-    Returns the modified image with Tamil text drawn
+    Draw Tamil text on OpenCV image (in place) with proper Unicode support.
+    Glyphs come from pre-rendered masks, so only the text's own area is touched.
+    Returns img for convenience.
     """
     try:
-        # Convert OpenCV image (BGR) to PIL Image (RGB)
-        img_pil = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-        
-        # Try Tamil-supporting fonts in order of preference
-        font_paths = [
-            "assets/fonts/Latha.ttf",  # Local Tamil font (already exists!)
-            "C:/Windows/Fonts/LATHA.TTF",  # System Tamil font on Windows
-            "C:/Windows/Fonts/Mangal.ttf",  # Another Tamil font
-            "C:/Windows/Fonts/arial.ttf",
-        ]
-        
-        font = None
-        for font_path in font_paths:
-            try:
-                if os.path.exists(font_path):
-                    font = ImageFont.truetype(font_path, font_size)
-                    break
-            except:
-                continue
-        
-        if font is None:
-            font = ImageFont.load_default()
-        
-        draw = ImageDraw.Draw(img_pil)
-        # Convert BGR color to RGB for PIL
-        rgb_color = (color[2], color[1], color[0])
-        draw.text(position, text, font=font, fill=rgb_color)
-        
-        # Convert back to OpenCV image (BGR)
-        img_result = cv2.cvtColor(np.array(img_pil), cv2.COLOR_RGB2BGR)
-        return img_result
+        mask, (dx, dy) = get_text_mask(text, int(font_size))
+        blit_mask(img, mask, int(position[0]) + dx, int(position[1]) + dy, color)
+        return img
         
     except Exception as e:
-        print(f"Error drawing Tamil text: {e}")
+        get_telemetry().error("draw_tamil_text", e)  # rate-limited: this runs every frame
         # Fallback to OpenCV text
         cv2.putText(img, text, position, cv2.FONT_HERSHEY_SIMPLEX, font_size/30, color, 2, cv2.LINE_AA)
         return img
 
-def draw_text(img, text, pos, color=(255,255,255), scale=1, thickness=2):
+# Games lay out their UI for this frame size; other render sizes scale the layout
+LAYOUT_SIZE = (800, 600)
+
+def layout_scale(width, height):
+    """UI scale factor for a render target of width x height"""
+    return max(0.5, min(width / float(LAYOUT_SIZE[0]), height / float(LAYOUT_SIZE[1])))
+
+def px(value, scale):
+    """Scale a layout length (in 800x600 pixels) to the render target"""
+    return int(round(value * scale))
+
+def letterbox_geometry(img_w, img_h, canvas_w, canvas_h):
+    """Fit an image inside a canvas keeping aspect ratio.
+    Returns (new_w, new_h, x_offset, y_offset)."""
+    img_aspect = img_w / float(img_h)
+    canvas_aspect = canvas_w / float(canvas_h)
+    if img_aspect > canvas_aspect:
+        # Image is wider, fit to width
+        new_w = canvas_w
+        new_h = max(1, int(canvas_w / img_aspect))
+    else:
+        # Image is taller, fit to height
+        new_h = canvas_h
+        new_w = max(1, int(canvas_h * img_aspect))
+    return new_w, new_h, (canvas_w - new_w) // 2, (canvas_h - new_h) // 2
+
+def draw_text(img, text, pos, color=(255,255,255), scale=1, thickness=2, ui_scale=1.0):
     """
-    Enhanced text drawing function that automatically handles Tamil text
+    Enhanced text drawing function that automatically handles Tamil text.
+    scale/thickness are in 800x600 layout units; ui_scale maps them to the render target.
     """
+    if ui_scale != 1.0:
+        scale = scale * ui_scale
+        thickness = max(1, px(thickness, ui_scale))
     font_size = max(12, int(scale * 30))
     
     # Check if text contains Tamil characters (Unicode range for Tamil: U+0B80-U+0BFF)
     has_tamil = any('\u0b80' <= char <= '\u0bff' for char in text)
     
-    if has_tamil:
-        # Use Tamil-specific rendering
-        img[:] = draw_tamil_text(img, text, pos, font_size, color)[:]
-    else:
-        # Use regular OpenCV text for English/numbers
-        cv2.putText(img, text, pos, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness, cv2.LINE_AA)
+    with TIMERS.stage("draw_text"):
+        if has_tamil:
+            # Use Tamil-specific rendering
+            draw_tamil_text(img, text, pos, font_size, color)
+        else:
+            # Use regular OpenCV text for English/numbers
+            cv2.putText(img, text, pos, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness, cv2.LINE_AA)
 
 def calculate_distance(p1, p2):
     import math
     return math.hypot(p2[0]-p1[0], p2[1]-p1[1])
 
 def play_sound(text):
-    import pyttsx3
-    engine = pyttsx3.init()
-    engine.say(text)
-    engine.runAndWait()
+    """Speak text without blocking the caller (queued on the shared speech worker)"""
+    from speech import speak
+    speak(text)
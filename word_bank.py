@@ -0,0 +1,257 @@
+# Indexed, memory-mapped word bank (built from assets/words.json)
+import json
+import mmap
+import os
+import random
+import struct
+import threading
+import numpy as np
+
+WORDS_JSON = os.path.join("assets", "words.json")
+WORDS_BANK = os.path.join("assets", "cache", "words.bank")
+
+MAGIC = b"TGWB"
+VERSION = 1
+# magic, version, field count, entry count, meta length
+HEADER = struct.Struct("<4sHHII")
+
+DEFAULT_CATEGORY = "general"
+DEFAULT_DIFFICULTY = 1
+# Entry keys that are index attributes rather than text fields
+INDEX_KEYS = ("category", "difficulty")
+
+
+class WordBankError(Exception):
+    pass
+
+
+def _align4(n):
+    return (n + 3) & ~3
+
+
+def build_bank_bytes(entries):
+    """Serialize word entries (dicts of script -> text) into the bank format.
+
+    Layout after the header:
+      meta      small JSON: text field names and posting-list ranges
+      postings  uint32 entry ids, grouped per category and per difficulty
+      records   uint32 (offset, length) per entry per field, into the blob
+      blob      UTF-8 text of every field, back to back
+    """
+    fields = []
+    for entry in entries:
+        for key in entry:
+            if key not in INDEX_KEYS and key not in fields:
+                fields.append(key)
+
+    by_category, by_difficulty = {}, {}
+    records = np.zeros((len(entries), len(fields), 2), dtype='<u4')
+    blob = bytearray()
+    for i, entry in enumerate(entries):
+        by_category.setdefault(str(entry.get('category', DEFAULT_CATEGORY)), []).append(i)
+        by_difficulty.setdefault(str(entry.get('difficulty', DEFAULT_DIFFICULTY)), []).append(i)
+        for j, field in enumerate(fields):
+            data = str(entry.get(field, "")).encode('utf-8')
+            records[i, j] = (len(blob), len(data))
+            blob += data
+
+    postings = []
+    meta = {"fields": fields, "postings": {"category": {}, "difficulty": {}}}
+    for kind, groups in (("category", by_category), ("difficulty", by_difficulty)):
+        for name in sorted(groups):
+            meta["postings"][kind][name] = [len(postings), len(groups[name])]
+            postings.extend(groups[name])
+
+    meta_bytes = json.dumps(meta, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    meta_bytes += b" " * (_align4(HEADER.size + len(meta_bytes)) - HEADER.size - len(meta_bytes))
+    header = HEADER.pack(MAGIC, VERSION, len(fields), len(entries), len(meta_bytes))
+    return b"".join([header, meta_bytes, np.asarray(postings, dtype='<u4').tobytes(),
+                     records.tobytes(), bytes(blob)])
+
+
+class WordBank:
+    """Read-only view over a serialized word bank.
+
+    Only the small meta block is parsed on open; postings and records are
+    numpy views straight into the buffer (an mmap for on-disk banks) and an
+    entry's text is decoded only when that entry is requested. Nothing handed
+    out is a view into the buffer, so close() works whatever callers keep.
+    """
+
+    def __init__(self, buffer, path=None):
+        self.path = path
+        self._buffer = buffer
+        if len(buffer) < HEADER.size:
+            raise WordBankError("word bank is truncated")
+        magic, version, n_fields, n_entries, meta_len = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise WordBankError(f"not a version {VERSION} word bank")
+        offset = HEADER.size
+        meta = json.loads(bytes(buffer[offset:offset + meta_len]).decode('utf-8'))
+        offset += meta_len
+        self.fields = meta["fields"]
+        self._postings_index = meta["postings"]
+        n_postings = sum(count for groups in self._postings_index.values() for _, count in groups.values())
+
+        self._postings = np.frombuffer(buffer, dtype='<u4', count=n_postings, offset=offset)
+        offset += 4 * n_postings
+        self._records = np.frombuffer(buffer, dtype='<u4', count=n_entries * n_fields * 2,
+                                      offset=offset).reshape(n_entries, n_fields, 2)
+        self._blob_offset = offset + self._records.nbytes
+        self._field_index = {name: j for j, name in enumerate(self.fields)}
+
+    @classmethod
+    def from_entries(cls, entries):
+        """In-memory bank, e.g. for a fallback word list"""
+        return cls(build_bank_bytes(entries))
+
+    def __len__(self):
+        return self._records.shape[0]
+
+    def categories(self):
+        return list(self._postings_index["category"])
+
+    def difficulties(self):
+        return sorted(int(d) for d in self._postings_index["difficulty"])
+
+    def _posting(self, kind, name):
+        start, count = self._postings_index[kind].get(str(name), (0, 0))
+        # A copy: a view would pin the mmap, and close() would raise BufferError
+        return self._postings[start:start + count].copy()
+
+    def ids(self, category=None, difficulty=None):
+        """Entry ids matching the filters (all entries if none given)"""
+        result = None
+        if category is not None:
+            result = self._posting("category", category)
+        if difficulty is not None:
+            diff = self._posting("difficulty", difficulty)
+            result = diff if result is None else np.intersect1d(result, diff, assume_unique=True)
+        if result is None:
+            return np.arange(len(self), dtype=np.uint32)
+        return result
+
+    def text(self, entry_id, field):
+        off, length = self._records[entry_id, self._field_index[field]]
+        start = self._blob_offset + int(off)
+        return bytes(self._buffer[start:start + int(length)]).decode('utf-8')
+
+    def get(self, entry_id):
+        """One entry as a dict of field -> text"""
+        return {field: self.text(entry_id, field) for field in self.fields}
+
+    def sample(self, k, category=None, difficulty=None, rng=random):
+        """k random distinct entries matching the filters (fewer if not enough match)"""
+        candidates = self.ids(category, difficulty)
+        picks = rng.sample(range(len(candidates)), min(k, len(candidates)))
+        return [self.get(int(candidates[i])) for i in picks]
+
+    def column(self, field, limit=None):
+        """Yield one field of each entry, in bank order"""
+        n = len(self) if limit is None else min(limit, len(self))
+        for i in range(n):
+            yield self.text(i, field)
+
+    def close(self):
+        self._postings = self._records = None
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+
+
+def read_json_entries(json_path=WORDS_JSON):
+    """Entries from the original JSON schema: {"words": [{"tamil": ..., "english": ...}, ...]}"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    words = data.get('words') if isinstance(data, dict) else data
+    if not isinstance(words, list):
+        raise ValueError(f"{json_path} has no 'words' list")
+    return [w for w in words if isinstance(w, dict)]
+
+
+def build_word_bank(json_path=WORDS_JSON, bank_path=WORDS_BANK):
+    """Import a words JSON file into a bank file; returns the entry count"""
+    entries = read_json_entries(json_path)
+    os.makedirs(os.path.dirname(bank_path) or ".", exist_ok=True)
+    tmp_path = bank_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(build_bank_bytes(entries))
+    os.replace(tmp_path, bank_path)
+    return len(entries)
+
+
+def open_word_bank(bank_path=WORDS_BANK):
+    f = open(bank_path, 'rb')
+    try:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    finally:
+        f.close()
+    try:
+        return WordBank(buffer, path=bank_path)
+    except Exception:
+        buffer.close()
+        raise
+
+
+def load_word_bank(json_path=WORDS_JSON, bank_path=WORDS_BANK):
+    """Open the bank, (re)building it first if the JSON source is newer"""
+    try:
+        json_mtime = os.path.getmtime(json_path)
+    except OSError:
+        json_mtime = None
+    try:
+        stale = json_mtime is not None and os.path.getmtime(bank_path) < json_mtime
+    except OSError:
+        stale = True
+    if stale:
+        if json_mtime is None:
+            raise FileNotFoundError(f"No word bank at {bank_path} and no {json_path} to build it from")
+        count = build_word_bank(json_path, bank_path)
+        print(f"Built word bank {bank_path} ({count} words)")
+    try:
+        return open_word_bank(bank_path)
+    except WordBankError:
+        if json_mtime is None:
+            raise
+        build_word_bank(json_path, bank_path)
+        return open_word_bank(bank_path)
+
+
+_bank = None
+_bank_lock = threading.Lock()
+
+
+def get_word_bank():
+    """The process-wide word bank, loaded (and rebuilt if stale) on first use.
+
+    Games share it rather than each mapping the file: on Windows an open map
+    would block the os.replace that rebuilds a stale bank.
+    """
+    global _bank
+    with _bank_lock:
+        if _bank is None:
+            _bank = load_word_bank()
+        return _bank
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Build or inspect the word bank")
+    parser.add_argument("command", choices=("build", "info"))
+    parser.add_argument("--json", default=WORDS_JSON)
+    parser.add_argument("--bank", default=WORDS_BANK)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_word_bank(args.json, args.bank)
+        print(f"Wrote {args.bank}: {count} words")
+    bank = open_word_bank(args.bank)
+    print(f"{args.bank}: {len(bank)} words, fields {bank.fields}")
+    for category in bank.categories():
+        print(f"  {category}: {len(bank.ids(category=category))}")
+    print(f"  difficulties: {bank.difficulties()}")
+    bank.close()
+
+
+if __name__ == "__main__":
+    main()